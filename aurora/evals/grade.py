@@ -2,104 +2,331 @@
 
 Run:
     python aurora/evals/grade.py aurora-workspace/iteration-1
+    python aurora/evals/grade.py aurora-workspace/iteration-1 --jobs 8
+    python aurora/evals/grade.py aurora-workspace/iteration-1 --no-cache
 
 Reads evals.json + the iteration directory, runs each assertion against
 the saved response.md / project/* files, writes grading.json per run.
+
+Each run's files are listed once into a RunFiles index and read at most
+once, lazily (memory-mapped above MMAP_THRESHOLD); every assertion of the
+run is answered from that index. Runs are graded in a process pool
+(--jobs, default one worker per CPU). grading.json doubles as the run's
+cache: it records a hash of the outputs and of the eval's assertions, and
+a run whose hashes still match is not graded again.
+
+Assertion patterns are compiled once per evals.json load (load_evals).
+An eval's full-text patterns are searched for together in one scan of
+the run's text where re allows it (see PatternSet); evidence is still
+reported per pattern.
 """
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import mmap
+import os
 import re
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 EVALS_FILE = REPO_ROOT / "aurora" / "evals" / "evals.json"
 
+# Bump when grading semantics change, so cached grading.json files are redone.
+GRADER_VERSION = "2"
+# Files at least this big are hashed and decoded through mmap instead of
+# being read into a bytes object first.
+MMAP_THRESHOLD = 1 << 20
+
 
 def find_files(base: Path, pattern: str) -> list[Path]:
     """Return files matching pattern under base. Supports *.yaml glob and exact names."""
     if not base.exists():
         return []
-    if "*" in pattern:
-        return list(base.rglob(pattern))
-    matches = list(base.rglob(pattern))
-    return matches
+    return list(base.rglob(pattern))
+
+
+def _decode(data) -> str:
+    """Bytes or an mmap to text, the way read_text(errors="replace") reads it."""
+    text = str(data, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class RunFiles:
+    """The outputs of one run: response.md plus everything under project/.
+
+    The tree is listed once; file contents are read once, on first use,
+    and shared by every assertion (and by the output hash).
+    """
+
+    def __init__(self, outputs: Path):
+        self.outputs = outputs
+        self.project = outputs / "project"
+        self.entries: list[tuple[PurePosixPath, Path]] = []
+        if self.project.exists():
+            self.entries = [(PurePosixPath(p.relative_to(self.project).as_posix()), p)
+                            for p in self.project.rglob("*")]
+        self.files = [p for _, p in self.entries if p.is_file()]
+        self._raw: dict[Path, bytes | None] = {}
+        self._text: dict[Path, str | None] = {}
+        self._full_text: str | None = None
+
+    def raw(self, path: Path) -> bytes | None:
+        """File bytes, or None for an unreadable file or one large enough
+        to be mmapped on demand instead of kept in memory."""
+        if path not in self._raw:
+            try:
+                self._raw[path] = path.read_bytes() if path.stat().st_size < MMAP_THRESHOLD else None
+            except OSError:
+                self._raw[path] = None
+        return self._raw[path]
+
+    def _mapped(self, path: Path, use):
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return use(b"")
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return use(mm)
+
+    def text(self, path: Path) -> str | None:
+        """Decoded file text, or None when the file cannot be read."""
+        if path not in self._text:
+            data = self._raw.pop(path, None) if path in self._raw else self.raw(path)
+            self._raw.pop(path, None)
+            try:
+                self._text[path] = _decode(data) if data is not None else self._mapped(path, _decode)
+            except OSError:
+                self._text[path] = None
+        return self._text[path]
+
+    def full_text(self) -> str:
+        """response.md + all project files, joined as gather_text() joins them."""
+        if self._full_text is None:
+            paths = [self.outputs / "response.md"] if (self.outputs / "response.md").is_file() else []
+            texts = (self.text(p) for p in paths + self.files)
+            self._full_text = "\n".join(t for t in texts if t is not None)
+        return self._full_text
+
+    def find(self, pattern: str) -> list[Path]:
+        """What find_files(project, pattern) returns, from the listing."""
+        if "**" in pattern:
+            return find_files(self.project, pattern)
+        return [p for rel, p in self.entries if rel.match(pattern)]
+
+    def digest(self) -> str:
+        """sha256 over every output file's path and bytes."""
+        h = hashlib.sha256()
+        response = self.outputs / "response.md"
+        named = ([("response.md", response)] if response.is_file() else []) + [
+            (f"project/{p.relative_to(self.project).as_posix()}", p) for p in self.files
+        ]
+        for name, path in sorted(named):
+            h.update(name.encode("utf-8") + b"\0")
+            data = self.raw(path)
+            try:
+                if data is not None:
+                    h.update(data)
+                else:
+                    self._mapped(path, h.update)
+            except OSError:
+                h.update(b"\0unreadable")
+            h.update(b"\0")
+        return h.hexdigest()
 
 
 def gather_text(outputs: Path) -> str:
     """Concatenate response.md + all project files for full-text checks."""
-    parts: list[str] = []
-    response = outputs / "response.md"
-    if response.is_file():
-        parts.append(response.read_text(encoding="utf-8", errors="replace"))
-    project = outputs / "project"
-    if project.exists():
-        for p in project.rglob("*"):
-            if p.is_file():
-                try:
-                    parts.append(p.read_text(encoding="utf-8", errors="replace"))
-                except (OSError, UnicodeDecodeError):
-                    pass
-    return "\n".join(parts)
-
-
-def check_regex_any(text: str, patterns: list[str]) -> tuple[bool, str]:
+    return RunFiles(outputs).full_text()
+
+
+# Pattern text that is safe to splice into a shared alternation with a
+# marker group appended: no flags, no top-level or nested alternation, no
+# backreferences (group numbers shift), led by a plain literal character.
+SPLICEABLE_RE = re.compile(r"^[^.^$*+?{}\[\]\\|()](?![*?{])(?!.*(?:\||\\[1-9]|\(\?P=))", re.DOTALL)
+# re still tests each alternative's first character at every candidate
+# position, so past this many patterns one scan costs more than it saves
+# and the alternation is split.
+ALTERNATION_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=1024)
+def _alternation(groups: tuple[tuple[str, str], ...]) -> re.Pattern:
+    return re.compile("|".join(f"{pattern}(?P<{name}>)" for name, pattern in groups))
+
+
+class PatternSet:
+    """Regex patterns compiled once and searched for together.
+
+    Patterns led by a literal character are joined into one alternation,
+    each followed by an empty named group that marks which one matched, so
+    the text is scanned once for all of them. The marker goes last because
+    re only skips ahead on the alternatives' first characters when every
+    alternative starts with a case-sensitive literal. Each match names a
+    new pattern; it is dropped from the alternation and the scan resumes
+    at the same position, so no text is skipped or scanned twice and the
+    result is exactly what re.search per pattern gives.
+
+    Patterns that cannot keep that fast path (flags, a leading class or
+    group, alternation, backreferences) are each searched on their own:
+    an alternation of them makes re try every branch at every position,
+    which measures several times slower than separate scans. For the same
+    reason the alternation is split every ALTERNATION_SIZE patterns.
+
+    Patterns are (pattern, flags) keys; search() returns the keys found.
+    """
+
+    def __init__(self, keys):
+        self.keys = list(dict.fromkeys(keys))
+        self.groups: dict[str, tuple[str, int]] = {}
+        self.separate: list[tuple[str, int]] = []
+        for i, (pattern, flags) in enumerate(self.keys):
+            compile_pattern(pattern, flags)  # a bad pattern fails here, at load time
+            if flags or not SPLICEABLE_RE.match(pattern):
+                self.separate.append((pattern, flags))
+            else:
+                self.groups[f"p{i}"] = (pattern, flags)
+        names = list(self.groups)
+        self.chunks = [names[i:i + ALTERNATION_SIZE] for i in range(0, len(names), ALTERNATION_SIZE)]
+        try:
+            for chunk in self.chunks:
+                _alternation(tuple((n, self.groups[n][0]) for n in chunk))
+        except re.error:  # e.g. two patterns naming a group the same
+            self.separate.extend(self.groups.values())
+            self.groups, self.chunks = {}, []
+
+    def search(self, text: str) -> set[tuple[str, int]]:
+        found = {key for key in self.separate if compile_pattern(*key).search(text)}
+        for chunk in self.chunks:
+            pending = {name: self.groups[name][0] for name in chunk}
+            pos = 0
+            while pending:
+                m = _alternation(tuple(pending.items())).search(text, pos)
+                if m is None:
+                    break
+                name = m.lastgroup if m.lastgroup in pending else \
+                    next(n for n in pending if m.group(n) is not None)
+                found.add(self.groups[name])
+                del pending[name]
+                # Earlier positions matched none of the pending patterns; at
+                # this one the others never got their turn, so resume here.
+                pos = m.start()
+        return found
+
+
+def _found(text: str, keys: list[tuple[str, int]], found: set | None) -> set:
+    return found if found is not None else PatternSet(keys).search(text)
+
+
+def check_regex_any(text: str, patterns: list[str], found: set | None = None) -> tuple[bool, str]:
+    """found: the (pattern, flags) keys already matched in text by a
+    PatternSet scan covering these patterns; searched here when None."""
+    found = _found(text, [(p, 0) for p in patterns], found)
     for p in patterns:
-        if re.search(p, text):
+        if (p, 0) in found:
             return True, f"matched: {p}"
     return False, f"none of {len(patterns)} patterns matched"
 
 
-def check_regex_all(text: str, patterns: list[str]) -> tuple[bool, str]:
-    missed = [p for p in patterns if not re.search(p, text)]
+def check_regex_all(text: str, patterns: list[str], found: set | None = None) -> tuple[bool, str]:
+    found = _found(text, [(p, 0) for p in patterns], found)
+    missed = [p for p in patterns if (p, 0) not in found]
     if not missed:
         return True, f"all {len(patterns)} patterns matched"
     return False, f"missed: {missed}"
 
 
-def check_negative_regex(text: str, patterns: list[str]) -> tuple[bool, str]:
-    hit = [p for p in patterns if re.search(p, text, re.IGNORECASE)]
+def check_negative_regex(text: str, patterns: list[str], found: set | None = None) -> tuple[bool, str]:
+    found = _found(text, [(p, re.IGNORECASE) for p in patterns], found)
+    hit = [p for p in patterns if (p, re.IGNORECASE) in found]
     if not hit:
         return True, "no forbidden patterns matched"
     return False, f"forbidden pattern(s) found: {hit}"
 
 
-def check_file_regex(outputs: Path, file_pat: str, patterns: list[str]) -> tuple[bool, str]:
-    project = outputs / "project"
-    files = find_files(project, file_pat)
+def _run_files(outputs) -> RunFiles:
+    return outputs if isinstance(outputs, RunFiles) else RunFiles(outputs)
+
+
+def check_file_regex(outputs: Path | RunFiles, file_pat: str, patterns: list[str],
+                     pattern_set: PatternSet | None = None) -> tuple[bool, str]:
+    run = _run_files(outputs)
+    files = run.find(file_pat)
     if not files:
         return False, f"no file matching '{file_pat}' under project/"
-    text = "\n".join(
-        f.read_text(encoding="utf-8", errors="replace") for f in files if f.is_file()
-    )
-    missed = [p for p in patterns if not re.search(p, text)]
+    texts = (run.text(f) for f in files if f.is_file())
+    text = "\n".join(t for t in texts if t is not None)
+    found = (pattern_set or PatternSet((p, 0) for p in patterns)).search(text)
+    missed = [p for p in patterns if (p, 0) not in found]
     if not missed:
         return True, f"all {len(patterns)} patterns matched in {len(files)} file(s)"
     return False, f"in {[str(f.name) for f in files]}, missed: {missed}"
 
 
-def check_file_exists(outputs: Path, file_pat: str) -> tuple[bool, str]:
-    project = outputs / "project"
-    files = find_files(project, file_pat)
+def check_file_exists(outputs: Path | RunFiles, file_pat: str) -> tuple[bool, str]:
+    files = _run_files(outputs).find(file_pat)
     if files:
         return True, f"found: {[str(f.name) for f in files]}"
     return False, f"no file matching '{file_pat}' under project/"
 
 
-def grade_assertion(outputs: Path, full_text: str, a: dict) -> dict:
+TEXT_CHECKS = {"regex_any": 0, "regex_all": 0, "negative_regex": re.IGNORECASE}
+
+
+class CompiledEval:
+    """One eval's assertions with every pattern compiled, built once per
+    evals.json load: a PatternSet over all full-text patterns (scanned
+    once per run) and one per file_regex assertion."""
+
+    def __init__(self, assertions: list[dict]):
+        self.assertions = assertions
+        self.hash = assertions_hash(assertions)
+        self.text_patterns = PatternSet(
+            (p, TEXT_CHECKS[a.get("check", "regex_any")])
+            for a in assertions if a.get("check", "regex_any") in TEXT_CHECKS
+            for p in a.get("patterns", [])
+        )
+        self.file_patterns = [
+            PatternSet((p, 0) for p in a.get("patterns", [])) if a.get("check") == "file_regex" else None
+            for a in assertions
+        ]
+
+    def grade(self, run: RunFiles) -> list[dict]:
+        found = self.text_patterns.search(run.full_text()) if self.text_patterns.keys else set()
+        return [grade_assertion(run, None, a, found, pattern_set)
+                for a, pattern_set in zip(self.assertions, self.file_patterns)]
+
+
+def grade_assertion(outputs: Path | RunFiles, full_text: str | None, a: dict,
+                    found: set | None = None, pattern_set: PatternSet | None = None) -> dict:
+    """Grade one assertion. Pass a RunFiles to share file reads between
+    assertions; full_text may then be None and is built on first use.
+    found and pattern_set are CompiledEval's precomputed scans."""
+    run = _run_files(outputs)
     check = a.get("check", "regex_any")
     patterns = a.get("patterns", [])
+    if check in TEXT_CHECKS and full_text is None and found is None:
+        full_text = run.full_text()
     if check == "regex_any":
-        passed, evidence = check_regex_any(full_text, patterns)
+        passed, evidence = check_regex_any(full_text, patterns, found)
     elif check == "regex_all":
-        passed, evidence = check_regex_all(full_text, patterns)
+        passed, evidence = check_regex_all(full_text, patterns, found)
     elif check == "negative_regex":
-        passed, evidence = check_negative_regex(full_text, patterns)
+        passed, evidence = check_negative_regex(full_text, patterns, found)
     elif check == "file_regex":
-        passed, evidence = check_file_regex(outputs, a["file"], patterns)
+        passed, evidence = check_file_regex(run, a["file"], patterns, pattern_set)
     elif check == "file_exists":
-        passed, evidence = check_file_exists(outputs, a["file"])
+        passed, evidence = check_file_exists(run, a["file"])
     else:
         passed, evidence = False, f"unknown check type: {check}"
     return {
@@ -110,13 +337,69 @@ def grade_assertion(outputs: Path, full_text: str, a: dict) -> dict:
     }
 
 
-def main(iteration_dir: str) -> int:
+def assertions_hash(assertions: list[dict]) -> str:
+    payload = json.dumps([GRADER_VERSION, assertions], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_evals(path: Path = EVALS_FILE) -> tuple[dict, list[CompiledEval]]:
+    """evals.json and a CompiledEval per eval, in file order."""
+    evals = json.loads(path.read_text(encoding="utf-8"))
+    return evals, [CompiledEval(ev["assertions"]) for ev in evals["evals"]]
+
+
+def grade_run(outputs: Path, assertions: list[dict] | CompiledEval,
+              use_cache: bool = True) -> tuple[dict, bool]:
+    """Grade one run and write its grading.json. Returns (grading, cached):
+    with use_cache, a grading.json whose output and assertion hashes match
+    is returned as is."""
+    compiled = assertions if isinstance(assertions, CompiledEval) else CompiledEval(assertions)
+    run = RunFiles(outputs)
+    keys = {"output_hash": run.digest(), "assertions_hash": compiled.hash}
+    grading_path = outputs.parent / "grading.json"
+    if use_cache:
+        try:
+            cached = json.loads(grading_path.read_text(encoding="utf-8"))
+            if all(cached.get(k) == v for k, v in keys.items()):
+                return cached, True
+        except (OSError, ValueError, AttributeError):
+            pass
+    results = compiled.grade(run)
+    passed = sum(1 for r in results if r["passed"])
+    total = len(results)
+    grading = {
+        "pass_count": passed,
+        "total": total,
+        "pass_rate": passed / total if total else 0,
+        "assertions": results,
+        **keys,
+    }
+    grading_path.write_text(json.dumps(grading, indent=2, ensure_ascii=False), encoding="utf-8")
+    return grading, False
+
+
+# The compiled evals, handed to each pool worker once rather than per run.
+_compiled: list[CompiledEval] = []
+
+
+def _init_worker(compiled: list[CompiledEval]) -> None:
+    global _compiled
+    _compiled = compiled
+
+
+def _grade_job(job):
+    outputs, index, use_cache = job
+    return grade_run(outputs, _compiled[index], use_cache)
+
+
+def main(iteration_dir: str, jobs: int = 0, use_cache: bool = True) -> int:
     iteration = Path(iteration_dir).resolve()
-    evals = json.loads(EVALS_FILE.read_text(encoding="utf-8"))
+    evals, compiled = load_evals(EVALS_FILE)
 
     summary: dict = {"iteration": iteration.name, "evals": {}}
 
-    for ev in evals["evals"]:
+    runs = []
+    for index, ev in enumerate(evals["evals"]):
         eval_dir_name = f"eval-{ev['id']}-{ev['name'].replace('_', '-')}"
         eval_dir = iteration / eval_dir_name
         if not eval_dir.exists():
@@ -129,26 +412,25 @@ def main(iteration_dir: str) -> int:
             if not mode_dir.exists():
                 # Iteration may verify only with_skill; skip absent modes.
                 continue
-            outputs = mode_dir / "outputs"
-            full_text = gather_text(outputs)
-            results = [grade_assertion(outputs, full_text, a) for a in ev["assertions"]]
-            passed = sum(1 for r in results if r["passed"])
-            total = len(results)
-            grading = {
-                "pass_count": passed,
-                "total": total,
-                "pass_rate": passed / total if total else 0,
-                "assertions": results,
-            }
-            (outputs.parent / "grading.json").write_text(
-                json.dumps(grading, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
-            summary["evals"][eval_dir_name][mode] = {
-                "pass_count": passed,
-                "total": total,
-                "pass_rate": grading["pass_rate"],
-            }
-            print(f"{eval_dir_name} / {mode}: {passed}/{total}")
+            runs.append((eval_dir_name, mode, (mode_dir / "outputs", index, use_cache)))
+
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    if jobs > 1 and len(runs) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(runs)), initializer=_init_worker,
+                                 initargs=(compiled,)) as pool:
+            graded = list(pool.map(_grade_job, [job for _, _, job in runs]))
+    else:
+        _init_worker(compiled)
+        graded = [_grade_job(job) for _, _, job in runs]
+
+    for (eval_dir_name, mode, _), (grading, cached) in zip(runs, graded):
+        passed, total = grading["pass_count"], grading["total"]
+        summary["evals"][eval_dir_name][mode] = {
+            "pass_count": passed,
+            "total": total,
+            "pass_rate": grading["pass_rate"],
+        }
+        print(f"{eval_dir_name} / {mode}: {passed}/{total}{' (cached)' if cached else ''}")
 
     summary_path = iteration / "grading-summary.json"
     summary_path.write_text(
@@ -159,4 +441,11 @@ def main(iteration_dir: str) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else "aurora-workspace/iteration-1"))
+    ap = argparse.ArgumentParser(description="Grade an eval iteration")
+    ap.add_argument("iteration", nargs="?", default="aurora-workspace/iteration-1")
+    ap.add_argument("--jobs", "-j", type=int, default=0,
+                    help="worker processes (0 = one per CPU, 1 = serial)")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="regrade every run even if its grading.json is current")
+    args = ap.parse_args()
+    sys.exit(main(args.iteration, jobs=args.jobs, use_cache=not args.no_cache))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+aurora/scripts/bench_lint_fences.py
+
+Measures yaml-fence parse throughput of lint_ha_syntax.py's
+check_fence_parses() over the repo's markdown, before and after the
+parallel/memoized rework:
+
+    before   pure-Python SafeLoader, every fence parsed, one process
+    after    libyaml loader (when available) + content-hash fence memo
+    after    the same, sharded over --jobs worker processes
+
+Usage:
+    python aurora/scripts/bench_lint_fences.py              # repo markdown
+    python aurora/scripts/bench_lint_fences.py --rounds 5 --jobs 8 docs/*.md
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import lint_ha_syntax as lint  # noqa: E402
+
+
+class PurePythonLoader(yaml.SafeLoader):
+    """The linter's previous loader: pure-Python SafeLoader, tags ignored."""
+
+
+PurePythonLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
+
+
+def collect(paths):
+    """{path: [fence body, ...]} for every yaml fence in the given markdown."""
+    fences = {}
+    for rel in paths:
+        path = lint.REPO_ROOT / rel
+        if not rel.endswith(".md") or not path.is_file():
+            continue
+        text = path.read_text(encoding="utf-8")
+        fences[rel] = ["\n".join(block) for _start, block, info in lint.iter_yaml_fences(text)
+                       if info in ("yaml", "yml")]
+    return fences
+
+
+def parse_before(bodies):
+    for body in bodies:
+        try:
+            list(yaml.load_all(body, Loader=PurePythonLoader))
+        except yaml.YAMLError:
+            pass
+
+
+def parse_after(bodies):
+    for body in bodies:
+        lint.fence_error(body)
+
+
+def bench(run, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        lint._fence_memo.clear()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lint_ha_syntax.py fence parsing")
+    parser.add_argument("paths", nargs="*", help="Markdown files (default: every tracked .md)")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds (best is reported)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Worker processes for the parallel run (0 = one per CPU)")
+    args = parser.parse_args()
+
+    fences = collect(args.paths or lint.tracked_files())
+    bodies = [body for file_bodies in fences.values() for body in file_bodies]
+    if not bodies:
+        print("No yaml fences found")
+        sys.exit(1)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    shards = [file_bodies for file_bodies in fences.values() if file_bodies]
+
+    print(f"{len(bodies)} fence(s) in {len(shards)} file(s), {len(set(bodies))} distinct, "
+          f"best of {args.rounds} round(s)")
+    chunksize = max(1, len(shards) // (jobs * 4))
+
+    def parallel():
+        # A fresh pool per round: worker startup and cold memos are part of
+        # what a real --jobs run pays.
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(parse_after, shards, chunksize=chunksize))
+
+    runs = (
+        ("before: SafeLoader (pure Python)", lambda: parse_before(bodies)),
+        (f"after: {lint._BaseLoader.__name__} + memo", lambda: parse_after(bodies)),
+        (f"after: + {jobs} job(s)", parallel),
+    )
+    baseline = None
+    for name, run in runs:
+        elapsed = bench(run, args.rounds)
+        baseline = baseline or elapsed
+        print(f"  {name:<36} {elapsed * 1000:8.1f} ms  "
+              f"{len(bodies) / elapsed:9.0f} fences/s  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
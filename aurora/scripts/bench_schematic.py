@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+aurora/scripts/bench_schematic.py
+
+Benchmarks validate_schematic.py on synthetic schematics:
+
+    schema pass   a batch of same-sized files (think board revisions)
+                  validated the way the script used to (schema re-read and
+                  a new validator per file) versus the shared compiled
+                  validator, with and without fastjsonschema
+    netlist pass  check_netlist() on netlists doubling in size from
+                  --components, to show time per pin stays flat
+    catalog       building the profile index from aurora/references versus
+                  loading it from the on-disk cache
+
+Usage:
+    python aurora/scripts/bench_schematic.py                   # 5 x 5,000 components
+    python aurora/scripts/bench_schematic.py --components 20000 --files 3
+    python aurora/scripts/bench_schematic.py --write big.json  # keep a generated file
+    python aurora/scripts/bench_schematic.py --scale 5         # netlist pass up to 16x
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import jsonschema
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import validate_schematic as vs  # noqa: E402
+
+PREFIXES = ["R", "C", "U", "D", "Q", "J", "L"]
+
+
+def synthetic_schematic(components: int, seed: int = 0) -> dict:
+    """A schema-valid schematic with `components` parts wired into small nets.
+
+    Every component gets 2-8 pins; pins are dealt into nets of 2-6 pins,
+    with pin 1 of every part on GND and the first net named 3V3 so the
+    ground and power rules have work to do.
+    """
+    rng = random.Random(seed)
+    comps, pins = [], []
+    for i in range(components):
+        refdes = f"{PREFIXES[i % len(PREFIXES)]}{i + 1}"
+        comps.append({"refdes": refdes, "value": "10k", "description": "synthetic part",
+                      "package": "0603", "lcsc": "C25804" if i % 3 else "TBD"})
+        count = rng.randint(2, 8)
+        pins.append(f"{refdes}.1")
+        pins.extend(f"{refdes}.{n}" for n in range(2, count + 1))
+    ground = [p for p in pins if p.endswith(".1")]
+    rest = [p for p in pins if not p.endswith(".1")]
+    rng.shuffle(rest)
+    nets = [{"name": "GND", "pins": ground}]
+    i = 0
+    while i < len(rest):
+        size = rng.randint(2, 6)
+        chunk = rest[i:i + size]
+        if len(chunk) < 2:
+            nets[-1]["pins"].extend(chunk)
+            break
+        nets.append({"name": f"N{len(nets)}" if len(nets) > 1 else "3V3", "pins": chunk})
+        i += size
+    return {
+        "schema_version": "1.0",
+        "project": {"name": "bench", "board": "esp32-c3-devkitm-1", "generated": "2026-06-12"},
+        "components": comps,
+        "nets": nets,
+    }
+
+
+def per_file_validator(doc: dict) -> list:
+    """The previous behaviour: read the schema and build a validator every file."""
+    schema = json.loads(vs.SCHEMA_PATH.read_text(encoding="utf-8"))
+    return list(jsonschema.Draft202012Validator(schema).iter_errors(doc))
+
+
+def bench(run, docs, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for doc in docs:
+            run(doc)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_netlist(components, steps, rounds):
+    catalog = vs.load_catalog()
+    print(f"check_netlist, best of {rounds} round(s)")
+    for step in range(steps):
+        doc = synthetic_schematic(components << step)
+        pins = sum(len(n["pins"]) for n in doc["nets"])
+        elapsed = bench(lambda d: vs.check_netlist(d, catalog), [doc], rounds)
+        print(f"  {components << step:>7} components {pins:>8} pins  "
+              f"{elapsed * 1000:8.1f} ms  {elapsed * 1e6 / pins:6.2f} us/pin")
+
+
+def bench_catalog(rounds):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def load(cached):
+            vs.load_catalog.cache_clear()
+            if not cached:
+                for stale in Path(cache_dir).glob("*.json"):
+                    stale.unlink()
+            vs.load_catalog(Path(cache_dir))
+
+        print(f"catalog index ({len(vs.catalog_files())} profiles), best of {rounds} round(s)")
+        for name, cached in (("build from profiles", False), ("load from disk cache", True)):
+            elapsed = bench(load, [cached], rounds)
+            print(f"  {name:<24} {elapsed * 1000:8.2f} ms")
+    vs.load_catalog.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate_schematic.py")
+    parser.add_argument("--components", type=int, default=5000, help="Components per schematic")
+    parser.add_argument("--files", type=int, default=5, help="Schematics per batch")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds (best is reported)")
+    parser.add_argument("--write", type=Path, help="Also write one generated schematic here")
+    parser.add_argument("--scale", type=int, default=4,
+                        help="Netlist sizes to time, doubling from --components")
+    args = parser.parse_args()
+
+    docs = [synthetic_schematic(args.components, seed) for seed in range(args.files)]
+    if args.write:
+        args.write.write_text(json.dumps(docs[0], indent=1), encoding="utf-8")
+    pins = sum(len(n["pins"]) for n in docs[0]["nets"])
+    print(f"{args.files} file(s) x {args.components} components ({pins} pins), "
+          f"best of {args.rounds} round(s)")
+
+    schema = json.loads(vs.SCHEMA_PATH.read_text(encoding="utf-8"))
+    cached = vs.CompiledSchema(schema)
+    slow = vs.CompiledSchema(schema)
+    slow.fast = None
+    runs = [
+        ("schema pass, validator per file (before)", per_file_validator),
+        ("schema pass, cached jsonschema", slow.errors),
+    ]
+    if cached.fast is not None:
+        runs.append(("schema pass, cached fastjsonschema", cached.errors))
+    else:
+        print("  (fastjsonschema not installed; pip install fastjsonschema for the fast path)")
+
+    baseline = None
+    for name, run in runs:
+        elapsed = bench(run, docs, args.rounds)
+        baseline = baseline or elapsed
+        print(f"  {name:<42} {elapsed * 1000 / args.files:8.1f} ms/file  "
+              f"{baseline / elapsed:5.1f}x")
+    bench_netlist(args.components, args.scale, args.rounds)
+    bench_catalog(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
+
@@ -18,21 +18,33 @@ Usage:
     # Gate at a conformance level (minimal | standard | strict):
     python aurora/scripts/check-delivery.py --level strict co2-air-quality/
 
+    # Gate many projects at once (process pool, cached, one report):
+    python aurora/scripts/check-delivery.py projects/*
+    python aurora/scripts/check-delivery.py --jobs 8 --no-cache projects/*
+
+    # Per-check wall time and bytes read:
+    python aurora/scripts/check-delivery.py --profile co2-air-quality/
+
 Conformance levels:
     minimal   it is a real deliverable on disk (README, attribution, device YAML)
     standard  the full delivery contract (sections, secrets, BOM datestamp, structure)
     strict    additionally consistent and safety-complete (one language, hazard attribution)
 
 Exit codes:
-    0  all checks at the chosen level passed
-    1  one or more checks at the chosen level failed
+    0  all checks at the chosen level passed (in every project)
+    1  one or more checks at the chosen level failed (in any project)
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
 
 ATTRIBUTION_PATTERN = re.compile(
@@ -81,12 +93,66 @@ PCB_FILES = [
     "TEST-JIG.md",
 ]
 
-SWEDISH_MARKERS = re.compile(
-    r"\b(?:och|att|med|för|på|är|det|som|av|till|den|en|ett|vi|du|"
-    r"han|hon|de|sig|men|om|så|kan|ha|ska|vill|från|inte)\b",
-    re.IGNORECASE,
+class Language(NamedTuple):
+    """A doc language the consistency check can tell apart from English."""
+    name: str
+    letters: str  # letters English prose never uses; decisive when unique
+    stop_words: frozenset[str]
+    threshold: int = 5  # stop-word hits that decide it without letters
+
+
+def _words(text: str) -> frozenset[str]:
+    return frozenset(text.split())
+
+
+# English is the fallback: a doc with no evidence for any of these is English.
+# Stop words leave out anything common in English prose or these docs
+# ("for", "is", "no", "ha" as in Home Assistant); where two configured
+# languages share a word, only their unshared words count (see
+# LanguageClassifier), which is what tells Norwegian from Danish.
+LANGUAGES = {
+    "sv": Language("Swedish", "åäöÅÄÖ", _words(
+        "och att med för på är det som av ett vi du hon sig om så "
+        "kan ska vill från inte eller hur efter utan bara när också"
+    )),
+    "no": Language("Norwegian", "æøåÆØÅ", _words(
+        "og å med på er det som av til vi du hun seg om så kan skal "
+        "vil fra ikke noen nå hva etter mellom gjennom uten deg meg"
+    )),
+    "da": Language("Danish", "æøåÆØÅ", _words(
+        "og af med på er det som til vi du hun sig om så kan skal "
+        "vil fra ikke nogen nu hvad efter mellem gennem uden dig mig"
+    )),
+    "de": Language("German", "äöüßÄÖÜ", _words(
+        "und der die das mit für auf ist nicht sie wir ein eine "
+        "zu von den dem des wird werden auch oder wenn kann"
+    )),
+    "nl": Language("Dutch", "", _words(
+        "en het de een van met voor niet wij je naar om dat wordt "
+        "worden ook als kan zijn bij deze wanneer moet"
+    )),
+    "fr": Language("French", "àâçéèêëîïôùûœÀÂÇÉÈÊËÎÏÔÙÛŒ", _words(
+        "et le la les des du un une avec pour sur est pas nous vous "
+        "il elle que qui dans ce cette sont être peut"
+    )),
+    "es": Language("Spanish", "ñáéíóú¿¡ÑÁÉÍÓÚ", _words(
+        "y el la los las del un una con para es nosotros "
+        "que se por su al como está son puede"
+    )),
+}
+
+# Scored alongside the configured languages: stop words only decide a
+# language once its count leads this one's by the language's threshold.
+ENGLISH_STOP_WORDS = _words(
+    "the and to of a in is for on with that it this be as are at or "
+    "have not you your from by if can will an do no when then all one "
+    "which was has into than also only but so out up use its"
 )
 
+# Languages checked by default; override with --languages or the
+# AURORA_DOC_LANGUAGES environment variable (comma-separated codes).
+DEFAULT_DOC_LANGUAGES = "sv"
+
 
 class CheckResult(NamedTuple):
     name: str
@@ -107,22 +173,115 @@ def at_or_below(level: str, ceiling: str) -> bool:
     return LEVEL_ORDER[level] <= LEVEL_ORDER[ceiling]
 
 
-def check_root_readme(project: Path) -> list[CheckResult]:
+class ProjectIndex:
+    """One walk of a project folder, shared by every check.
+
+    The tree is scanned once up front (one os.scandir per directory); file
+    contents are read lazily, on first request, and memoized, so a doc that
+    several checks look at (README.md) is read once. Paths are project-
+    relative POSIX strings ("esphome/INSTALL.md").
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.files: set[str] = set()
+        self.dirs: set[str] = set()
+        self.children: dict[str, list[str]] = {}  # dir ("" = root) -> entry names
+        self.by_name: dict[str, list[str]] = {}  # basename -> files, anywhere
+        self.bytes_read = 0
+        self._text: dict[str, str] = {}
+        self._scan("")
+
+    def _scan(self, rel_dir: str) -> None:
+        names: list[str] = []
+        self.children[rel_dir] = names
+        with os.scandir(self.root / rel_dir if rel_dir else self.root) as entries:
+            entries = sorted(entries, key=lambda e: e.name)
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            names.append(entry.name)
+            if entry.is_dir():
+                self.dirs.add(rel)
+                if not entry.is_symlink():
+                    self._scan(rel)
+            elif entry.is_file():
+                self.files.add(rel)
+                self.by_name.setdefault(entry.name, []).append(rel)
+
+    def exists(self, rel: str) -> bool:
+        return rel in self.files or rel in self.dirs
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    def text(self, rel: str) -> str:
+        if rel not in self._text:
+            data = self.path(rel).read_bytes()
+            self.bytes_read += len(data)
+            self._text[rel] = data.decode("utf-8", errors="replace")
+        return self._text[rel]
+
+    def lines(self, rel: str):
+        """Iterate a file's lines, reading only as far as the caller goes.
+
+        Served from memory when another check already read the file;
+        otherwise streamed and not memoized.
+        """
+        if rel in self._text:
+            yield from self._text[rel].splitlines()
+            return
+        with open(self.path(rel), "rb") as f:
+            for raw in f:
+                self.bytes_read += len(raw)
+                yield raw.decode("utf-8", errors="replace")
+
+
+def as_index(project: "ProjectIndex | Path") -> ProjectIndex:
+    """Checks take a ProjectIndex; a bare Path gets one built for it."""
+    return project if isinstance(project, ProjectIndex) else ProjectIndex(Path(project))
+
+
+class Check(NamedTuple):
+    """A registered check and what running it involves."""
+    fn: Callable[[ProjectIndex], list[CheckResult]]
+    level: str  # lowest level it reports at; skipped when --level is below it
+    inputs: tuple[str, ...]  # project paths it looks at ("**/X" = anywhere)
+    cost: str  # "stat" (existence only), "read" (a few files), "scan" (every match)
+
+    @property
+    def name(self) -> str:
+        return self.fn.__name__
+
+
+# Every check, in report order. Add one with @check(...).
+CHECKS: list[Check] = []
+
+
+def check(level: str, inputs: tuple[str, ...] = (), cost: str = "read"):
+    """Register a check_* function with its level, inputs and cost class."""
+    def register(fn):
+        CHECKS.append(Check(fn, level, tuple(inputs), cost))
+        return fn
+    return register
+
+
+@check("minimal", inputs=("README.md",))
+def check_root_readme(project: ProjectIndex) -> list[CheckResult]:
     results: list[CheckResult] = []
-    readme = project / "README.md"
+    index = as_index(project)
 
-    exists = readme.exists()
+    exists = index.exists("README.md")
     results.append(CheckResult(
         "README.md exists",
         exists,
-        "OK" if exists else f"MISSING: {readme}",
+        "OK" if exists else f"MISSING: {index.path('README.md')}",
         level="minimal",
     ))
 
     if not exists:
         return results
 
-    content = readme.read_text(encoding="utf-8", errors="replace")
+    content = index.text("README.md")
 
     has_attribution = bool(ATTRIBUTION_PATTERN.search(content))
     results.append(CheckResult(
@@ -143,23 +302,27 @@ def check_root_readme(project: Path) -> list[CheckResult]:
     return results
 
 
-def check_esphome(project: Path) -> list[CheckResult]:
+@check("minimal", inputs=(
+    "esphome/INSTALL.md", "esphome/TROUBLESHOOTING.md", "esphome/*.yaml",
+    "esphome/secrets.yaml.example",
+))
+def check_esphome(project: ProjectIndex) -> list[CheckResult]:
     results: list[CheckResult] = []
-    esphome = project / "esphome"
+    index = as_index(project)
 
-    if not esphome.exists():
+    if not index.exists("esphome"):
         return results
 
     for fname in ("INSTALL.md", "TROUBLESHOOTING.md"):
-        fpath = esphome / fname
-        exists = fpath.exists()
+        rel = f"esphome/{fname}"
+        exists = index.exists(rel)
         results.append(CheckResult(
             f"esphome/{fname} exists",
             exists,
-            "OK" if exists else f"MISSING: {fpath}",
+            "OK" if exists else f"MISSING: {index.path(rel)}",
         ))
         if exists:
-            content = fpath.read_text(encoding="utf-8", errors="replace")
+            content = index.text(rel)
             has_attr = bool(ATTRIBUTION_PATTERN.search(content))
             results.append(CheckResult(
                 f"esphome/{fname} attribution",
@@ -168,8 +331,8 @@ def check_esphome(project: Path) -> list[CheckResult]:
             ))
 
     yaml_files = [
-        f for f in esphome.glob("*.yaml")
-        if f.stem not in ("secrets", "secrets.yaml")
+        name for name in index.children.get("esphome", [])
+        if name.endswith(".yaml") and name[:-len(".yaml")] not in ("secrets", "secrets.yaml")
     ]
     has_yaml = len(yaml_files) > 0
     results.append(CheckResult(
@@ -179,39 +342,41 @@ def check_esphome(project: Path) -> list[CheckResult]:
         level="minimal",
     ))
 
-    secrets_example = esphome / "secrets.yaml.example"
-    exists = secrets_example.exists()
+    exists = index.exists("esphome/secrets.yaml.example")
     results.append(CheckResult(
         "esphome/secrets.yaml.example exists",
         exists,
-        "OK" if exists else f"MISSING: {secrets_example}",
+        "OK" if exists else f"MISSING: {index.path('esphome/secrets.yaml.example')}",
     ))
 
     return results
 
 
-def check_hardware(project: Path) -> list[CheckResult]:
+@check("standard", inputs=tuple(f"esphome/{fname}" for fname in PCB_FILES), cost="stat")
+def check_hardware(project: ProjectIndex) -> list[CheckResult]:
     results: list[CheckResult] = []
-    hardware = project / "hardware"
-    esphome = project / "esphome"
+    index = as_index(project)
 
     # PCB files must NOT be in esphome/ (v1.8.0+ rule)
-    if esphome.exists():
+    if index.exists("esphome"):
         for fname in PCB_FILES:
-            wrong = esphome / fname
-            if wrong.exists():
+            if index.exists(f"esphome/{fname}"):
                 results.append(CheckResult(
                     f"PCB file location: {fname}",
                     False,
                     f"WRONG LOCATION: {fname} is in esphome/ - move to hardware/ (v1.8.0+)",
                 ))
 
-    if not hardware.exists():
-        return results
+    return results
+
 
-    hazard = hardware / "HAZARD-ANALYSIS.md"
-    if hazard.exists():
-        content = hazard.read_text(encoding="utf-8", errors="replace")
+@check("strict", inputs=("hardware/HAZARD-ANALYSIS.md",))
+def check_hazard_analysis(project: ProjectIndex) -> list[CheckResult]:
+    results: list[CheckResult] = []
+    index = as_index(project)
+
+    if index.exists("hardware/HAZARD-ANALYSIS.md"):
+        content = index.text("hardware/HAZARD-ANALYSIS.md")
         has_attr = bool(ATTRIBUTION_PATTERN.search(content))
         results.append(CheckResult(
             "hardware/HAZARD-ANALYSIS.md attribution",
@@ -223,19 +388,21 @@ def check_hardware(project: Path) -> list[CheckResult]:
     return results
 
 
-def check_bom(project: Path) -> list[CheckResult]:
+@check("standard", inputs=("README.md", "hardware/BOM.md", "esphome/BOM.md"))
+def check_bom(project: ProjectIndex) -> list[CheckResult]:
     results: list[CheckResult] = []
+    index = as_index(project)
 
     candidates = [
-        project / "README.md",
-        project / "hardware" / "BOM.md",
-        project / "esphome" / "BOM.md",
+        "README.md",
+        "hardware/BOM.md",
+        "esphome/BOM.md",
     ]
 
-    for bom_path in candidates:
-        if not bom_path.exists():
+    for label in candidates:
+        if label not in index.files:
             continue
-        content = bom_path.read_text(encoding="utf-8", errors="replace")
+        content = index.text(label)
 
         # Only check files that actually contain a BOM
         has_bom_marker = "bom" in content.lower() or "bill of material" in content.lower()
@@ -244,7 +411,7 @@ def check_bom(project: Path) -> list[CheckResult]:
             continue
 
         has_datestamp = bool(BOM_DATESTAMP_PATTERN.search(content))
-        label = bom_path.relative_to(project)
+        label = str(Path(label))
         results.append(CheckResult(
             f"BOM datestamp in {label}",
             has_datestamp,
@@ -256,20 +423,21 @@ def check_bom(project: Path) -> list[CheckResult]:
     return results
 
 
-def check_subdir_structure(project: Path) -> list[CheckResult]:
+@check("standard", inputs=("*",), cost="stat")
+def check_subdir_structure(project: ProjectIndex) -> list[CheckResult]:
     results: list[CheckResult] = []
+    index = as_index(project)
 
-    for item in project.iterdir():
-        name = item.name
+    for name in index.children[""]:
         if name.startswith(".") and name not in ALLOWED_ROOT_FILES:
             continue
-        if item.is_file() and name not in ALLOWED_ROOT_FILES:
+        if name in index.files and name not in ALLOWED_ROOT_FILES:
             results.append(CheckResult(
                 f"Unexpected root file: {name}",
                 False,
                 f"WRONG LOCATION: {name} at project root - move to canonical subdirectory",
             ))
-        elif item.is_dir() and name not in CANONICAL_SUBDIRS and name not in ALLOWED_ROOT_FILES:
+        elif name in index.dirs and name not in CANONICAL_SUBDIRS and name not in ALLOWED_ROOT_FILES:
             results.append(CheckResult(
                 f"Unexpected subdirectory: {name}",
                 False,
@@ -285,74 +453,175 @@ def check_subdir_structure(project: Path) -> list[CheckResult]:
 HUMAN_DOC_NAMES = ["README.md", "INSTALL.md", "TROUBLESHOOTING.md", "BOM.md", "WIRING.md"]
 
 
+WORD_RE = re.compile(r"\w+")
+
+
+class LanguageClassifier:
+    """Streaming, line-based doc language detection for a set of languages.
+
+    Lines are consumed one at a time: fenced code blocks are skipped as they
+    are entered and left, and classification stops at the first line that
+    makes the answer certain - a letter only one configured language uses,
+    or a language's stop-word count leading the English count by its
+    threshold. A doc that never gets there is English. Letter and stop-word
+    sets are reduced up front to what no other configured language shares
+    (Swedish and German both use ä/ö, so with both configured only å, ü and
+    ß are decisive; Norwegian and Danish share their letters and are told
+    apart by words like av/af and noen/nogen), and the stop-word sets are
+    frozensets, so each word costs one set lookup.
+    """
+
+    def __init__(self, codes: list[str]):
+        self.languages = [LANGUAGES[code] for code in codes]
+        self._letters: list[re.Pattern | None] = []
+        self._stop_words: list[frozenset[str]] = []
+        for lang in self.languages:
+            others = [o for o in self.languages if o is not lang]
+            shared = set().union(*(o.letters for o in others))
+            unique = "".join(sorted(set(lang.letters) - shared))
+            self._letters.append(re.compile(f"[{re.escape(unique)}]") if unique else None)
+            self._stop_words.append(lang.stop_words.difference(*(o.stop_words for o in others)))
+
+    def classify(self, lines) -> str:
+        counts = [0] * len(self.languages)
+        english = 0
+        in_fence = False
+        for line in lines:
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            for lang, letters in zip(self.languages, self._letters):
+                if letters is not None and letters.search(line):
+                    return lang.name
+            words = WORD_RE.findall(line.lower())
+            if not words:
+                continue
+            english += sum(1 for w in words if w in ENGLISH_STOP_WORDS)
+            for i, lang in enumerate(self.languages):
+                counts[i] += sum(1 for w in words if w in self._stop_words[i])
+                if counts[i] - english >= lang.threshold:
+                    return lang.name
+        return "English"
+
+
+_classifiers: dict[str, LanguageClassifier] = {}
+
+
+def doc_languages() -> str:
+    return os.environ.get("AURORA_DOC_LANGUAGES") or DEFAULT_DOC_LANGUAGES
+
+
+def get_classifier(codes: str | None = None) -> LanguageClassifier:
+    """The classifier for comma-separated language codes (default: configured)."""
+    codes = codes or doc_languages()
+    if codes not in _classifiers:
+        _classifiers[codes] = LanguageClassifier([c.strip() for c in codes.split(",") if c.strip()])
+    return _classifiers[codes]
+
+
 def _looks_swedish(text: str) -> bool:
-    # Swedish-specific letters are the strongest signal; the stop-word list
-    # is the fallback. Strip fenced code so YAML/commands do not skew it.
-    prose = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
-    if re.search(r"[åäöÅÄÖ]", prose):
-        return True
-    return len(SWEDISH_MARKERS.findall(prose)) >= 5
+    return get_classifier("sv").classify(text.splitlines()) == "Swedish"
 
 
-def check_language_consistency(project: Path) -> list[CheckResult]:
+@check("strict", inputs=tuple(f"**/{name}" for name in HUMAN_DOC_NAMES), cost="scan")
+def check_language_consistency(project: ProjectIndex) -> list[CheckResult]:
     """Definitive consistency check: every human-readable doc in the project
     must be in the same language. Absolute correctness needs the conversation,
     but internal agreement is checkable - a Swedish README with an English
     INSTALL.md is a Language Rule violation regardless of intent.
     """
     results: list[CheckResult] = []
+    index = as_index(project)
 
-    docs: dict[str, bool] = {}
+    classifier = get_classifier()
+    docs: dict[str, str] = {}
     for name in HUMAN_DOC_NAMES:
-        for path in project.rglob(name):
-            content = path.read_text(encoding="utf-8", errors="replace")
-            docs[str(path.relative_to(project))] = _looks_swedish(content)
+        for rel in index.by_name.get(name, []):
+            docs[str(Path(rel))] = classifier.classify(index.lines(rel))
 
     if len(docs) < 2:
         return results  # nothing to compare
 
-    sv = [d for d, is_sv in docs.items() if is_sv]
-    en = [d for d, is_sv in docs.items() if not is_sv]
-    consistent = not sv or not en
+    groups: dict[str, list[str]] = {lang.name: [] for lang in classifier.languages}
+    groups["English"] = []
+    for doc, language in docs.items():
+        groups[language].append(doc)
+    found = [(language, names) for language, names in groups.items() if names]
+    consistent = len(found) <= 1
+    mismatch = " vs ".join(f"{language} ({', '.join(names)})" for language, names in found)
     results.append(CheckResult(
         "human docs share one language",
         consistent,
-        "OK" if consistent
-        else f"MISMATCH: Swedish ({', '.join(sv)}) vs English ({', '.join(en)}) - Language Rule violation",
+        "OK" if consistent else f"MISMATCH: {mismatch} - Language Rule violation",
         level="strict",
     ))
 
     return results
 
 
-def run_checks(project_path: str) -> tuple[list[CheckResult], bool]:
+class ProjectError(Exception):
+    """The project path cannot be checked at all (missing, not a folder)."""
+
+
+def index_project(project_path: str) -> ProjectIndex:
     project = Path(project_path)
 
     if not project.exists():
-        print(f"ERROR: not found: {project}", file=sys.stderr)
-        sys.exit(1)
+        raise ProjectError(f"not found: {project}")
 
     if not project.is_dir():
-        print(f"ERROR: not a directory: {project}", file=sys.stderr)
-        sys.exit(1)
+        raise ProjectError(f"not a directory: {project}")
+
+    return ProjectIndex(project)
+
+
+def charge(profile: dict | None, name: str, seconds: float, nbytes: int) -> None:
+    """Add one run to a profile: {name: [seconds, bytes read, runs]}."""
+    if profile is not None:
+        row = profile.setdefault(name, [0.0, 0, 0])
+        row[0] += seconds
+        row[1] += nbytes
+        row[2] += 1
+
+
+def run_checks(
+    project_path: str,
+    index: ProjectIndex | None = None,
+    level: str = "strict",
+    profile: dict | None = None,
+) -> tuple[list[CheckResult], bool]:
+    """Run every registered check at or below level.
+
+    Checks above level are skipped without being called. With a profile
+    dict, each check's wall time and bytes read are added to it.
+    """
+    if index is None:
+        started = time.perf_counter()
+        index = index_project(project_path)
+        charge(profile, "(index)", time.perf_counter() - started, 0)
 
     all_results: list[CheckResult] = []
-    all_results.extend(check_root_readme(project))
-    all_results.extend(check_esphome(project))
-    all_results.extend(check_hardware(project))
-    all_results.extend(check_bom(project))
-    all_results.extend(check_subdir_structure(project))
-    all_results.extend(check_language_consistency(project))
+    for registered in CHECKS:
+        if not at_or_below(registered.level, level):
+            continue
+        started, before = time.perf_counter(), index.bytes_read
+        all_results.extend(registered.fn(index))
+        charge(profile, registered.name, time.perf_counter() - started,
+               index.bytes_read - before)
 
     overall_pass = all(r.passed for r in all_results)
     return all_results, overall_pass
 
 
-def highest_level_passed(results: list[CheckResult]) -> str | None:
+def highest_level_passed(results: list[CheckResult], ceiling: str = "strict") -> str | None:
     """The strongest conformance level at which every check passes, or None
-    if even minimal fails."""
+    if even minimal fails. Levels above ceiling were not checked."""
     best = None
     for level in ("minimal", "standard", "strict"):
+        if not at_or_below(level, ceiling):
+            break
         tier = [r for r in results if at_or_below(r.level, level)]
         if tier and all(r.passed for r in tier):
             best = level
@@ -361,11 +630,232 @@ def highest_level_passed(results: list[CheckResult]) -> str | None:
     return best
 
 
+# ---------------------------------------------------------------------------
+# Multi-project mode
+# ---------------------------------------------------------------------------
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aurora-check-delivery"
+
+
+def checker_version() -> str:
+    """Any change to this script invalidates every cached outcome."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def file_digests(index: ProjectIndex, known: dict) -> dict:
+    """{relative path: [size, mtime_ns, sha256]} for every file in project.
+
+    Hashes are reused from known while a file's size and mtime are
+    unchanged, so an untouched project costs one stat per file and no reads.
+    Directories are listed too (as "dir"): an empty unexpected folder still
+    changes the structure check.
+    """
+    digests = {rel: [0, 0, "dir"] for rel in index.dirs}
+    for rel in index.files:
+        path = index.path(rel)
+        st = path.stat()
+        entry = known.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            digests[rel] = entry
+        else:
+            sha = hashlib.sha256(path.read_bytes()).hexdigest()
+            digests[rel] = [st.st_size, st.st_mtime_ns, sha]
+    return digests
+
+
+def project_key(version: str, digests: dict) -> str:
+    """Content key for a project: checker version plus every file's hash.
+
+    Paths are part of the key, so moving or adding a file (which the
+    structure checks care about) changes it too.
+    """
+    h = hashlib.sha256(version.encode())
+    for rel, (_size, _mtime, sha) in sorted(digests.items()):
+        h.update(f"{rel}\0{sha}\n".encode())
+    return h.hexdigest()
+
+
+class ProjectOutcome(NamedTuple):
+    project: str
+    results: list[CheckResult]
+    error: str | None = None
+    cached: bool = False
+    profile: dict | None = None
+
+
+class OutcomeCache:
+    """One JSON file per project: its file hashes and last check results.
+
+    An entry is replayed when the project's content key still matches;
+    otherwise its file hashes seed the next run so only changed files
+    are re-read. Entries are written atomically (write then rename). A
+    cache dir that cannot be created, read or written only costs the
+    cache: a failed load is a miss and a failed store is skipped.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # store() fails quietly too; every project is simply checked
+
+    def _path(self, project: str) -> Path:
+        name = hashlib.sha256(str(Path(project).resolve()).encode()).hexdigest()[:32]
+        return self.cache_dir / f"{name}.json"
+
+    def load(self, project: str) -> dict:
+        try:
+            entry = json.loads(self._path(project).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entry if isinstance(entry, dict) else {}
+
+    def store(self, project: str, entry: dict) -> None:
+        path = self._path(project)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # a read-only or full cache dir must never fail the check
+
+
+def check_project(
+    job: tuple[str, dict | None, str, bool]
+) -> tuple[ProjectOutcome, dict | None]:
+    """Run (or replay) every check at or below a level for one project.
+
+    job is (project path, cached entry or None when caching is off, level,
+    whether to profile). Returns the outcome and the entry to store, if
+    any. Top-level so a process pool can pickle it.
+    """
+    project, entry, level, profiling = job
+    profile: dict | None = {} if profiling else None
+    try:
+        started = time.perf_counter()
+        index = index_project(project)  # the one walk both stages share
+        charge(profile, "(index)", time.perf_counter() - started, 0)
+        if entry is None:
+            results, _ = run_checks(project, index, level, profile)
+            return ProjectOutcome(project, results, profile=profile), None
+
+        started = time.perf_counter()
+        digests = file_digests(index, entry.get("files", {}))
+        key = project_key(f"{checker_version()}:{level}:{doc_languages()}", digests)
+        charge(profile, "(cache key)", time.perf_counter() - started, 0)
+        if entry.get("key") == key:
+            results = [CheckResult(*r) for r in entry["results"]]
+            return ProjectOutcome(project, results, cached=True, profile=profile), None
+        results, _ = run_checks(project, index, level, profile)
+        fresh = {"key": key, "files": digests, "results": [list(r) for r in results]}
+        return ProjectOutcome(project, results, profile=profile), fresh
+    except (ProjectError, OSError) as e:
+        return ProjectOutcome(project, [], error=str(e), profile=profile), None
+
+
+def check_projects(
+    projects: list[str],
+    jobs: int = 0,
+    cache: OutcomeCache | None = None,
+    level: str = "strict",
+    profile: bool = False,
+):
+    """Yield one ProjectOutcome per project, in input order.
+
+    Projects are fanned out over a process pool (jobs=0: one worker per
+    CPU); with a cache, unchanged projects are replayed by their worker
+    without running any check.
+    """
+    work = [(p, cache.load(p) if cache else None, level, profile) for p in projects]
+    workers = min(jobs or os.cpu_count() or 1, len(work))
+
+    if workers <= 1:
+        outcomes = map(check_project, work)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        outcomes = pool.map(check_project, work, chunksize=4)
+    try:
+        for outcome, entry in outcomes:
+            if cache and entry is not None:
+                cache.store(outcome.project, entry)
+            yield outcome
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def print_profile(profile: dict) -> None:
+    """The --profile table: one row per check, slowest first."""
+    registered = {c.name: c for c in CHECKS}
+    print(f"  {'check':<28} {'level':<9} {'cost':<5} {'runs':>5} {'ms':>9} {'bytes read':>11}")
+    for name, (seconds, nbytes, runs) in sorted(profile.items(), key=lambda kv: -kv[1][0]):
+        spec = registered.get(name)
+        level, cost = (spec.level, spec.cost) if spec else ("-", "-")
+        print(f"  {name:<28} {level:<9} {cost:<5} {runs:>5} {seconds * 1000:>9.2f} {nbytes:>11}")
+    skipped = [c.name for c in CHECKS if c.name not in profile]
+    if skipped:
+        print(f"  skipped (above level or cached): {', '.join(skipped)}")
+    print()
+
+
+def print_aggregate(outcomes: list[ProjectOutcome], level: str, verbose: bool,
+                    elapsed: float, workers: int) -> bool:
+    """The single conformance report for a multi-project run."""
+    print(f"\naurora check-delivery [{level}] - {len(outcomes)} project(s)\n{'-' * 62}")
+    reached = {
+        label: 0 for label in ("strict", "standard", "minimal") if at_or_below(label, level)
+    }
+    reached[None] = 0
+    blocked = 0
+
+    for outcome in outcomes:
+        if outcome.error:
+            blocked += 1
+            reached[None] += 1
+            print(f"  FAIL  {'-':<9} {outcome.project}")
+            print(f"        ERROR: {outcome.error}")
+            continue
+        gated = [r for r in outcome.results if at_or_below(r.level, level)]
+        failures = [r for r in gated if not r.passed]
+        best = highest_level_passed(outcome.results, level)
+        reached[best] += 1
+        if failures:
+            blocked += 1
+            print(f"  FAIL  {best or 'none':<9} {outcome.project}  "
+                  f"({len(failures)}/{len(gated)} check(s) failed)")
+            for r in failures:
+                print(f"        FAIL  [{r.level}] {r.name}")
+                print(f"              {r.message}")
+        elif verbose:
+            print(f"  PASS  {best:<9} {outcome.project}")
+
+    cached = sum(o.cached for o in outcomes)
+    total = len(outcomes)
+    print(f"{'-' * 62}\n  {total - blocked}/{total} project(s) pass '{level}'")
+    print("  Highest conformance level reached: " + ", ".join(
+        f"{label or 'none'} {count}" for label, count in reached.items()
+    ))
+    print(f"  {elapsed:.2f}s, {workers} job(s), {cached} project(s) unchanged (cached)")
+
+    if blocked:
+        print(f"\n  DELIVERY BLOCKED - {blocked} project(s) fail '{level}'\n")
+    else:
+        print(f"\n  DELIVERY APPROVED - every project passes '{level}'\n")
+    return not blocked
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Validate an Aurora project folder against delivery rules."
     )
-    parser.add_argument("project", help="Path to the project folder to validate")
+    parser.add_argument(
+        "projects", nargs="+", metavar="project",
+        help="Path to the project folder to validate (several for one aggregated report)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -375,19 +865,74 @@ def main() -> None:
         "--level",
         choices=["minimal", "standard", "strict"],
         default="standard",
-        help="Conformance level to gate on (default: standard). The exit code "
-             "reflects this level; the report still lists every check.",
+        help="Conformance level to gate on (default: standard). Checks above it "
+             "are not run; the report lists every check at or below it.",
+    )
+    parser.add_argument(
+        "--languages", default=None, metavar="CODES",
+        help="Comma-separated doc languages the language check tells apart from "
+             f"English ({', '.join(LANGUAGES)}; default: $AURORA_DOC_LANGUAGES or "
+             f"{DEFAULT_DOC_LANGUAGES})",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Print each check's level, cost class, wall time and bytes read",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=0,
+        help="Worker processes for several projects (default: 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help="Outcome cache location (default: ~/.cache/aurora-check-delivery)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Run every check even for projects that have not changed",
     )
     args = parser.parse_args()
 
-    results, _ = run_checks(args.project)
+    if args.languages:
+        unknown = [c for c in args.languages.split(",") if c.strip() not in LANGUAGES]
+        if unknown:
+            parser.error(f"unknown language code(s): {', '.join(unknown)}")
+        os.environ["AURORA_DOC_LANGUAGES"] = args.languages  # pool workers inherit it
+
+    if len(args.projects) > 1:
+        cache = None if args.no_cache else OutcomeCache(args.cache_dir or default_cache_dir())
+        started = time.perf_counter()
+        outcomes = list(check_projects(
+            args.projects, args.jobs, cache, args.level, args.profile
+        ))
+        workers = min(args.jobs or os.cpu_count() or 1, len(args.projects))
+        passed = print_aggregate(
+            outcomes, args.level, args.verbose, time.perf_counter() - started, workers
+        )
+        if args.profile:
+            total: dict = {}
+            for outcome in outcomes:
+                for name, (seconds, nbytes, runs) in (outcome.profile or {}).items():
+                    row = total.setdefault(name, [0.0, 0, 0])
+                    row[0] += seconds
+                    row[1] += nbytes
+                    row[2] += runs
+            print_profile(total)
+        sys.exit(0 if passed else 1)
+
+    project = args.projects[0]
+    profile: dict | None = {} if args.profile else None
+    try:
+        results, _ = run_checks(project, level=args.level, profile=profile)
+    except ProjectError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
 
     gated = [r for r in results if at_or_below(r.level, args.level)]
     failures = [r for r in gated if not r.passed]
     successes = [r for r in gated if r.passed]
     passed = not failures
 
-    project_label = Path(args.project).resolve()
+    project_label = Path(project).resolve()
     print(f"\naurora check-delivery [{args.level}] - {project_label}\n{'-' * 62}")
 
     if args.verbose:
@@ -400,9 +945,12 @@ def main() -> None:
 
     total = len(gated)
     failed_count = len(failures)
-    best = highest_level_passed(results)
+    best = highest_level_passed(results, args.level)
     print(f"{'-' * 62}\n  {total - failed_count}/{total} checks passed at level '{args.level}'")
-    print(f"  Highest conformance level reached: {best or 'none (minimal fails)'}")
+    reached = best or "none (minimal fails)"
+    if best == args.level != "strict":
+        reached += f" (checks above '{args.level}' not run)"
+    print(f"  Highest conformance level reached: {reached}")
 
     if passed:
         print(f"\n  DELIVERY APPROVED - passes '{args.level}'\n")
@@ -410,6 +958,9 @@ def main() -> None:
         print(f"\n  DELIVERY BLOCKED - {failed_count} check(s) failed at '{args.level}'")
         print("  Fix the issues above, then re-run check-delivery.py.\n")
 
+    if profile is not None:
+        print_profile(profile)
+
     sys.exit(0 if passed else 1)
 
 
@@ -29,6 +29,21 @@ Intentional exceptions that are NOT flagged:
 Usage:
     python aurora/scripts/lint_ha_syntax.py            # lint whole repo
     python aurora/scripts/lint_ha_syntax.py PATH ...   # lint given files
+    python aurora/scripts/lint_ha_syntax.py --changed-since origin/main
+    python aurora/scripts/lint_ha_syntax.py --no-cache # ignore findings cache
+    python aurora/scripts/lint_ha_syntax.py --jobs 0   # one process per CPU
+    python aurora/scripts/lint_ha_syntax.py --fix PATH ...     # rewrite in place
+    python aurora/scripts/lint_ha_syntax.py --fix --dry-run    # print a diff
+
+--fix rewrites service: -> action:, trigger-list platform: -> trigger:,
+singular block keys -> plural and call-service -> perform-action, touching
+only the offending key or value so comments, quoting, indentation and line
+endings stay as they were. service_template:/data_template: need a human
+and are only reported.
+
+Findings are cached per file under ~/.cache/aurora-lint-ha-syntax, keyed
+by the file's git blob SHA and the linter version, so a run only re-lints
+blobs it has not seen and replays cached findings for the rest.
 
 Exit codes:
     0  clean
@@ -36,10 +51,17 @@ Exit codes:
 """
 from __future__ import annotations
 
+import argparse
+import difflib
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 try:
     import yaml
@@ -67,36 +89,94 @@ SERVICE_EXCLUDE_PARENTS = {
 }
 BARE_KEY_EXCLUDE_PARENTS = {"selector", "fields"}
 
-KEY_RE = re.compile(r"^(\s*)((?:- )*)([A-Za-z_][\w.\-]*):(\s*)(.*)$")
+# A key line: leading indent and list dashes (the key's column), the key,
+# and its value up to any comment.
+KEY_RE = re.compile(r"(\s*(?:- )*)([A-Za-z_][\w.\-]*):\s*([^#]*)")
+MAX_FIX_PASSES = 5
+SERVICE_VALUE_RE = re.compile(r"[a-z_]+\.[a-z_0-9]+")
 FENCE_OPEN_RE = re.compile(r"^\s*```(\w*)")
 LEGACY_MARKER_RE = re.compile(r"#.*\b(old|deprecated|legacy)\b", re.I)
 MODERN_MARKER_RE = re.compile(r"#.*\b(new|current|correct|modern)\b", re.I)
 
 
-class _LooseLoader(yaml.SafeLoader):
+class Rule(NamedTuple):
+    """One legacy-syntax rule, looked up by key in LEGACY_RULES."""
+    message: str  # formatted with key= and value= (comment stripped)
+    value: Callable[[str], object] | None = None  # must be truthy to fire
+    only_under: frozenset[str] | None = None  # parent keys it is limited to
+    not_under: frozenset[str] = frozenset()  # parent keys it never fires under
+    fix_key: str | None = None  # --fix: new key, formatted with key=
+    fix_value: str | None = None  # --fix: new value
+
+
+_BARE_BLOCK_KEY = Rule("use plural '{key}s:' for automation block keys",
+                       value=lambda v: not v, not_under=frozenset(BARE_KEY_EXCLUDE_PARENTS),
+                       fix_key="{key}s")
+_TEMPLATE_KEY = Rule("'{key}:' is deprecated, template inside action:/data:")
+
+# key -> rules tried in order; the first that applies is reported.
+LEGACY_RULES: dict[str, tuple[Rule, ...]] = {
+    "action": (
+        Rule("use 'perform-action' instead of 'call-service'", value="call-service".__eq__,
+             fix_value="perform-action"),
+        _BARE_BLOCK_KEY,
+    ),
+    "service": (
+        Rule("use 'action:' instead of 'service:' ({value})", value=SERVICE_VALUE_RE.match,
+             not_under=frozenset(SERVICE_EXCLUDE_PARENTS), fix_key="action"),
+    ),
+    "service_template": (_TEMPLATE_KEY,),
+    "data_template": (_TEMPLATE_KEY,),
+    "platform": (
+        Rule("use 'trigger:' instead of 'platform:' in trigger lists",
+             only_under=frozenset(TRIGGER_PARENTS), fix_key="trigger"),
+    ),
+    "trigger": (_BARE_BLOCK_KEY,),
+    "condition": (_BARE_BLOCK_KEY,),
+}
+
+
+# libyaml's C parser is several times faster than the pure-Python one; fall
+# back transparently when PyYAML was built without it.
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _LooseLoader(_BaseLoader):
     """SafeLoader that tolerates HA tags such as !secret and !input."""
 
 
 _LooseLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
 
+# Parse outcome per fence body (None = parses, else the error line), keyed
+# by content hash: docs repeat the same snippet many times, and each
+# distinct body only needs parsing once per process.
+_fence_memo: dict[bytes, str | None] = {}
 
-def lint_yaml_lines(lines, path, offset=0):
-    """Return findings for one YAML block. offset is 0-based line of block start."""
-    findings = []
+
+def scan_yaml_lines(lines):
+    """Yield (line index, rule, key, value, KEY_RE match) per legacy finding.
+
+    One pass tracks indentation, the parent key stack and Old/New comment
+    sections together: each line gets a single KEY_RE match, the marker
+    patterns only run on lines with a comment, and only keys listed in
+    LEGACY_RULES have their value looked at.
+    """
     stack = []  # (column, key)
     in_legacy_section = False
+    match_key = KEY_RE.match
 
     for i, line in enumerate(lines):
-        if LEGACY_MARKER_RE.search(line):
-            in_legacy_section = True
-        elif MODERN_MARKER_RE.search(line):
-            in_legacy_section = False
-
-        m = KEY_RE.match(line)
-        if not m:
+        if "#" in line:
+            if LEGACY_MARKER_RE.search(line):
+                in_legacy_section = True
+            elif MODERN_MARKER_RE.search(line):
+                in_legacy_section = False
+
+        m = match_key(line)
+        if m is None:
             continue
-        indent, dashes, key, _sep, value = m.groups()
-        col = len(indent) + len(dashes)
+        lead, key, value = m.groups()
+        col = len(lead)
         while stack and stack[-1][0] >= col:
             stack.pop()
         parent = stack[-1][1] if stack else None
@@ -104,23 +184,52 @@ def lint_yaml_lines(lines, path, offset=0):
 
         if in_legacy_section:
             continue
-        value_nc = value.split("#", 1)[0].strip() if value else ""
-        where = f"{path}:{offset + i + 1}"
-
-        if key == "action" and value_nc == "call-service":
-            findings.append(f"{where}: use 'perform-action' instead of 'call-service'")
-        elif (key == "service" and parent not in SERVICE_EXCLUDE_PARENTS
-              and re.match(r"^[a-z_]+\.[a-z_0-9]+", value_nc)):
-            findings.append(f"{where}: use 'action:' instead of 'service:' ({value_nc})")
-        elif key in ("service_template", "data_template"):
-            findings.append(f"{where}: '{key}:' is deprecated, template inside action:/data:")
-        elif key == "platform" and parent in TRIGGER_PARENTS:
-            findings.append(f"{where}: use 'trigger:' instead of 'platform:' in trigger lists")
-        elif (key in ("trigger", "condition", "action") and not value_nc
-              and parent not in BARE_KEY_EXCLUDE_PARENTS):
-            findings.append(f"{where}: use plural '{key}s:' for automation block keys")
+        rules = LEGACY_RULES.get(key)
+        if rules is None:
+            continue
+        value = value.strip()
+        for rule in rules:
+            if ((rule.only_under is None or parent in rule.only_under)
+                    and parent not in rule.not_under
+                    and (rule.value is None or rule.value(value))):
+                yield i, rule, key, value, m
+                break
 
-    return findings
+
+def lint_yaml_lines(lines, path, offset=0):
+    """Return findings for one YAML block. offset is 0-based line of block start."""
+    return [f"{path}:{offset + i + 1}: {rule.message.format(key=key, value=value)}"
+            for i, rule, key, value, _m in scan_yaml_lines(lines)]
+
+
+def fix_yaml_lines(lines):
+    """Rewrite fixable findings in one YAML block in place; return the count.
+
+    Only the offending key or value is replaced, so everything around it
+    (indent, dashes, quoting, comments, a trailing \\r) is kept. Parents
+    are resolved on the lines as they were at the start of a pass, so a
+    singular trigger: and the platform: entries under it are fixed
+    together. A rename can expose a finding below it (a nested list under
+    a platform: that is now a trigger:), so passes repeat until one fixes
+    nothing.
+    """
+    fixed = 0
+    for _ in range(MAX_FIX_PASSES):
+        applied = 0
+        for i, rule, key, value, m in list(scan_yaml_lines(lines)):
+            line = lines[i]
+            if rule.fix_key is not None:
+                lines[i] = line[:m.start(2)] + rule.fix_key.format(key=key) + line[m.end(2):]
+            elif rule.fix_value is not None:
+                start = m.start(3)
+                lines[i] = line[:start] + rule.fix_value + line[start + len(value):]
+            else:
+                continue
+            applied += 1
+        if not applied:
+            break
+        fixed += applied
+    return fixed
 
 
 def iter_yaml_fences(text):
@@ -138,24 +247,41 @@ def iter_yaml_fences(text):
             block.append(line)
 
 
+def fence_error(body):
+    """The first line of the YAML error for a fence body, or None if it parses."""
+    key = hashlib.sha1(body.encode("utf-8", "surrogatepass")).digest()
+    if key not in _fence_memo:
+        try:
+            for _ in yaml.load_all(body, Loader=_LooseLoader):
+                pass
+            _fence_memo[key] = None
+        except yaml.YAMLError as exc:
+            _fence_memo[key] = str(exc).split("\n")[0][:100]
+    return _fence_memo[key]
+
+
 def check_fence_parses(block_lines, path, start):
-    try:
-        list(yaml.load_all("\n".join(block_lines), Loader=_LooseLoader))
+    msg = fence_error("\n".join(block_lines))
+    if msg is None:
         return []
-    except yaml.YAMLError as exc:
-        msg = str(exc).split("\n")[0][:100]
-        return [f"{path}:{start + 1}: yaml fence does not parse ({msg}) "
-                "- fix it or relabel the fence as jinja2/text"]
+    return [f"{path}:{start + 1}: yaml fence does not parse ({msg}) "
+            "- fix it or relabel the fence as jinja2/text"]
+
+
+def skips_legacy(rel: str) -> bool:
+    """Whether the legacy-syntax rules are off for this file (see module doc)."""
+    if SKIP_LEGACY_FILE.search(rel) or SKIP_LEGACY_TREE.match(rel):
+        return True
+    return (rel.endswith((".yaml", ".yml")) and rel.startswith("examples")
+            and not EXAMPLES_HA_FILE.match(rel))
 
 
 def lint_file(path: Path, rel: str):
     findings = []
     text = path.read_text(encoding="utf-8")
-    skip_legacy = bool(SKIP_LEGACY_FILE.search(rel) or SKIP_LEGACY_TREE.match(rel))
+    skip_legacy = skips_legacy(rel)
 
     if rel.endswith((".yaml", ".yml")):
-        if rel.startswith("examples") and not EXAMPLES_HA_FILE.match(rel):
-            skip_legacy = True
         if not skip_legacy:
             findings += lint_yaml_lines(text.split("\n"), rel)
         return findings
@@ -169,27 +295,259 @@ def lint_file(path: Path, rel: str):
     return findings
 
 
+def fix_text(text: str, rel: str):
+    """Return (fixed text, number of fixes) for one file's contents."""
+    if skips_legacy(rel):
+        return text, 0
+    lines = text.split("\n")
+    if rel.endswith((".yaml", ".yml")):
+        fixed = fix_yaml_lines(lines)
+        return "\n".join(lines), fixed
+
+    fixed = 0
+    for start, block, info in iter_yaml_fences(text):
+        if info not in ("yaml", "yml"):
+            continue
+        count = fix_yaml_lines(block)
+        if count:
+            lines[start:start + len(block)] = block
+            fixed += count
+    return "\n".join(lines), fixed
+
+
+def fix_files(targets, dry_run=False):
+    """Apply --fix to each file; return the paths that changed.
+
+    Each file is read once, fixed in memory and written once (atomically).
+    Files are handled as bytes decoded to str without newline translation,
+    so CRLF files stay CRLF. With dry_run nothing is written and a unified
+    diff is printed instead.
+    """
+    changed = []
+    for rel in targets:
+        path = REPO_ROOT / rel
+        original = path.read_bytes().decode("utf-8")
+        text, count = fix_text(original, rel)
+        if not count:
+            continue
+        changed.append(rel)
+        if dry_run:
+            sys.stdout.writelines(difflib.unified_diff(
+                original.splitlines(keepends=True), text.splitlines(keepends=True),
+                fromfile=f"a/{rel}", tofile=f"b/{rel}",
+            ))
+            continue
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(text.encode("utf-8"))
+        os.replace(tmp, path)
+    return changed
+
+
+LINT_PATTERNS = ["*.md", "*.yaml", "*.yml"]
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], capture_output=True, text=True, cwd=REPO_ROOT, check=True,
+    ).stdout
+
+
+def _linted(rel):
+    return rel and not rel.startswith("graphify-out")
+
+
+def blob_sha(data: bytes) -> str:
+    """The git blob SHA of data, as `git hash-object` computes it."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def tracked_blobs():
+    """{path: blob SHA} for every tracked file the linter covers.
+
+    SHAs come from the index in one `git ls-files --stage` call; files
+    edited in the working tree since they were staged are re-hashed so the
+    SHA always matches what is on disk.
+    """
+    blobs = {}
+    for line in _git("ls-files", "--stage", "-z", "--", *LINT_PATTERNS).split("\0"):
+        if "\t" not in line:
+            continue
+        meta, rel = line.split("\t", 1)
+        if _linted(rel):
+            blobs[rel] = meta.split()[1]
+    for rel in _git("diff", "--name-only", "-z", "--", *LINT_PATTERNS).split("\0"):
+        if rel in blobs:
+            try:
+                blobs[rel] = blob_sha((REPO_ROOT / rel).read_bytes())
+            except OSError:
+                del blobs[rel]  # deleted in the working tree
+    return blobs
+
+
 def tracked_files():
-    out = subprocess.run(
-        ["git", "ls-files", "*.md", "*.yaml", "*.yml"],
-        capture_output=True, text=True, cwd=REPO_ROOT, check=True,
-    ).stdout.split("\n")
-    return [f for f in out if f and not f.startswith("graphify-out")]
+    return list(tracked_blobs())
+
+
+def changed_files(ref):
+    """Linted paths that differ between ref and the working tree."""
+    out = _git("diff", "--name-only", "-z", "--diff-filter=d", ref, "--", *LINT_PATTERNS)
+    return [rel for rel in out.split("\0") if _linted(rel)]
+
+
+def linter_version():
+    """Any change to this script invalidates every cached finding."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aurora-lint-ha-syntax"
+
+
+class FindingsCache:
+    """Findings per file, keyed by path and git blob SHA.
+
+    One JSON file per checkout. The path is part of the key because the
+    exception rules (and every message) depend on where a file lives.
+    Entries from another linter version are dropped on load; a whole-repo
+    run keeps only the entries it used, so stale blobs do not pile up.
+    """
+
+    def __init__(self, cache_dir: Path):
+        name = hashlib.sha256(str(REPO_ROOT).encode()).hexdigest()[:16]
+        self.path = Path(cache_dir) / f"{name}.json"
+        self.version = linter_version()
+        self.entries = {}
+        self.used = {}
+        self.hits = 0
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.version:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def get(self, rel, sha):
+        findings = self.entries.get(f"{sha}:{rel}")
+        if findings is not None:
+            self.hits += 1
+            self.used[f"{sha}:{rel}"] = findings
+        return findings
+
+    def put(self, rel, sha, findings):
+        self.used[f"{sha}:{rel}"] = findings
+
+    def save(self, prune=False):
+        entries = self.used if prune else {**self.entries, **self.used}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "entries": entries}),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # a read-only cache dir must never fail the lint
+
+
+def _lint_job(job):
+    """Process-pool entry point (must be a top-level function to pickle)."""
+    return lint_file(*job)
+
+
+def lint_all(targets, jobs=1):
+    """Yield findings per target, in order; sharded over processes if jobs > 1."""
+    if jobs <= 1 or len(targets) <= 1:
+        for rel in targets:
+            yield lint_file(REPO_ROOT / rel, rel)
+        return
+    workers = min(jobs, len(targets))
+    # Batches keep per-file IPC small; each worker keeps its own fence memo.
+    chunksize = max(1, len(targets) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_lint_job, [(REPO_ROOT / rel, rel) for rel in targets],
+                            chunksize=chunksize)
+
+
+def iter_findings(targets, blobs, cache, jobs=1):
+    """Yield findings per target, in order, replaying cached blobs.
+
+    Only cache misses are linted (and reach the pool with jobs > 1).
+    """
+    if cache is None:
+        yield from lint_all(targets, jobs)
+        return
+    shas = [blobs.get(rel) or blob_sha((REPO_ROOT / rel).read_bytes()) for rel in targets]
+    cached = [cache.get(rel, sha) for rel, sha in zip(targets, shas)]
+    fresh = lint_all([rel for rel, hit in zip(targets, cached) if hit is None], jobs)
+    for rel, sha, hit in zip(targets, shas, cached):
+        if hit is None:
+            hit = next(fresh)
+            cache.put(rel, sha, hit)
+        yield hit
 
 
 def main(argv):
-    targets = argv or tracked_files()
-    findings = []
+    parser = argparse.ArgumentParser(
+        description="Guard against legacy Home Assistant syntax and broken yaml fences",
+    )
+    parser.add_argument("paths", nargs="*", help="Files to lint (default: every tracked file)")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="Only lint files that differ between REF and the working tree")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="Findings cache directory (default: ~/.cache/aurora-lint-ha-syntax)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Lint every file from scratch and leave the cache untouched")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Lint files in N worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument("--fix", action="store_true",
+                        help="Rewrite fixable legacy syntax in place, then re-lint the fixed files")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="With --fix: print a unified diff instead of writing")
+    args = parser.parse_args(argv)
+    if args.dry_run and not args.fix:
+        parser.error("--dry-run only applies to --fix")
+
+    cache = None if args.no_cache else FindingsCache(args.cache_dir or default_cache_dir())
+    blobs = {}
+    if cache is not None or not (args.paths or args.changed_since):
+        try:
+            blobs = tracked_blobs()
+        except (OSError, subprocess.CalledProcessError):
+            blobs = {}  # not a git checkout: hash file contents instead
+    if args.paths:
+        targets = args.paths
+    elif args.changed_since:
+        targets = changed_files(args.changed_since)
+    else:
+        targets = list(blobs)
+
+    lintable = []
     for rel in targets:
         rel = rel.replace("\\", "/")
-        path = REPO_ROOT / rel
-        if not path.is_file() or not rel.endswith((".md", ".yaml", ".yml")):
-            continue
-        findings += lint_file(path, rel)
+        if (REPO_ROOT / rel).is_file() and rel.endswith((".md", ".yaml", ".yml")):
+            lintable.append(rel)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    per_file = dict(zip(lintable, iter_findings(lintable, blobs, cache, jobs)))
+
+    if args.fix:
+        fixed = fix_files([rel for rel, found in per_file.items() if found], args.dry_run)
+        if fixed and not args.dry_run:
+            # Only the rewritten files can have changed; their index SHAs are stale.
+            for rel in fixed:
+                blobs.pop(rel, None)
+            per_file.update(zip(fixed, iter_findings(fixed, blobs, cache, jobs)))
+        print(f"lint_ha_syntax: {'would fix' if args.dry_run else 'fixed'} {len(fixed)} file(s)")
+
+    findings = [f for found in per_file.values() for f in found]
+
+    if cache is not None:
+        cache.save(prune=not (args.paths or args.changed_since))
 
     for f in findings:
         print(f)
-    print(f"lint_ha_syntax: {len(findings)} finding(s) in {len(targets)} file(s)")
+    cached = f" ({cache.hits} cached)" if cache is not None and cache.hits else ""
+    print(f"lint_ha_syntax: {len(findings)} finding(s) in {len(targets)} file(s){cached}")
     return 1 if findings else 0
 
 
@@ -23,6 +23,7 @@ or out of stock; it is not an error.
 Usage:
     python aurora/scripts/sync_jlcpcb_status.py --csv <path>     # local CSV
     python aurora/scripts/sync_jlcpcb_status.py --download       # fetch from CDFER
+    python aurora/scripts/sync_jlcpcb_status.py --download --no-cache  # refetch
     python aurora/scripts/sync_jlcpcb_status.py --stock          # refresh stock from parts API
     python aurora/scripts/sync_jlcpcb_status.py --download --stock  # both
 
@@ -31,6 +32,23 @@ Library type and MOQ come from the CDFER CSV. Coarse stock status
 API via --stock; it is coarse on purpose so the catalog does not churn
 on every sync.
 
+--download revalidates against a local cache (default
+~/.cache/aurora-jlcpcb, override with --cache-dir): the ETag and
+Last-Modified of the last download go out as If-None-Match and
+If-Modified-Since, and on 304 the pre-parsed index from that download
+(a pickled lcsc -> (library type, MOQ) map) is reused, so most runs
+download and parse nothing. A changed CSV is parsed straight off the
+response stream into the map; the raw text is never held in memory.
+
+--stock looks up every profile's part up front through StockFetcher: a
+small pool of keep-alive connections (--concurrency, default 4) shared by
+worker threads, a token-bucket rate limit (--rate requests/s, default 4),
+and retries with exponential backoff on network errors, 429 and 5xx
+(--retries, default 3). --stock-batch N asks for N codes per call; codes
+a multi-code answer leaves out are re-asked one by one, so a search API
+that does not OR its keywords only costs extra calls, never a wrong
+out_of_stock.
+
 Exit codes:
     0  ran (whether or not anything changed); prints a summary
     2  CSV missing/unreadable
@@ -40,10 +58,20 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime
+import http.client
 import io
 import json
+import os
+import pickle
+import queue
+import random
 import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -55,18 +83,98 @@ CSV_URL = ("https://raw.githubusercontent.com/CDFER/jlcpcb-parts-database/"
            "main/scraped/assembly-details.csv")
 
 
-def load_status(csv_text: str) -> dict[str, dict]:
-    """Map numeric lcsc id -> {library_type, moq}."""
+def load_status(source) -> dict[str, tuple[str, int | None]]:
+    """Map numeric lcsc id -> (library_type, moq).
+
+    source is the CSV text or an open text stream; a stream is parsed row
+    by row as it is read. Tuples with interned library types keep the map
+    small, which matters for the pickled index.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    reader = csv.reader(source)
+    header = next(reader, [])
+    try:
+        lcsc, lib, moq = (header.index(name) for name in
+                          ("lcsc", "Component Library Type", "Min Order Qty"))
+    except ValueError as exc:
+        raise ValueError(f"not a CDFER assembly-details CSV ({exc})") from None
     table = {}
-    for row in csv.DictReader(io.StringIO(csv_text)):
-        table[row["lcsc"].strip()] = {
-            "library_type": row["Component Library Type"].strip(),
-            "moq": int(row["Min Order Qty"]) if row["Min Order Qty"].strip().isdigit() else None,
-        }
+    for row in reader:
+        if not row:
+            continue
+        qty = row[moq].strip()
+        table[row[lcsc].strip()] = (sys.intern(row[lib].strip()), int(qty) if qty.isdigit() else None)
     return table
 
 
-def sync_profile(path: Path, status: dict[str, dict], today: str) -> str:
+INDEX_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aurora-jlcpcb"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def download_status(url: str = CSV_URL, cache_dir: Path | None = None,
+                    timeout: float = 60) -> tuple[dict[str, tuple[str, int | None]], str]:
+    """Fetch and parse the CDFER CSV, revalidating a cached index first.
+
+    Returns (status map, "downloaded" | "not modified"). With a cache_dir
+    the request is conditional on the cached ETag / Last-Modified, a 304
+    loads the cached index, and a 200 replaces the index and validators.
+    Without one every call downloads.
+    """
+    meta, index_path, meta_path = {}, None, None
+    if cache_dir is not None:
+        index_path = cache_dir / "assembly-details.index.pickle"
+        meta_path = cache_dir / "assembly-details.meta.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("url") != url or meta.get("version") != INDEX_VERSION or not index_path.is_file():
+            meta = {}
+
+    headers = {"User-Agent": "aurora-sync-jlcpcb"}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers),
+                                    timeout=timeout) as resp:
+            status = load_status(io.TextIOWrapper(resp, encoding="utf-8", newline=""))
+            validators = {"etag": resp.headers.get("ETag"),
+                          "last_modified": resp.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or not meta:
+            raise
+        try:
+            with open(index_path, "rb") as f:
+                return pickle.load(f), "not modified"
+        except (OSError, pickle.UnpicklingError, EOFError):
+            meta_path.unlink(missing_ok=True)  # unusable: next run downloads afresh
+            raise
+
+    if cache_dir is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(index_path, pickle.dumps(status, protocol=pickle.HIGHEST_PROTOCOL))
+            _write_atomic(meta_path, json.dumps(
+                {"version": INDEX_VERSION, "url": url, **validators}).encode())
+        except OSError:
+            pass  # a read-only cache dir must never fail the sync
+    return status, "downloaded"
+
+
+def sync_profile(path: Path, status: dict[str, tuple[str, int | None]], today: str) -> str:
     doc = json.loads(path.read_text(encoding="utf-8"))
     sourcing = doc.get("sourcing")
     if not sourcing or sourcing.get("lcsc", "TBD") == "TBD":
@@ -76,9 +184,10 @@ def sync_profile(path: Path, status: dict[str, dict], today: str) -> str:
     entry = status.get(numeric)
     new = dict(sourcing)
     if entry:
-        new["jlcpcb_library_type"] = entry["library_type"]
-        if entry["moq"]:
-            new["jlcpcb_moq"] = entry["moq"]
+        library_type, moq = entry
+        new["jlcpcb_library_type"] = library_type
+        if moq:
+            new["jlcpcb_moq"] = moq
     else:
         # The CDFER CSV only carries the basic/preferred subset. A part
         # already known to be in the extended library stays "expand";
@@ -110,31 +219,211 @@ def stock_status(count: int) -> str:
     return "in_stock"
 
 
+class FetchError(Exception):
+    """A parts-API request that failed for good (after any retries)."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, up to burst saved."""
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.stamp = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return  # unlimited
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class ConnectionPool:
+    """Up to size keep-alive HTTP(S) connections to one host.
+
+    A connection is checked out for one request/response at a time and put
+    back once the response has been read in full, so the next request on it
+    skips the TCP and TLS handshakes. A connection that errors is closed
+    and dropped; a fresh one replaces it on the next checkout.
+    """
+
+    def __init__(self, url: str, size: int, timeout: float = 30):
+        parts = urllib.parse.urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path + (f"?{parts.query}" if parts.query else "")
+        self.timeout = timeout
+        self.idle: queue.LifoQueue = queue.LifoQueue()
+        self.slots = threading.Semaphore(size)
+        self.opened = 0  # connections created, for tests and diagnostics
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        self.opened += 1
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def post(self, body: bytes, headers: dict) -> tuple[int, dict, bytes]:
+        """POST body to the pool's URL; return (status, headers, payload)."""
+        with self.slots:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                conn.request("POST", self.path, body=body, headers=headers)
+                resp = conn.getresponse()
+                payload = resp.read()
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self.idle.put(conn)
+            return resp.status, dict(resp.getheaders()), payload
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class StockFetcher:
+    """Concurrent, rate-limited stock lookups against the JLCPCB parts API.
+
+    fetch() returns {lcsc: stock count, None if the API does not list the
+    part, or a FetchError}. Requests go out from `concurrency` threads over
+    a ConnectionPool of the same size, each after taking a token from the
+    rate limiter (retries included). Transient failures are retried with
+    exponential backoff plus jitter, honouring Retry-After on 429/503.
+    """
+
+    def __init__(self, url: str = PARTS_API, concurrency: int = 4, rate: float = 4.0,
+                 retries: int = 3, backoff: float = 1.0, batch: int = 1, timeout: float = 30):
+        self.concurrency = max(1, concurrency)
+        self.pool = ConnectionPool(url, self.concurrency, timeout)
+        self.bucket = TokenBucket(rate, burst=self.concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.batch = max(1, batch)
+        self.requests = 0
+
+    def _post(self, codes: list[str]) -> dict:
+        body = json.dumps({"keyword": " ".join(codes), "currentPage": 1,
+                           "pageSize": max(3, 3 * len(codes))}).encode()
+        headers = {"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"}
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self.requests += 1
+            delay = self.backoff * 2 ** attempt * (1 + random.random() / 2)
+            try:
+                status, resp_headers, payload = self.pool.post(body, headers)
+            except (OSError, http.client.HTTPException) as exc:
+                error: Exception = exc
+            else:
+                if status == 200:
+                    try:
+                        return json.loads(payload.decode("utf-8"))
+                    except ValueError as exc:
+                        raise FetchError(f"invalid JSON from parts API: {exc}") from None
+                error = FetchError(f"HTTP {status}")
+                if status not in RETRY_STATUS:
+                    raise error
+                retry_after = resp_headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+            if attempt < self.retries:
+                time.sleep(delay)
+        raise FetchError(f"{type(error).__name__}: {error}")
+
+    def _lookup(self, codes: list[str]) -> dict:
+        try:
+            data = self._post(codes)
+        except FetchError as exc:
+            return {code: exc for code in codes}
+        items = ((data.get("data") or {}).get("componentPageInfo") or {}).get("list") or []
+        found = {}
+        for it in items:
+            code = it.get("componentCode")
+            if code in codes and code not in found:
+                found[code] = int(it.get("stockCount") or 0)
+        if len(codes) == 1:
+            return {codes[0]: found.get(codes[0])}
+        # The API may not return every code of a multi-code query: ask
+        # again one at a time rather than call the missing ones unlisted.
+        for code in codes:
+            if code not in found:
+                found.update(self._lookup([code]))
+        return found
+
+    def fetch(self, codes) -> dict:
+        codes = list(dict.fromkeys(codes))
+        batches = [codes[i:i + self.batch] for i in range(0, len(codes), self.batch)]
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for found in executor.map(self._lookup, batches):
+                results.update(found)
+        return results
+
+    def close(self) -> None:
+        self.pool.close()
+
+
 def fetch_stock(lcsc: str) -> int | None:
     """Live stock count for an LCSC code from the JLCPCB parts API, or None if
     the part is not returned. Network call; used only by --stock."""
-    body = json.dumps({"keyword": lcsc, "currentPage": 1, "pageSize": 3}).encode()
-    req = urllib.request.Request(
-        PARTS_API, data=body, method="POST",
-        headers={"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"},
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
-    items = ((data.get("data") or {}).get("componentPageInfo") or {}).get("list") or []
-    for it in items:
-        if it.get("componentCode") == lcsc:
-            return int(it.get("stockCount") or 0)
-    return None
-
-
-def sync_stock_profile(path: Path, today: str) -> str:
-    """Refresh jlcpcb_stock_status for one profile from the live parts API."""
+    fetcher = StockFetcher(concurrency=1, retries=0)
+    try:
+        result = fetcher.fetch([lcsc])[lcsc]
+    finally:
+        fetcher.close()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def profile_lcsc(path: Path) -> str | None:
+    """The verified LCSC code a profile declares, or None (missing / TBD)."""
+    sourcing = json.loads(path.read_text(encoding="utf-8")).get("sourcing")
+    if not sourcing or sourcing.get("lcsc", "TBD") == "TBD":
+        return None
+    return sourcing["lcsc"]
+
+
+def sync_stock_profile(path: Path, today: str, stock: dict | None = None) -> str:
+    """Refresh jlcpcb_stock_status for one profile from the live parts API.
+
+    stock is StockFetcher.fetch() output covering this profile's part; the
+    part is fetched on its own when it is not given."""
     doc = json.loads(path.read_text(encoding="utf-8"))
     sourcing = doc.get("sourcing")
     if not sourcing or sourcing.get("lcsc", "TBD") == "TBD":
         return "skipped (no verified lcsc)"
     try:
-        count = fetch_stock(sourcing["lcsc"])
+        if stock is None:
+            count = fetch_stock(sourcing["lcsc"])
+        else:
+            count = stock[sourcing["lcsc"]]
+            if isinstance(count, Exception):
+                raise count
     except Exception as exc:
         return f"error ({type(exc).__name__})"
     new = dict(sourcing)
@@ -152,8 +441,22 @@ def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--csv", type=Path, help="local assembly-details.csv (library type + MOQ)")
     ap.add_argument("--download", action="store_true", help=f"fetch {CSV_URL} (library type + MOQ)")
+    ap.add_argument("--cache-dir", type=Path, default=None,
+                    help=f"--download: cache for the CSV index (default: {default_cache_dir()})")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="--download: fetch the whole CSV, bypassing the cache")
     ap.add_argument("--stock", action="store_true",
                     help="refresh coarse stock status from the live JLCPCB parts API")
+    ap.add_argument("--concurrency", type=int, default=4,
+                    help="--stock: parallel requests / keep-alive connections (default: 4)")
+    ap.add_argument("--rate", type=float, default=4.0,
+                    help="--stock: max requests per second, 0 = unlimited (default: 4)")
+    ap.add_argument("--retries", type=int, default=3,
+                    help="--stock: retries per request on errors, 429 and 5xx (default: 3)")
+    ap.add_argument("--stock-batch", type=int, default=1, metavar="N",
+                    help="--stock: LCSC codes per API call (default: 1)")
+    ap.add_argument("--parts-api", default=PARTS_API, metavar="URL",
+                    help="--stock: parts API endpoint (default: the JLCPCB one)")
     args = ap.parse_args(argv)
 
     if not (args.csv or args.download or args.stock):
@@ -165,28 +468,40 @@ def main(argv=None) -> int:
     if args.csv or args.download:
         try:
             if args.download:
-                with urllib.request.urlopen(CSV_URL, timeout=60) as resp:
-                    csv_text = resp.read().decode("utf-8")
+                cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir())
+                status, how = download_status(CSV_URL, cache_dir)
+                print(f"CSV {how}: {len(status)} parts")
             else:
-                csv_text = args.csv.read_text(encoding="utf-8")
+                with open(args.csv, encoding="utf-8", newline="") as f:
+                    status = load_status(f)
         except Exception as exc:
             print(f"FAIL cannot load CSV: {exc}")
             return 2
-        status = load_status(csv_text)
+
+    paths = [path for d in PROFILE_DIRS if d.is_dir() for path in sorted(d.rglob("*.json"))]
+
+    stock = None
+    if args.stock:
+        fetcher = StockFetcher(args.parts_api, concurrency=args.concurrency, rate=args.rate,
+                               retries=args.retries, batch=args.stock_batch)
+        started = time.perf_counter()
+        try:
+            stock = fetcher.fetch(code for code in map(profile_lcsc, paths) if code)
+        finally:
+            fetcher.close()
+        print(f"fetched stock for {len(stock)} part(s) in {fetcher.requests} request(s) "
+              f"over {fetcher.pool.opened} connection(s), {time.perf_counter() - started:.1f}s")
 
     updated = 0
-    for d in PROFILE_DIRS:
-        if not d.is_dir():
-            continue
-        for path in sorted(d.rglob("*.json")):
-            if status is not None:
-                r = sync_profile(path, status, today)
-                print(f"{path.relative_to(REPO_ROOT)}: {r}")
-                updated += r.startswith("updated")
-            if args.stock:
-                r = sync_stock_profile(path, today)
-                print(f"{path.relative_to(REPO_ROOT)} [stock]: {r}")
-                updated += r.startswith("updated")
+    for path in paths:
+        if status is not None:
+            r = sync_profile(path, status, today)
+            print(f"{path.relative_to(REPO_ROOT)}: {r}")
+            updated += r.startswith("updated")
+        if stock is not None:
+            r = sync_stock_profile(path, today, stock)
+            print(f"{path.relative_to(REPO_ROOT)} [stock]: {r}")
+            updated += r.startswith("updated")
     extra = f", {len(status)} parts in CSV" if status is not None else ""
     print(f"sync_jlcpcb_status: {updated} field-set(s) updated{extra}")
     return 0
@@ -17,10 +17,40 @@ Netlist checks beyond the schema:
     6. components not connected to any net, warning
     7. TBD LCSC count reported (informational; production-tier BOM.csv
        needs real part numbers before ordering assembly)
+    8. nets with only one distinct pin (floating), warning
+    9. a power net merged with a ground net through shared pins, error
+   10. components matched to a profile in aurora/references/components
+       (by LCSC number or component id) with fewer pins connected than the
+       profile needs: its signal pins plus power and ground, warning
+   11. I2C parts on one SDA node that cannot all get distinct addresses
+       from their profiles' address options, error; parts sharing a
+       default address, warning
+   12. 5 V on a signal node (a pull-up to a 5 V rail that no resistor to
+       ground or a lower rail divides down, or a 5 V-logic part powered
+       from one) that also reaches a non-5 V-tolerant part or a GPIO of a
+       board whose GPIO is not 5 V tolerant, error
+
+The netlist checks run on a connectivity graph (see Netlist): components,
+pins and nets are interned to integer indexes once, and nets that share a
+pin are merged with a union-find, so every check is linear in the number
+of pins and schematics with tens of thousands of pins stay fast.
+
+Checks 10-12 cross-reference the component, expander and board profiles
+through a Catalog index keyed by LCSC number, component id and board id.
+The index is built once per run and cached in
+$XDG_CACHE_HOME/aurora-schematic/catalog.json, keyed by every profile's
+path, mtime and size, so later runs stat the catalog instead of parsing it.
 
 Usage:
     python aurora/scripts/validate_schematic.py <project>/hardware/schematic.json
     python aurora/scripts/validate_schematic.py --quiet <path>
+    python aurora/scripts/validate_schematic.py rev-a/schematic.json rev-b/schematic.json
+    python aurora/scripts/validate_schematic.py --no-cache <path>   # skip the on-disk catalog index
+
+The schema is loaded and compiled once per run and shared by every file.
+When fastjsonschema is installed it generates a fast validator for the
+common all-valid case; jsonschema still produces the full error list for
+a file that fails.
 
 Exit codes:
     0  valid (warnings allowed)
@@ -29,9 +59,13 @@ Exit codes:
 """
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import re
 import sys
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -40,49 +74,500 @@ except ImportError:  # pragma: no cover
     print("jsonschema is required: pip install -r requirements-dev.txt")
     sys.exit(2)
 
+try:
+    import fastjsonschema
+except ImportError:  # optional: only speeds up the schema pass
+    fastjsonschema = None
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 SCHEMA_PATH = REPO_ROOT / "aurora" / "references" / "schemas" / "schematic.schema.json"
 
+REFERENCES_DIR = REPO_ROOT / "aurora" / "references"
+CATALOG_DIRS = ("components", "expanders", "boards")
+# Bump when the Catalog record layout changes, so cached indexes rebuild.
+CATALOG_VERSION = 1
+
 GROUND_NAMES = {"GND", "GNDA", "AGND", "DGND"}
+# Supply rails by name: 3V3, 5V, +12V, VCC, VDD_3V3, VBAT, VBUS, VIN, VSYS.
+POWER_NET_RE = re.compile(r"^\+?(\d+V\d*|V(?:CC|DD|IN|BAT|BUS|SYS)(?:_?\d+V\d*|\d*))$", re.IGNORECASE)
+RAIL_VOLTS_RE = re.compile(r"(\d+)V(\d*)", re.IGNORECASE)
+FIVE_VOLT_RAIL = 4.5
+I2C_DATA_RE = re.compile(r"SDA", re.IGNORECASE)
+GPIO_PIN_RE = re.compile(r"^(?:GPIO|IO|GP)\d+$", re.IGNORECASE)
+# Pins every profiled part needs besides its signal pins: power and ground.
+SUPPLY_PINS = 2
+
+
+class CompiledSchema:
+    """A schema compiled once: a jsonschema validator, plus a generated
+    fastjsonschema function when that package is available."""
+
+    def __init__(self, schema: dict):
+        self.validator = jsonschema.Draft202012Validator(schema)
+        self.fast = None
+        if fastjsonschema is not None:
+            try:
+                self.fast = fastjsonschema.compile(schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException:
+                pass  # a construct it cannot compile: jsonschema alone
+
+    def errors(self, doc) -> list[str]:
+        """Schema errors for doc, formatted for output; [] when valid."""
+        if self.fast is not None:
+            try:
+                self.fast(doc)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass  # report every error, worded as jsonschema words them
+        return [
+            f"schema: {'/'.join(str(p) for p in e.absolute_path) or '<root>'}: {e.message}"
+            for e in self.validator.iter_errors(doc)
+        ]
+
+
+@lru_cache(maxsize=None)
+def compiled_schema(schema_path: Path = SCHEMA_PATH) -> CompiledSchema:
+    """The CompiledSchema for schema_path, built on first use in this process."""
+    return CompiledSchema(json.loads(schema_path.read_text(encoding="utf-8")))
+
+
+class Netlist:
+    """A schematic's connectivity graph, built in one pass over its nets.
+
+    Components, pins and nets are numbered in document order and related
+    through flat integer lists: pin_comp[p] is the owning component of
+    pin p (-1 when its refdes is undeclared), net_pins[n] the distinct
+    pins of net n, pin_net[p] the first net pin p was seen in. Nets that
+    share a pin are merged with a union-find (path halving, union by
+    size), so find(n) gives the electrical node a net belongs to.
+    """
+
+    def __init__(self, doc: dict):
+        self.refdes = [c["refdes"] for c in doc["components"]]
+        self.comp_index: dict[str, int] = {}
+        for i, ref in enumerate(self.refdes):
+            self.comp_index.setdefault(ref, i)
+        self.net_names = [net["name"] for net in doc["nets"]]
+        self.pin_index: dict[str, int] = {}
+        self.pin_comp: list[int] = []
+        self.pin_net: list[int] = []
+        self.net_pins: list[list[int]] = []
+        self.comp_pins = [0] * len(self.refdes)
+        self.shared_pins: list[int] = []
+        self.parent = list(range(len(self.net_names)))
+        self.size = [1] * len(self.net_names)
+        self.undeclared: list[tuple[int, str]] = []
+        self.conflicts: list[tuple[int, int, str]] = []
+
+        pin_index, pin_comp, pin_net = self.pin_index, self.pin_comp, self.pin_net
+        comp_index, comp_pins = self.comp_index, self.comp_pins
+        for n, net in enumerate(doc["nets"]):
+            ids = []
+            for pin in net["pins"]:
+                p = pin_index.get(pin)
+                if p is None:
+                    p = pin_index[pin] = len(pin_comp)
+                    c = comp_index.get(pin.partition(".")[0], -1)
+                    pin_comp.append(c)
+                    pin_net.append(n)
+                    if c >= 0:
+                        comp_pins[c] += 1
+                elif pin_net[p] != n:
+                    first = pin_net[p]
+                    if self.union(first, n):
+                        self.shared_pins.append(p)
+                    if self.net_names[first] != net["name"]:
+                        self.conflicts.append((first, n, pin))
+                if pin_comp[p] < 0:
+                    self.undeclared.append((n, pin))
+                ids.append(p)
+            self.net_pins.append(list(dict.fromkeys(ids)))
+        self.pin_names = list(pin_index)
+
+    def find(self, n: int) -> int:
+        parent = self.parent
+        while parent[n] != n:
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+        return n
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the nodes of nets a and b; False if they already were one."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+    def nodes(self) -> dict[int, list[int]]:
+        """{root net: [net, ...]} for every electrical node, in net order."""
+        groups: dict[int, list[int]] = {}
+        for n in range(len(self.net_names)):
+            groups.setdefault(self.find(n), []).append(n)
+        return groups
+
+    def pins_by_component(self) -> list[list[int]]:
+        """[pin, ...] per component index, in first-seen order."""
+        pins: list[list[int]] = [[] for _ in self.refdes]
+        for p, c in enumerate(self.pin_comp):
+            if c >= 0:
+                pins[c].append(p)
+        return pins
+
+
+def rail_voltage(name: str) -> float | None:
+    """Volts a power net carries by name (3V3 -> 3.3, +5V -> 5.0, VBUS -> 5.0),
+    None when the name does not say (VCC, VDD, VBAT)."""
+    m = RAIL_VOLTS_RE.search(name)
+    if m:
+        return float(f"{m.group(1)}.{m.group(2) or 0}")
+    return 5.0 if name.upper() == "VBUS" else None
+
+
+def _i2c_addresses(profile: dict) -> list[int]:
+    addresses = []
+    for address in (profile.get("i2c") or {}).get("default_addresses") or []:
+        try:
+            addresses.append(int(address, 16))
+        except (TypeError, ValueError):
+            continue
+    return addresses
+
+
+class Catalog:
+    """Component, expander and board profiles from aurora/references,
+    reduced to what the netlist checks use and indexed for lookup.
+
+    parts maps a lowercase LCSC number, component_id or expander_id to
+    {"id", "pins", "i2c", "tolerates_5v", "drives_5v"}; boards maps a
+    lowercase board_id or esphome board name to {"id", "gpio_5v_tolerant"}.
+    Build it with load_catalog(), which caches it on disk.
+    """
+
+    def __init__(self, parts: dict[str, dict], boards: dict[str, dict]):
+        self.parts = parts
+        self.boards = boards
+
+    @classmethod
+    def build(cls, paths) -> Catalog:
+        parts: dict[str, dict] = {}
+        boards: dict[str, dict] = {}
+        for path in paths:
+            try:
+                profile = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if profile.get("board_id"):
+                record = {
+                    "id": profile["board_id"],
+                    "gpio_5v_tolerant": bool((profile.get("power") or {}).get("gpio_5v_tolerant")),
+                }
+                for key in (profile["board_id"], (profile.get("esphome") or {}).get("board")):
+                    if key:
+                        boards[key.lower()] = record
+                continue
+            part_id = profile.get("component_id") or profile.get("expander_id")
+            if not part_id:
+                continue
+            pin_req = profile.get("pin_requirements") or {}
+            power = profile.get("power") or {}
+            signal = pin_req.get("count")
+            record = {
+                "id": part_id,
+                "pins": signal + SUPPLY_PINS if isinstance(signal, int) else None,
+                "i2c": _i2c_addresses(profile),
+                "tolerates_5v": power.get("tolerates_5v"),
+                "drives_5v": bool(pin_req.get("5v_tolerant_required")),
+            }
+            parts[part_id.lower()] = record
+            lcsc = (profile.get("sourcing") or {}).get("lcsc")
+            if lcsc and lcsc != "TBD":
+                parts[lcsc.lower()] = record
+        return cls(parts, boards)
+
+    def part(self, comp: dict) -> dict | None:
+        """The profile record for a schematic component: by LCSC number,
+        else by value ("BME280", "BME280 breakout") against the part ids."""
+        lcsc = comp.get("lcsc", "").lower()
+        if lcsc in self.parts:
+            return self.parts[lcsc]
+        value = comp["value"].lower()
+        return self.parts.get(value) or self.parts.get(value.split()[0] if value.split() else "")
+
+    def board(self, name: str) -> dict | None:
+        return self.boards.get(name.lower())
+
+
+def catalog_files(references_dir: Path = REFERENCES_DIR) -> list[Path]:
+    return sorted(path for sub in CATALOG_DIRS for path in (references_dir / sub).rglob("*.json"))
+
 
+def catalog_fingerprint(paths, references_dir: Path = REFERENCES_DIR) -> str:
+    """A key over every profile's path, mtime and size: any edit, addition
+    or removal changes it. Costs one stat per profile, no reads."""
+    digest = hashlib.sha1(str(CATALOG_VERSION).encode())
+    for path in paths:
+        st = path.stat()
+        digest.update(f"{path.relative_to(references_dir).as_posix()}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return digest.hexdigest()
 
-def check_netlist(doc: dict) -> tuple[list[str], list[str]]:
-    """Return (errors, warnings) for netlist-level rules."""
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aurora-schematic"
+
+
+@lru_cache(maxsize=None)
+def load_catalog(cache_dir: Path | None = None, references_dir: Path = REFERENCES_DIR) -> Catalog:
+    """The profile Catalog, built once per process.
+
+    With a cache_dir the index is stored there as catalog.json under the
+    profiles' fingerprint and reused while no profile has changed, so a
+    run stats the catalog instead of re-reading and re-parsing it.
+    """
+    paths = catalog_files(references_dir)
+    key = catalog_fingerprint(paths, references_dir)
+    cache_path = Path(cache_dir) / "catalog.json" if cache_dir is not None else None
+    if cache_path is not None:
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if data.get("key") == key:
+                return Catalog(data["parts"], data["boards"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    catalog = Catalog.build(paths)
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"key": key, "parts": catalog.parts, "boards": catalog.boards}),
+                           encoding="utf-8")
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass  # a read-only cache dir must never fail validation
+    return catalog
+
+
+def _assign_addresses(options: list[list[int]]) -> list[int | None]:
+    """One distinct address per device from its options (bipartite
+    matching with augmenting paths); None for a device left without one."""
+    owner: dict[int, int] = {}
+
+    def place(device: int, tried: set[int]) -> bool:
+        for address in options[device]:
+            if address in tried:
+                continue
+            tried.add(address)
+            if address not in owner or place(owner[address], tried):
+                owner[address] = device
+                return True
+        return False
+
+    for device in range(len(options)):
+        place(device, set())
+    assigned: list[int | None] = [None] * len(options)
+    for address, device in owner.items():
+        assigned[device] = address
+    return assigned
+
+
+def check_i2c_addresses(doc: dict, graph: Netlist, catalog: Catalog,
+                        comp_pins: list[list[int]]) -> tuple[list[str], list[str]]:
+    """Address collisions among profiled I2C parts sharing an SDA node.
+
+    Profiles list the addresses a part can be strapped to. When there are
+    not enough distinct addresses for every part on the bus it is an
+    error; parts that merely share a default address get a warning to
+    strap one of them.
+    """
     errors: list[str] = []
     warnings: list[str] = []
+    buses: dict[int, str] = {}
+    for n, name in enumerate(graph.net_names):
+        if I2C_DATA_RE.search(name):
+            buses.setdefault(graph.find(n), name)
+    if not buses:
+        return errors, warnings
+
+    devices: dict[int, list[tuple[str, dict]]] = {}
+    for c, pins in enumerate(comp_pins):
+        record = catalog.part(doc["components"][c]) if pins else None
+        if not record or not record["i2c"]:
+            continue
+        for root in {graph.find(graph.pin_net[p]) for p in pins}:
+            if root in buses:
+                devices.setdefault(root, []).append((graph.refdes[c], record))
+
+    for root, on_bus in devices.items():
+        bus = buses[root]
+        assigned = _assign_addresses([record["i2c"] for _, record in on_bus])
+        stuck = [i for i, address in enumerate(assigned) if address is None]
+        for i in stuck:
+            ref, record = on_bus[i]
+            rivals = [r for r, other in on_bus if r != ref and set(other["i2c"]) & set(record["i2c"])]
+            errors.append(
+                f"I2C bus {bus}: {ref} ({record['id']}) has no free address; "
+                f"{'/'.join(f'0x{a:02X}' for a in record['i2c'])} are all needed by "
+                f"{', '.join(rivals)} (use a second bus or a TCA9548A mux)"
+            )
+        if stuck:
+            continue
+        by_default: dict[int, list[str]] = {}
+        for ref, record in on_bus:
+            by_default.setdefault(record["i2c"][0], []).append(f"{ref} ({record['id']})")
+        for address, refs in by_default.items():
+            if len(refs) > 1:
+                warnings.append(
+                    f"I2C bus {bus}: {' and '.join(refs)} all default to 0x{address:02X}; "
+                    "strap all but one to another address"
+                )
+    return errors, warnings
+
+
+def check_5v_signals(doc: dict, graph: Netlist, catalog: Catalog,
+                     comp_pins: list[list[int]]) -> list[str]:
+    """5 V reaching pins that are not 5 V tolerant.
+
+    A signal node carries 5 V when a resistor ties it to a 5 V rail
+    (pull-up) or a part whose profile drives 5 V logic is powered from
+    one. A node that another resistor also ties to ground or a lower rail
+    is a voltage divider (battery or VBUS sense), not a pull-up. It is an
+    error when a 5 V node also holds an MCU GPIO pin of a board whose GPIO
+    is not 5 V tolerant, or a part whose profile says it does not
+    tolerate 5 V.
+    """
+    rails: dict[int, str] = {}
+    supply: set[int] = set()
+    for n, name in enumerate(graph.net_names):
+        root = graph.find(n)
+        if name in GROUND_NAMES or POWER_NET_RE.match(name):
+            supply.add(root)
+            volts = rail_voltage(name)
+            if volts is not None and volts >= FIVE_VOLT_RAIL:
+                rails.setdefault(root, name)
+    if not rails:
+        return []
 
-    refdes_counts = Counter(c["refdes"] for c in doc["components"])
+    board = catalog.board(doc["project"]["board"]) if doc.get("project") else None
+    sources: dict[int, list[str]] = {}
+    sinks: dict[int, list[str]] = {}
+    pullups: dict[int, list[str]] = {}
+    pulled_low: set[int] = set()
+    for c, pins in enumerate(comp_pins):
+        if not pins:
+            continue
+        ref = graph.refdes[c]
+        roots = [graph.find(graph.pin_net[p]) for p in pins]
+        signal = [(p, root) for p, root in zip(pins, roots) if root not in supply]
+        rail = next((rails[root] for root in roots if root in rails), None)
+        record = catalog.part(doc["components"][c])
+        if ref.rstrip("0123456789") == "R" and len(pins) == 2 and len(signal) == 1:
+            if rail:
+                pullups.setdefault(signal[0][1], []).append(f"pull-up {ref} to {rail}")
+            else:
+                pulled_low.add(signal[0][1])
+        elif rail and record and record["drives_5v"]:
+            for _, root in signal:
+                sources.setdefault(root, []).append(f"{ref} ({record['id']}) on {rail}")
+        for p, root in signal:
+            if record and record["tolerates_5v"] is False:
+                sinks.setdefault(root, []).append(f"{graph.pin_names[p]} ({record['id']})")
+            elif not record and board and not board["gpio_5v_tolerant"] \
+                    and GPIO_PIN_RE.match(graph.pin_names[p].partition(".")[2]):
+                sinks.setdefault(root, []).append(f"{graph.pin_names[p]} (board {board['id']})")
+
+    for root, why in pullups.items():
+        if root not in pulled_low:
+            sources.setdefault(root, []).extend(why)
+
+    errors = []
+    nodes = graph.nodes()
+    for root, why in sources.items():
+        if root in sinks:
+            errors.append(
+                f"net {graph.net_names[nodes[root][0]]} carries 5 V ({', '.join(why)}) into pin(s) "
+                f"that are not 5 V tolerant: {', '.join(sinks[root])}; add a level shifter "
+                "(see references/voltage-shifters)"
+            )
+    return errors
+
+
+def check_netlist(doc: dict, catalog: Catalog | None = None) -> tuple[list[str], list[str]]:
+    """Return (errors, warnings) for netlist-level rules.
+
+    With a catalog (see load_catalog) components are cross-referenced
+    against their profiles for pin coverage, I2C address collisions and
+    5 V tolerance; without one those checks are skipped.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+    graph = Netlist(doc)
+
+    refdes_counts = Counter(graph.refdes)
     for refdes, n in refdes_counts.items():
         if n > 1:
             errors.append(f"refdes {refdes} declared {n} times; reference designators must be unique")
-    declared = set(refdes_counts)
 
-    net_names = Counter(net["name"] for net in doc["nets"])
+    net_names = Counter(graph.net_names)
     for name, n in net_names.items():
         if n > 1:
             errors.append(f"net name {name} declared {n} times; merge the pin lists into one net")
 
-    pin_owner: dict[str, str] = {}
-    connected: set[str] = set()
-    for net in doc["nets"]:
-        for pin in net["pins"]:
-            ref = pin.split(".")[0]
-            connected.add(ref)
-            if ref not in declared:
-                errors.append(f"net {net['name']} references {pin} but component {ref} is not declared")
-            if pin in pin_owner and pin_owner[pin] != net["name"]:
-                errors.append(
-                    f"pin {pin} appears in both net {pin_owner[pin]} and net {net['name']}; "
-                    "one physical pin cannot belong to two nets"
-                )
-            pin_owner.setdefault(pin, net["name"])
+    for n, pin in graph.undeclared:
+        ref = pin.partition(".")[0]
+        errors.append(f"net {graph.net_names[n]} references {pin} but component {ref} is not declared")
+    for first, n, pin in graph.conflicts:
+        errors.append(
+            f"pin {pin} appears in both net {graph.net_names[first]} and net {graph.net_names[n]}; "
+            "one physical pin cannot belong to two nets"
+        )
+
+    shared_by_node: dict[int, list[str]] = {}
+    for p in graph.shared_pins:
+        shared_by_node.setdefault(graph.find(graph.pin_net[p]), []).append(graph.pin_names[p])
+    for root, nets in graph.nodes().items():
+        names = [graph.net_names[n] for n in nets]
+        ground = [name for name in names if name in GROUND_NAMES]
+        power = [name for name in names if POWER_NET_RE.match(name)]
+        if ground and power:
+            errors.append(
+                f"power net {power[0]} is shorted to ground net {ground[0]} through pin(s) "
+                f"{', '.join(shared_by_node.get(root, []))}"
+            )
 
-    if not GROUND_NAMES & {net["name"] for net in doc["nets"]}:
+    for n, pins in enumerate(graph.net_pins):
+        if len(pins) == 1:
+            warnings.append(
+                f"net {graph.net_names[n]} connects only one pin ({graph.pin_names[pins[0]]}); "
+                "a floating net does nothing"
+            )
+
+    if not GROUND_NAMES & set(graph.net_names):
         warnings.append("no ground net found (expected one of GND/GNDA/AGND/DGND)")
 
-    for ref in sorted(declared - connected):
+    for ref in sorted(ref for ref, c in graph.comp_index.items() if not graph.comp_pins[c]):
         warnings.append(f"component {ref} is not connected to any net")
 
+    if catalog is not None:
+        comp_pins = graph.pins_by_component()
+        for c, comp in enumerate(doc["components"]):
+            if graph.comp_index[comp["refdes"]] != c or not graph.comp_pins[c] or comp.get("dnp"):
+                continue
+            record = catalog.part(comp)
+            needed = record and record["pins"]
+            if needed and graph.comp_pins[c] < needed:
+                warnings.append(
+                    f"component {comp['refdes']} ({comp['value']}) has {graph.comp_pins[c]} pin(s) "
+                    f"connected; its profile needs {needed} (signal pins plus power and ground)"
+                )
+        i2c_errors, i2c_warnings = check_i2c_addresses(doc, graph, catalog, comp_pins)
+        errors.extend(i2c_errors)
+        warnings.extend(i2c_warnings)
+        errors.extend(check_5v_signals(doc, graph, catalog, comp_pins))
+
     tbd = sum(1 for c in doc["components"] if c.get("lcsc") == "TBD")
     if tbd:
         warnings.append(
@@ -93,25 +578,27 @@ def check_netlist(doc: dict) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def validate(path: Path, quiet: bool = False) -> int:
+def validate(path: Path, quiet: bool = False, catalog: Catalog | None = None) -> int:
     try:
         doc = json.loads(path.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError) as exc:
         print(f"FAIL  cannot read {path}: {exc}")
         return 2
 
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
-    validator = jsonschema.Draft202012Validator(schema)
-    schema_errors = [
-        f"schema: {'/'.join(str(p) for p in e.absolute_path) or '<root>'}: {e.message}"
-        for e in validator.iter_errors(doc)
-    ]
+    try:
+        schema = compiled_schema()
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"FAIL  cannot load schema {SCHEMA_PATH}: {exc}")
+        return 2
+    schema_errors = schema.errors(doc)
     if schema_errors:
         for e in schema_errors:
             print(f"FAIL  {e}")
         return 1
 
-    errors, warnings = check_netlist(doc)
+    if catalog is None:
+        catalog = load_catalog(default_cache_dir())
+    errors, warnings = check_netlist(doc, catalog)
     for e in errors:
         print(f"FAIL  {e}")
     if not quiet:
@@ -129,9 +616,10 @@ def main(argv: list[str]) -> int:
     if not paths:
         print(__doc__)
         return 2
+    catalog = load_catalog(None if "--no-cache" in argv else default_cache_dir())
     worst = 0
     for p in paths:
-        worst = max(worst, validate(Path(p), quiet=quiet))
+        worst = max(worst, validate(Path(p), quiet=quiet, catalog=catalog))
     return worst
 
 
@@ -1,5 +1,6 @@
 """Tests for the expanded check-delivery.py: conformance levels and the
-definitive language-consistency check (v1.13.0).
+definitive language-consistency check (v1.13.0), and the check registry
+that skips checks above the requested level and profiles the rest.
 
 check-delivery.py is hyphen-named, so it is loaded by path via importlib.
 Fixture projects are built in tmp_path so the test is hermetic.
@@ -16,6 +17,8 @@ _spec = importlib.util.spec_from_file_location("check_delivery", SCRIPT_PATH)
 cd = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(cd)
 
+EXAMPLE_READMES = sorted((REPO_ROOT / "examples").glob("*/README.md"))
+
 BANNER = "> *Generated by [aurora@aurora-smart-home (esphome skill)](https://x)*"
 
 
@@ -95,9 +98,101 @@ class TestLanguageConsistency:
         text = "# Title\n\nAll English prose here.\n\n```yaml\nfor: minutes\n```\n"
         assert not cd._looks_swedish(text)
 
+    def test_swedish_inside_unclosed_fence_is_ignored(self):
+        text = "All English prose.\n```\nÅterställ och att med för på\n"
+        assert not cd._looks_swedish(text)
+
+    def test_classification_stops_at_first_decisive_line(self):
+        seen = []
+
+        def lines():
+            for line in ["# Titel", "Återställ enheten.", "more", "and more"]:
+                seen.append(line)
+                yield line
+
+        assert cd.get_classifier("sv").classify(lines()) == "Swedish"
+        assert seen == ["# Titel", "Återställ enheten."]
+
+    def test_shared_letters_are_not_decisive(self):
+        # ä is both Swedish and German, so it alone cannot decide between them.
+        classifier = cd.get_classifier("sv,de")
+        assert classifier.classify(["Die Lösung ist nicht für den Winter und der Sommer."]) == "German"
+        assert classifier.classify(["Återställ enheten."]) == "Swedish"
+
+    @pytest.mark.parametrize("codes", [*cd.LANGUAGES, ",".join(cd.LANGUAGES)])
+    def test_english_examples_stay_english(self, codes):
+        # Stop words English shares ("for", "is", "no", "ha") must not
+        # outvote the English around them.
+        classifier = cd.get_classifier(codes)
+        assert EXAMPLE_READMES
+        misread = [p.parent.name for p in EXAMPLE_READMES
+                   if classifier.classify(p.read_text(encoding="utf-8").splitlines()) != "English"]
+        assert misread == []
+
+    def test_norwegian_and_danish_told_apart_by_words(self):
+        classifier = cd.get_classifier("no,da")
+        norwegian = ("Slå av strømmen mellom hver gang. Hva du trenger står etter denne delen, "
+                     "og noen ting kan du gjøre uten verktøy. Spør meg hvis noe er uklart for deg.")
+        danish = ("Sluk strømmen mellem hver gang. Hvad du skal bruge står efter dette afsnit, "
+                  "og nogen ting kan du gøre uden værktøj. Spørg mig, hvis noget er uklart, "
+                  "nu eller senere; det kommer an på dig.")
+        assert classifier.classify([norwegian]) == "Norwegian"
+        assert classifier.classify([danish]) == "Danish"
+
+    def test_french_e_acute_is_decisive(self):
+        assert cd.get_classifier("fr").classify(["Le capteur est installé."]) == "French"
+
+    def test_configured_languages_name_the_mismatch(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("AURORA_DOC_LANGUAGES", "de")
+        make_minimal(tmp_path)
+        add_standard(tmp_path)
+        (tmp_path / "README.md").write_text(
+            "# Gerät\n\nDas Gerät misst die Temperatur und schaltet das Licht.\n",
+            encoding="utf-8",
+        )
+        results = cd.check_language_consistency(tmp_path)
+        assert not results[0].passed
+        assert results[0].message.startswith("MISMATCH: German (README.md) vs English (")
+
 
 class TestGatingHelper:
     def test_at_or_below_ordering(self):
         assert cd.at_or_below("minimal", "standard")
         assert cd.at_or_below("standard", "strict")
         assert not cd.at_or_below("strict", "standard")
+
+
+class TestCheckRegistry:
+    def test_every_check_is_registered(self):
+        names = [c.name for c in cd.CHECKS]
+        assert names[0] == "check_root_readme"
+        assert "check_language_consistency" in names
+        assert len(set(names)) == len(names)
+        for registered in cd.CHECKS:
+            assert registered.level in cd.LEVEL_ORDER
+            assert registered.cost in ("stat", "read", "scan")
+            assert registered.inputs
+
+    def test_checks_above_level_are_not_run(self, tmp_path, monkeypatch):
+        make_minimal(tmp_path)
+        add_standard(tmp_path)
+        monkeypatch.setattr(cd.LanguageClassifier, "classify",
+                            lambda *_a: pytest.fail("strict check ran"))
+        results, _ = cd.run_checks(str(tmp_path), level="standard")
+        assert results and all(cd.at_or_below(r.level, "standard") for r in results)
+
+    def test_level_ceiling_caps_highest_level(self, tmp_path):
+        make_minimal(tmp_path)
+        add_standard(tmp_path)
+        results, _ = cd.run_checks(str(tmp_path), level="standard")
+        assert cd.highest_level_passed(results, "standard") == "standard"
+
+    def test_profile_records_time_and_bytes(self, tmp_path):
+        make_minimal(tmp_path)
+        add_standard(tmp_path)
+        profile = {}
+        cd.run_checks(str(tmp_path), level="minimal", profile=profile)
+        assert set(profile) == {"(index)", "check_root_readme", "check_esphome"}
+        seconds, nbytes, runs = profile["check_root_readme"]
+        assert seconds >= 0 and runs == 1
+        assert nbytes == (tmp_path / "README.md").stat().st_size
@@ -0,0 +1,171 @@
+"""Tests for check-delivery.py's multi-project mode.
+
+Several projects are checked over a process pool, unchanged projects are
+replayed from the content-hash outcome cache, and the CLI prints one
+aggregated report. run_checks() raises ProjectError instead of exiting.
+Every check works from one ProjectIndex: a single tree walk with lazily
+read, memoized file contents.
+
+check-delivery.py is hyphen-named, so it is loaded by path via importlib
+(and registered in sys.modules so the process pool can pickle its jobs).
+"""
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT_PATH = REPO_ROOT / "aurora" / "scripts" / "check-delivery.py"
+
+_spec = importlib.util.spec_from_file_location("check_delivery", SCRIPT_PATH)
+cd = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault("check_delivery", cd)
+_spec.loader.exec_module(cd)
+
+BANNER = "> *Generated by [aurora@aurora-smart-home (esphome skill)](https://x)*"
+
+
+def make_project(root: Path, complete: bool = True) -> Path:
+    (root / "esphome").mkdir(parents=True)
+    (root / "README.md").write_text(
+        f"# Thing\n\n{BANNER}\n\n"
+        "## What this does\nx\n## Installation\nx\n"
+        "## Troubleshooting\nx\n## Recovery\nx\n",
+        encoding="utf-8",
+    )
+    (root / "esphome" / "thing.yaml").write_text("esphome:\n  name: thing\n", encoding="utf-8")
+    (root / "esphome" / "secrets.yaml.example").write_text("wifi_ssid: x\n", encoding="utf-8")
+    names = ("INSTALL.md", "TROUBLESHOOTING.md") if complete else ("INSTALL.md",)
+    for fname in names:
+        (root / "esphome" / fname).write_text(f"# {fname}\n\n{BANNER}\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def projects(tmp_path):
+    return [
+        str(make_project(tmp_path / "p0")),
+        str(make_project(tmp_path / "p1", complete=False)),
+        str(make_project(tmp_path / "p2")),
+    ]
+
+
+def summary(outcomes):
+    return [(Path(o.project).name, o.error, sorted(o.results)) for o in outcomes]
+
+
+class TestRunChecks:
+    def test_missing_project_raises(self, tmp_path):
+        with pytest.raises(cd.ProjectError, match="not found"):
+            cd.run_checks(str(tmp_path / "nope"))
+
+    def test_file_is_not_a_project(self, tmp_path):
+        path = tmp_path / "README.md"
+        path.write_text("x", encoding="utf-8")
+        with pytest.raises(cd.ProjectError, match="not a directory"):
+            cd.run_checks(str(path))
+
+
+class TestProjectIndex:
+    def test_each_file_is_read_at_most_once(self, tmp_path, monkeypatch):
+        make_project(tmp_path)
+        (tmp_path / "hardware").mkdir()
+        (tmp_path / "hardware" / "BOM.md").write_text(f"# BOM\n\n{BANNER}\n| a |\n", encoding="utf-8")
+        reads = []
+        real = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda p: reads.append(p.name) or real(p))
+        monkeypatch.setattr(Path, "rglob", lambda *_a: pytest.fail("checks walked the tree again"))
+        results, _ = cd.run_checks(str(tmp_path))
+        assert results
+        assert sorted(reads) == sorted(set(reads))
+        assert "README.md" in reads and "thing.yaml" not in reads
+
+    def test_index_lists_files_dirs_and_names(self, tmp_path):
+        make_project(tmp_path)
+        index = cd.ProjectIndex(tmp_path)
+        assert "esphome" in index.dirs and "esphome/INSTALL.md" in index.files
+        assert index.children[""] == ["README.md", "esphome"]
+        assert index.by_name["INSTALL.md"] == ["esphome/INSTALL.md"]
+        assert index.bytes_read == 0
+        index.text("README.md")
+        index.text("README.md")
+        assert index.bytes_read == (tmp_path / "README.md").stat().st_size
+
+    def test_checks_still_accept_a_path(self, tmp_path):
+        make_project(tmp_path)
+        assert cd.check_root_readme(tmp_path) == cd.check_root_readme(cd.ProjectIndex(tmp_path))
+
+
+class TestCheckProjects:
+    def test_outcomes_follow_input_order(self, projects, tmp_path):
+        outcomes = list(cd.check_projects(projects + [str(tmp_path / "nope")], jobs=1))
+        assert [o.project for o in outcomes] == projects + [str(tmp_path / "nope")]
+        assert [cd.highest_level_passed(o.results) for o in outcomes[:3]] == \
+            ["strict", "minimal", "strict"]
+        assert "not found" in outcomes[3].error
+
+    def test_pool_matches_serial(self, projects):
+        serial = summary(cd.check_projects(projects, jobs=1))
+        pooled = summary(cd.check_projects(projects, jobs=2))
+        assert pooled == serial
+
+    def test_unchanged_projects_are_replayed(self, projects, tmp_path):
+        cache = cd.OutcomeCache(tmp_path / "cache")
+        first = list(cd.check_projects(projects, jobs=1, cache=cache))
+        second = list(cd.check_projects(projects, jobs=1, cache=cache))
+        assert not any(o.cached for o in first)
+        assert all(o.cached for o in second)
+        assert summary(second) == summary(first)
+
+    def test_unusable_cache_dir_only_costs_the_cache(self, projects, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("", encoding="utf-8")
+        cache = cd.OutcomeCache(blocker / "cache")  # cannot be created
+        first = summary(cd.check_projects(projects, jobs=1, cache=cache))
+        outcomes = list(cd.check_projects(projects, jobs=1, cache=cache))
+        assert not any(o.cached for o in outcomes)
+        assert summary(outcomes) == first == summary(cd.check_projects(projects, jobs=1))
+
+    def test_edit_or_new_folder_invalidates_only_that_project(self, projects, tmp_path):
+        cache = cd.OutcomeCache(tmp_path / "cache")
+        list(cd.check_projects(projects, jobs=1, cache=cache))
+        (Path(projects[1]) / "esphome" / "TROUBLESHOOTING.md").write_text(
+            f"# T\n\n{BANNER}\n", encoding="utf-8"
+        )
+        (Path(projects[2]) / "notes").mkdir()
+        outcomes = list(cd.check_projects(projects, jobs=1, cache=cache))
+        assert [o.cached for o in outcomes] == [True, False, False]
+        assert cd.highest_level_passed(outcomes[1].results) == "strict"
+        assert any(r.name == "Unexpected subdirectory: notes" for r in outcomes[2].results)
+
+    def test_file_hashes_are_reused_while_unchanged(self, projects, monkeypatch):
+        index = cd.ProjectIndex(Path(projects[0]))
+        known = cd.file_digests(index, {})
+
+        def no_reads(_self):
+            raise AssertionError("unchanged file was re-read")
+
+        monkeypatch.setattr(Path, "read_bytes", no_reads)
+        assert cd.file_digests(index, known) == known
+
+
+class TestAggregatedReport:
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), *args],
+            capture_output=True, text=True, check=False,
+        )
+
+    def test_one_report_for_all_projects(self, projects, tmp_path):
+        proc = self.run("--cache-dir", str(tmp_path / "cache"), *projects)
+        assert proc.returncode == 1
+        assert "3 project(s)" in proc.stdout
+        assert "2/3 project(s) pass 'standard'" in proc.stdout
+        assert "esphome/TROUBLESHOOTING.md exists" in proc.stdout
+
+    def test_all_passing_projects_exit_zero(self, projects):
+        proc = self.run("--no-cache", "--level", "minimal", *projects)
+        assert proc.returncode == 0
+        assert "DELIVERY APPROVED" in proc.stdout
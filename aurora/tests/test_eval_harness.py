@@ -2,19 +2,24 @@
 
 The harness grades a saved iteration and gates with-skill scores against
 the golden baseline. Live subagent runs are not reproducible in CI, so
-these tests cover the deterministic parts: golden/evals.json agreement
-and the pure compare/update logic on synthetic summaries.
+these tests cover the deterministic parts: golden/evals.json agreement,
+the pure compare/update logic on synthetic summaries, and grade.py's
+per-run file index, result cache, process pool and single-scan pattern
+matching on tmp_path runs.
 """
 import json
 import sys
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 EVALS_DIR = REPO_ROOT / "aurora" / "evals"
 GOLDEN = json.loads((EVALS_DIR / "golden-baseline.json").read_text(encoding="utf-8"))
 EVALS = json.loads((EVALS_DIR / "evals.json").read_text(encoding="utf-8"))
 
 sys.path.insert(0, str(EVALS_DIR))
+import grade  # noqa: E402
 import run_evals  # noqa: E402
 
 
@@ -93,3 +98,127 @@ class TestUpdateGolden:
         run_evals.update_golden(_summary(scores), golden)
         assert all(e["with_skill_min"] == 0 for e in golden["evals"].values())
         assert golden["baseline_iteration"] == "test"
+
+
+def make_run(iteration: Path, ev: dict, mode: str = "with_skill", response: str = "") -> Path:
+    outputs = iteration / eval_dir_name(ev) / mode / "outputs"
+    (outputs / "project" / "esphome").mkdir(parents=True)
+    (outputs / "response.md").write_text(response, encoding="utf-8")
+    return outputs
+
+
+class TestGrader:
+    SWEDISH = next(ev for ev in EVALS["evals"] if ev["id"] == 2)
+    CONTEXT = next(ev for ev in EVALS["evals"] if ev["id"] == 3)
+
+    def _swedish_run(self, iteration: Path) -> Path:
+        outputs = make_run(iteration, self.SWEDISH)
+        project = outputs / "project"
+        (project / "README.md").write_text("# Fuktsensor\n\nDet här är en sensor för källaren.\n",
+                                           encoding="utf-8")
+        (project / "INSTALL.md").write_text("Så här installera du den hemma och kör.\n",
+                                            encoding="utf-8")
+        (project / "esphome" / "fukt.yaml").write_text(
+            "# Generated by aurora@aurora-smart-home\nesphome:\nwifi:\ni2c:\nsensor:\n",
+            encoding="utf-8")
+        return outputs
+
+    def test_run_index_matches_path_api(self, tmp_path):
+        outputs = self._swedish_run(tmp_path)
+        full_text = grade.gather_text(outputs)
+        expected = [grade.grade_assertion(outputs, full_text, a) for a in self.SWEDISH["assertions"]]
+        grading, cached = grade.grade_run(outputs, self.SWEDISH["assertions"])
+        assert not cached
+        assert grading["assertions"] == expected
+        assert grading["pass_count"] == 4
+
+    def test_each_file_is_read_once(self, tmp_path, monkeypatch):
+        outputs = self._swedish_run(tmp_path)
+        reads = []
+        real = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self.name) or real(self))
+        grade.grade_run(outputs, self.SWEDISH["assertions"] + self.CONTEXT["assertions"])
+        assert sorted(reads) == ["INSTALL.md", "README.md", "fukt.yaml", "response.md"]
+
+    def test_large_files_are_mmapped(self, tmp_path, monkeypatch):
+        outputs = self._swedish_run(tmp_path)
+        (outputs / "project" / "INSTALL.md").write_bytes(b"pip install esphome\r\nesphome run x\r\n")
+        small = grade.RunFiles(outputs)
+        monkeypatch.setattr(grade, "MMAP_THRESHOLD", 1)
+        mapped = grade.RunFiles(outputs)
+        assert mapped.full_text() == small.full_text()
+        assert "esphome\nesphome run" in mapped.full_text()
+        assert mapped.digest() == grade.RunFiles(outputs).digest()
+
+    def test_grading_is_cached_by_output_hash(self, tmp_path):
+        outputs = self._swedish_run(tmp_path)
+        assertions = self.SWEDISH["assertions"]
+        first, cached = grade.grade_run(outputs, assertions)
+        assert not cached and first["output_hash"]
+        again, cached = grade.grade_run(outputs, assertions)
+        assert cached and again == first
+        _, cached = grade.grade_run(outputs, assertions[:2])
+        assert not cached  # the eval's assertions changed
+        (outputs / "project" / "README.md").write_text("# Humidity sensor\n\nEnglish only.\n",
+                                                       encoding="utf-8")
+        regraded, cached = grade.grade_run(outputs, assertions[:2])
+        assert not cached and regraded["pass_count"] == 1
+
+    def test_parallel_summary_matches_serial(self, tmp_path, capsys):
+        self._swedish_run(tmp_path)
+        make_run(tmp_path, self.SWEDISH, "without_skill", response="English only")
+        make_run(tmp_path, self.CONTEXT, response="Which specific board do you have?")
+        grade.main(str(tmp_path), jobs=1, use_cache=False)
+        serial = (tmp_path / "grading-summary.json").read_text(encoding="utf-8")
+        grade.main(str(tmp_path), jobs=2)
+        assert (tmp_path / "grading-summary.json").read_text(encoding="utf-8") == serial
+        out = capsys.readouterr().out
+        assert f"{eval_dir_name(self.SWEDISH)} / with_skill: 4/4 (cached)" in out
+
+
+class TestPatternSet:
+    TEXT = "Vera Volt runs at 3.3V.\nSee https://esphome.io/components/sensor/bme280.html\nvera"
+
+    def test_matches_per_pattern_search(self, monkeypatch):
+        monkeypatch.setattr(grade, "ALTERNATION_SIZE", 2)
+        keys = [(p, 0) for p in [r"Vera[\s\S]*Volt", "Volt", "Vera", "3\\.3V", "bme280",
+                                 "Absent", r"(V)era \1", r"[0-9]\.", "a|Q", r"^See"]]
+        keys += [("VERA", grade.re.IGNORECASE), ("nope", grade.re.IGNORECASE)]
+        found = grade.PatternSet(keys).search(self.TEXT)
+        assert found == {k for k in keys if grade.re.compile(*k).search(self.TEXT)}
+        assert ("Volt", 0) in found and ("Absent", 0) not in found
+
+    def test_shadowed_patterns_are_still_found(self):
+        # "Vera" and "Volt" start inside the first pattern's match
+        keys = [(r"Vera[\s\S]*vera", 0), ("Volt", 0), ("era", 0)]
+        assert grade.PatternSet(keys).search(self.TEXT) == set(keys)
+
+    def test_flagged_and_non_literal_patterns_are_searched_separately(self):
+        ps = grade.PatternSet([("Vera", 0), ("vera", grade.re.IGNORECASE), (r"\d", 0),
+                               (r"(a)\1", 0), ("Ab|c", 0)])
+        assert list(ps.groups.values()) == [("Vera", 0)]
+        assert len(ps.separate) == 4
+
+    def test_evidence_is_reported_per_pattern(self):
+        found = grade.PatternSet([("Absent", 0), ("Volt", 0), ("3V3", grade.re.IGNORECASE)]).search(self.TEXT)
+        assert grade.check_regex_any(self.TEXT, ["Absent", "Volt"], found) == (True, "matched: Volt")
+        assert grade.check_regex_all(self.TEXT, ["Absent", "Volt"], found) == (False, "missed: ['Absent']")
+        assert grade.check_negative_regex(self.TEXT, ["3V3"], found) == (True, "no forbidden patterns matched")
+        assert grade.check_regex_all(self.TEXT, ["Absent", "Volt"]) == (False, "missed: ['Absent']")
+
+    def test_bad_pattern_fails_at_load(self, tmp_path):
+        path = tmp_path / "evals.json"
+        path.write_text(json.dumps({"evals": [{"id": 1, "assertions": [
+            {"text": "broken", "check": "regex_any", "patterns": ["(unclosed"]}]}]}), encoding="utf-8")
+        with pytest.raises(grade.re.error):
+            grade.load_evals(path)
+
+    def test_evals_are_compiled_once_per_run(self, tmp_path, monkeypatch):
+        make_run(tmp_path, TestGrader.SWEDISH, response="Hej")
+        make_run(tmp_path, TestGrader.SWEDISH, "without_skill", response="Hello")
+        built = []
+        real = grade.CompiledEval.__init__
+        monkeypatch.setattr(grade.CompiledEval, "__init__",
+                            lambda self, assertions: built.append(1) or real(self, assertions))
+        grade.main(str(tmp_path), jobs=1, use_cache=False)
+        assert len(built) == len(EVALS["evals"])
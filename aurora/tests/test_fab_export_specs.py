@@ -8,7 +8,9 @@ plus pcb/bom format specs are wired to the new spec file.
 """
 import csv
 import json
+import os
 import re
+import sys
 from pathlib import Path
 
 import jsonschema
@@ -23,6 +25,13 @@ EXAMPLE_DIR = REPO_ROOT / "examples" / "water-leak-sensor" / "hardware"
 JLCPCB_HEADER = ["Comment", "Designator", "Footprint", "LCSC Part #"]
 
 
+@pytest.fixture(autouse=True)
+def private_cache(tmp_path, monkeypatch):
+    """validate() and main() cache the profile index under XDG_CACHE_HOME;
+    keep that out of the developer's real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+
 @pytest.fixture(scope="module")
 def schema():
     return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
@@ -170,6 +179,209 @@ class TestSchematicValidator:
         assert not errors
         assert any("ground net" in w for w in warnings)
 
+    def test_schema_is_compiled_once_per_run(self, vs, tmp_path, monkeypatch):
+        path = tmp_path / "schematic.json"
+        path.write_text((EXAMPLE_DIR / "schematic.json").read_text(encoding="utf-8"), encoding="utf-8")
+        vs.compiled_schema.cache_clear()
+        built = []
+        real = vs.CompiledSchema
+        monkeypatch.setattr(vs, "CompiledSchema", lambda schema: built.append(1) or real(schema))
+        assert vs.main(["--quiet", str(path), str(path), str(path)]) == 0
+        assert len(built) == 1
+        vs.compiled_schema.cache_clear()
+
+    def test_errors_match_with_and_without_fastjsonschema(self, vs):
+        schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+        doc = self._doc([{"name": "GND", "pins": ["U1.GND"]}])
+        doc["components"][0]["refdes"] = "u1"
+        plain = vs.CompiledSchema(schema)
+        plain.fast = None
+        expected = plain.errors(doc)
+        assert len(expected) == 2  # bad refdes, too few pins
+        assert vs.CompiledSchema(schema).errors(doc) == expected
+        assert vs.CompiledSchema(schema).errors(self._doc([{"name": "GND", "pins": ["U1.G", "R1.G"]}])) == []
+
+    def test_floating_net_is_warning(self, vs):
+        doc = self._doc([
+            {"name": "GND", "pins": ["U1.GND", "R1.B"]},
+            {"name": "SPARE", "pins": ["U1.GPIO5", "U1.GPIO5"]},
+        ])
+        errors, warnings = vs.check_netlist(doc)
+        assert not errors
+        assert any("net SPARE connects only one pin (U1.GPIO5)" in w for w in warnings)
+
+    def test_power_shorted_to_ground_through_pins(self, vs):
+        # 3V3 and SIG share R1.A, SIG and GND share U1.GPIO1: one node.
+        doc = self._doc([
+            {"name": "3V3", "pins": ["U1.3V3", "R1.A"]},
+            {"name": "SIG", "pins": ["R1.A", "U1.GPIO1"]},
+            {"name": "GND", "pins": ["U1.GND", "U1.GPIO1"]},
+        ])
+        errors, _ = vs.check_netlist(doc)
+        shorts = [e for e in errors if e.startswith("power net")]
+        assert shorts == ["power net 3V3 is shorted to ground net GND through pin(s) R1.A, U1.GPIO1"]
+
+    def test_separate_power_and_ground_are_not_shorted(self, vs):
+        doc = self._doc([
+            {"name": "3V3", "pins": ["U1.3V3", "R1.A"]},
+            {"name": "GND", "pins": ["U1.GND", "R1.B"]},
+        ])
+        errors, _ = vs.check_netlist(doc)
+        assert errors == []
+
+    def test_pin_coverage_against_profile(self, vs):
+        catalog = vs.load_catalog()
+        assert catalog.parts["bme280"]["pins"] == 4  # SDA, SCL, power, ground
+        assert catalog.parts["c92489"] is catalog.parts["bme280"]
+        doc = self._doc([{"name": "GND", "pins": ["U1.GND", "R1.GND"]}])
+        doc["components"][1].update(value="BME280")
+        _, warnings = vs.check_netlist(doc, catalog)
+        assert any("component R1 (BME280) has 1 pin(s) connected; its profile needs 4" in w
+                   for w in warnings)
+        _, warnings = vs.check_netlist(doc)
+        assert not any("profile needs" in w for w in warnings)
+
+    def test_netlist_merges_nets_sharing_pins(self, vs):
+        graph = vs.Netlist(self._doc([
+            {"name": "A", "pins": ["U1.1", "R1.1"]},
+            {"name": "B", "pins": ["R1.2", "U1.2"]},
+            {"name": "C", "pins": ["U1.1", "R1.2"]},
+            {"name": "D", "pins": ["U1.3", "X9.1"]},
+        ]))
+        assert sorted(graph.nodes().values()) == [[0, 1, 2], [3]]
+        assert graph.comp_pins == [3, 2]
+        assert graph.undeclared == [(3, "X9.1")]
+
+    def test_large_generated_netlist_is_clean(self, vs):
+        sys.path.insert(0, str(REPO_ROOT / "aurora" / "scripts"))
+        from bench_schematic import synthetic_schematic
+        doc = synthetic_schematic(3000)
+        errors, warnings = vs.check_netlist(doc, vs.load_catalog())
+        assert errors == []
+        assert len(warnings) == 1 and "lcsc: TBD" in warnings[0]
+
+
+class TestSchematicCatalog:
+    @pytest.fixture(scope="class")
+    def vs(self):
+        sys.path.insert(0, str(REPO_ROOT / "aurora" / "scripts"))
+        import validate_schematic
+        return validate_schematic
+
+    def _doc(self, components, nets, board="seeed_xiao_esp32c3"):
+        return {
+            "schema_version": "1.0",
+            "project": {"name": "t", "board": board, "generated": "2026-06-12"},
+            "components": [{"refdes": "U1", "value": "XIAO ESP32-C3", "description": "mcu"}]
+            + [{"refdes": ref, "value": value, "description": "part"} for ref, value in components],
+            "nets": nets,
+        }
+
+    def _i2c_doc(self, parts, pullup_rail="3V3"):
+        refs = [ref for ref, _ in parts]
+        rails = {"3V3": ["U1.3V3"] + [f"{r}.VCC" for r in refs], "5V": ["U1.5V"]}
+        rails[pullup_rail] += ["R1.A", "R2.A"]
+        return self._doc(
+            parts + [("R1", "4.7k"), ("R2", "4.7k")],
+            [
+                {"name": "I2C_SDA", "pins": ["U1.GPIO6", "R1.B"] + [f"{r}.SDA" for r in refs]},
+                {"name": "I2C_SCL", "pins": ["U1.GPIO7", "R2.B"] + [f"{r}.SCL" for r in refs]},
+            ]
+            + [{"name": name, "pins": pins} for name, pins in rails.items() if len(pins) > 1]
+            + [{"name": "GND", "pins": ["U1.GND"] + [f"{r}.GND" for r in refs]}],
+        )
+
+    def test_catalog_indexes_lcsc_ids_and_boards(self, vs):
+        catalog = vs.load_catalog()
+        bme = catalog.part({"refdes": "U2", "value": "whatever", "lcsc": "C92489"})
+        assert bme["id"] == "bme280" and bme["i2c"] == [0x76, 0x77] and bme["tolerates_5v"] is False
+        assert catalog.part({"refdes": "U2", "value": "BME280 breakout"}) is bme
+        assert catalog.part({"refdes": "U3", "value": "MCP23017"})["i2c"][0] == 0x20
+        assert catalog.part({"refdes": "R1", "value": "10k"}) is None
+        assert catalog.board("seeed_xiao_esp32c3")["id"] == "xiao-esp32-c3"
+        assert catalog.board("xiao-esp32-c3")["gpio_5v_tolerant"] is False
+
+    def test_catalog_is_cached_on_disk_by_mtime(self, vs, tmp_path, monkeypatch):
+        refs = tmp_path / "references"
+        profile = refs / "components" / "temperature" / "bme280.json"
+        profile.parent.mkdir(parents=True)
+        profile.write_text((vs.REFERENCES_DIR / "components" / "temperature" / "bme280.json")
+                           .read_text(encoding="utf-8"), encoding="utf-8")
+        cache = tmp_path / "cache"
+        vs.load_catalog.cache_clear()
+        try:
+            assert "bme280" in vs.load_catalog(cache, refs).parts
+            assert (cache / "catalog.json").is_file()
+
+            vs.load_catalog.cache_clear()
+            monkeypatch.setattr(vs.Catalog, "build", lambda paths: pytest.fail("catalog rebuilt"))
+            assert "c92489" in vs.load_catalog(cache, refs).parts
+            monkeypatch.undo()
+
+            text = profile.read_text(encoding="utf-8").replace('"C92489"', '"C1234"')
+            profile.write_text(text, encoding="utf-8")
+            os.utime(profile, ns=(profile.stat().st_atime_ns, profile.stat().st_mtime_ns + 10**9))
+            vs.load_catalog.cache_clear()
+            parts = vs.load_catalog(cache, refs).parts
+            assert "c1234" in parts and "c92489" not in parts
+        finally:
+            vs.load_catalog.cache_clear()
+
+    def test_two_bme280_share_default_address(self, vs):
+        doc = self._i2c_doc([("U2", "BME280"), ("U3", "BME280")])
+        errors, warnings = vs.check_netlist(doc, vs.load_catalog())
+        assert errors == []
+        assert "I2C bus I2C_SDA: U2 (bme280) and U3 (bme280) all default to 0x76; " \
+               "strap all but one to another address" in warnings
+
+    def test_three_bme280_on_one_bus_collide(self, vs):
+        doc = self._i2c_doc([("U2", "BME280"), ("U3", "BMP280"), ("U4", "BME280")])
+        errors, _ = vs.check_netlist(doc, vs.load_catalog())
+        assert len(errors) == 1
+        assert errors[0].startswith("I2C bus I2C_SDA: U4 (bme280) has no free address; 0x76/0x77")
+
+    def test_different_addresses_do_not_collide(self, vs):
+        doc = self._i2c_doc([("U2", "BME280"), ("U3", "SHT31"), ("U4", "AHT20")])
+        errors, warnings = vs.check_netlist(doc, vs.load_catalog())
+        assert errors == [] and not any("I2C bus" in w for w in warnings)
+
+    def test_5v_pullup_into_gpio_and_3v3_part(self, vs):
+        doc = self._i2c_doc([("U2", "BME280")], pullup_rail="5V")
+        errors, _ = vs.check_netlist(doc, vs.load_catalog())
+        sda = [e for e in errors if e.startswith("net I2C_SDA")]
+        assert sda == [
+            "net I2C_SDA carries 5 V (pull-up R1 to 5V) into pin(s) that are not 5 V tolerant: "
+            "U1.GPIO6 (board xiao-esp32-c3), U2.SDA (bme280); add a level shifter "
+            "(see references/voltage-shifters)"
+        ]
+
+    def test_5v_divider_into_gpio_is_fine(self, vs):
+        # 100k/100k from 5V to GND halves it before the ADC pin (battery sense).
+        doc = self._doc(
+            [("R1", "100k"), ("R2", "100k")],
+            [
+                {"name": "5V", "pins": ["U1.5V", "R1.A"]},
+                {"name": "VBAT_SENSE", "pins": ["R1.B", "R2.A", "U1.GPIO2"]},
+                {"name": "GND", "pins": ["U1.GND", "R2.B"]},
+            ],
+        )
+        errors, _ = vs.check_netlist(doc, vs.load_catalog())
+        assert errors == []
+        doc["nets"][2]["pins"].remove("R2.B")
+        doc["nets"][0]["pins"].append("R2.B")  # both to 5V: a plain pull-up again
+        errors, _ = vs.check_netlist(doc, vs.load_catalog())
+        assert [e.split(" (")[0] for e in errors] == ["net VBAT_SENSE carries 5 V"]
+
+    def test_3v3_pullup_is_fine(self, vs):
+        errors, _ = vs.check_netlist(self._i2c_doc([("U2", "BME280")]), vs.load_catalog())
+        assert errors == []
+
+    def test_unknown_board_skips_gpio_tolerance(self, vs):
+        doc = self._i2c_doc([], pullup_rail="5V")
+        doc["project"]["board"] = "custom-board"
+        errors, _ = vs.check_netlist(doc, vs.load_catalog())
+        assert errors == []
+
 
 class TestWiring:
     def test_volt_soul_requires_fab_exports_at_production(self):
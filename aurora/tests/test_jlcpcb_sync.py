@@ -7,6 +7,8 @@ CDFER-format CSV, including the not_listed and TBD-skip paths.
 """
 import json
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import jsonschema
@@ -105,6 +107,90 @@ class TestSyncScript:
         assert sync.sync_profile(p, status, "2026-06-12") == "unchanged"
 
 
+class StubCSV(ThreadingHTTPServer):
+    """Serves CSV_FIXTURE with an ETag and Last-Modified, answering 304 to
+    a matching If-None-Match. `bodies` counts full downloads."""
+
+    daemon_threads = True
+
+    def __init__(self, body=CSV_FIXTURE, etag='"v1"'):
+        super().__init__(("127.0.0.1", 0), StubCSVHandler)
+        self.body = body
+        self.etag = etag
+        self.bodies = 0
+        self.conditional = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/assembly-details.csv"
+
+
+class StubCSVHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.conditional.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        payload = self.server.body.encode()
+        self.server.bodies += 1
+        self.send_response(200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Last-Modified", "Fri, 12 Jun 2026 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def csv_server():
+    server = StubCSV()
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestCachedDownload:
+    def test_stream_parse_matches_text_parse(self, tmp_path):
+        path = tmp_path / "a.csv"
+        path.write_text(CSV_FIXTURE, encoding="utf-8")
+        with open(path, encoding="utf-8", newline="") as f:
+            assert sync.load_status(f) == sync.load_status(CSV_FIXTURE)
+        assert sync.load_status(CSV_FIXTURE)["1002"] == ("base", 20)
+
+    def test_unchanged_upstream_reuses_cached_index(self, csv_server, tmp_path):
+        first, how = sync.download_status(csv_server.url, tmp_path)
+        assert how == "downloaded"
+        second, how = sync.download_status(csv_server.url, tmp_path)
+        assert how == "not modified"
+        assert second == first
+        assert csv_server.bodies == 1
+        assert csv_server.conditional == [None, '"v1"']
+
+    def test_changed_upstream_replaces_index(self, csv_server, tmp_path):
+        sync.download_status(csv_server.url, tmp_path)
+        csv_server.body = CSV_FIXTURE.replace("1002,smtWeld,smtWeld,SMT,20", "1002,smtWeld,smtWeld,SMT,40")
+        csv_server.etag = '"v2"'
+        status, how = sync.download_status(csv_server.url, tmp_path)
+        assert how == "downloaded" and status["1002"] == ("base", 40)
+        assert sync.download_status(csv_server.url, tmp_path)[0]["1002"] == ("base", 40)
+
+    def test_missing_index_forces_full_download(self, csv_server, tmp_path):
+        sync.download_status(csv_server.url, tmp_path)
+        (tmp_path / "assembly-details.index.pickle").unlink()
+        assert sync.download_status(csv_server.url, tmp_path)[1] == "downloaded"
+        assert csv_server.conditional[-1] is None
+
+    def test_without_cache_always_downloads(self, csv_server):
+        sync.download_status(csv_server.url)
+        sync.download_status(csv_server.url)
+        assert csv_server.bodies == 2
+
+
 class TestStockTracking:
     def test_stock_status_buckets(self):
         assert sync.stock_status(0) == "out_of_stock"
@@ -149,6 +235,148 @@ class TestStockTracking:
         assert seen >= 9, "expected the 9 verified parts to carry a stock status"
 
 
+class StubPartsAPI(ThreadingHTTPServer):
+    """Local stand-in for the JLCPCB parts API.
+
+    stock maps code -> count; codes not in it are unlisted. A keyword with
+    several codes only matches them all when `multi` is set. `failures`
+    is a list of HTTP statuses served (in order) before real answers.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, stock, multi=True, failures=()):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.stock = stock
+        self.multi = multi
+        self.failures = list(failures)
+        self.keywords = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api/select"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        codes = body["keyword"].split()
+        with self.server.lock:
+            self.server.keywords.append(body["keyword"])
+            status = self.server.failures.pop(0) if self.server.failures else 200
+        if status == 200:
+            if len(codes) > 1 and not self.server.multi:
+                codes = []
+            items = [{"componentCode": c, "stockCount": self.server.stock[c]}
+                     for c in codes if c in self.server.stock]
+            payload = json.dumps({"data": {"componentPageInfo": {"list": items}}}).encode()
+        else:
+            payload = b"busy"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def parts_api():
+    servers = []
+
+    def start(stock, **kwargs):
+        server = StubPartsAPI(stock, **kwargs)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def fetcher(server, **kwargs):
+    kwargs.setdefault("rate", 0)
+    kwargs.setdefault("backoff", 0.001)
+    return sync.StockFetcher(server.url, **kwargs)
+
+
+class TestStockFetcher:
+    CODES = [f"C{n}" for n in range(1, 25)]
+
+    def test_concurrent_fetch_reuses_connections(self, parts_api):
+        server = parts_api({code: n * 10 for n, code in enumerate(self.CODES)})
+        f = fetcher(server, concurrency=3)
+        result = f.fetch(self.CODES + ["C999"])
+        f.close()
+        assert result == {**{code: n * 10 for n, code in enumerate(self.CODES)}, "C999": None}
+        assert len(server.keywords) == 25
+        assert server.connections <= 3
+
+    def test_batches_several_codes_per_call(self, parts_api):
+        server = parts_api({code: 5 for code in self.CODES})
+        result = fetcher(server, batch=8).fetch(self.CODES)
+        assert result == {code: 5 for code in self.CODES}
+        assert len(server.keywords) == 3
+
+    def test_codes_missing_from_a_batch_are_reasked_singly(self, parts_api):
+        server = parts_api({"C1": 1, "C2": 2}, multi=False)
+        assert fetcher(server, batch=3).fetch(["C1", "C2", "C3"]) == {"C1": 1, "C2": 2, "C3": None}
+        assert server.keywords == ["C1 C2 C3", "C1", "C2", "C3"]
+
+    def test_retries_429_and_5xx(self, parts_api):
+        server = parts_api({"C1": 7}, failures=[429, 503])
+        assert fetcher(server, retries=2).fetch(["C1"]) == {"C1": 7}
+        assert len(server.keywords) == 3
+
+    def test_gives_up_after_retries(self, parts_api, tmp_path):
+        server = parts_api({"C1": 7}, failures=[500, 500])
+        result = fetcher(server, retries=1).fetch(["C1"])
+        assert isinstance(result["C1"], sync.FetchError)
+        p = make_profile(tmp_path, {"lcsc": "C1"})
+        assert sync.sync_stock_profile(p, "2026-06-13", result) == "error (FetchError)"
+
+    def test_client_errors_are_not_retried(self, parts_api):
+        server = parts_api({}, failures=[404])
+        assert isinstance(fetcher(server, retries=3).fetch(["C1"])["C1"], sync.FetchError)
+        assert len(server.keywords) == 1
+
+    def test_prefetched_stock_drives_profile_sync(self, parts_api, tmp_path, monkeypatch):
+        monkeypatch.setattr(sync, "fetch_stock", lambda lcsc: pytest.fail("fetched singly"))
+        server = parts_api({"C5183133": 3870})
+        p = make_profile(tmp_path, {"lcsc": "C5183133"})
+        stock = fetcher(server).fetch([sync.profile_lcsc(p)])
+        assert "updated (in_stock" in sync.sync_stock_profile(p, "2026-06-13", stock)
+
+
+class TestTokenBucket:
+    def test_spaces_requests_beyond_the_burst(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = sync.TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(6):
+            bucket.acquire()
+        assert now[0] == pytest.approx(2.0)  # 2 free, then 4 at 0.5 s each
+
+
 class TestStockWarningIsConsumed:
     """The stock signal is only useful if delivery actually reads it. These
     pin the consumption rule in the BOM format spec and Volt's Iron Law 8."""
@@ -4,6 +4,7 @@ Verifies that the legacy-syntax linter detects the deprecated Home
 Assistant patterns the 2026-06 modernization removed, that it respects
 the documented exceptions, and that the repo itself stays clean.
 """
+import subprocess
 import sys
 from pathlib import Path
 
@@ -119,9 +120,172 @@ class TestFenceParsing:
         result = lint.check_fence_parses(["{{ jinja }}", "key: value"], "f.md", 0)
         assert len(result) == 1
 
+    def test_repeated_fence_body_is_parsed_once(self, monkeypatch):
+        monkeypatch.setattr(lint, "_fence_memo", {})
+        first = lint.check_fence_parses(["{{ jinja }}", "key: 1"], "a.md", 0)
+        monkeypatch.setattr(lint.yaml, "load_all", lambda *_a, **_k: pytest.fail("re-parsed"))
+        second = lint.check_fence_parses(["{{ jinja }}", "key: 1"], "b.md", 9)
+        assert first[0].replace("a.md:1", "b.md:10") == second[0]
+
+
+class TestFix:
+    def test_rewrites_only_the_offending_tokens(self):
+        text = (
+            "trigger:  # when\r\n"
+            "  - platform: state\r\n"
+            "action:\r\n"
+            "  - service: light.turn_on   # kitchen\r\n"
+            "tap_action:\r\n"
+            "  action:  call-service\r\n"
+        )
+        fixed, count = lint.fix_text(text, "automations.yaml")
+        assert count == 5
+        assert fixed == (
+            "triggers:  # when\r\n"
+            "  - trigger: state\r\n"
+            "actions:\r\n"
+            "  - action: light.turn_on   # kitchen\r\n"
+            "tap_action:\r\n"
+            "  action:  perform-action\r\n"
+        )
+        assert lint.lint_yaml_lines(fixed.split("\n"), "automations.yaml") == []
+
+    def test_exposed_findings_are_fixed_in_later_passes(self):
+        lines = ["triggers:", "  - platform: state", "    - - platform: nested"]
+        assert lint.fix_yaml_lines(lines) == 2
+        assert lines[2] == "    - - trigger: nested"
+
+    def test_only_yaml_fences_in_markdown(self):
+        text = "service: light.x\n```yaml\naction:\n  - service: light.turn_on\n```\n```text\naction:\n```\n"
+        fixed, count = lint.fix_text(text, "doc.md")
+        assert count == 2
+        assert fixed == "service: light.x\n```yaml\nactions:\n  - action: light.turn_on\n```\n```text\naction:\n```\n"
+
+    def test_template_keys_and_skipped_files_are_left_alone(self):
+        assert lint.fix_text("service_template: x\n", "a.yaml") == ("service_template: x\n", 0)
+        assert lint.fix_text(LEGACY, "docs/migration-guide.md")[1] == 0
+
+    def test_fix_writes_and_relints_only_fixed_files(self, git_repo, capsys, monkeypatch):
+        linted = []
+        real = lint.lint_file
+        monkeypatch.setattr(lint, "lint_file", lambda p, rel: linted.append(rel) or real(p, rel))
+        assert lint.main(["--fix", "--no-cache"]) == 0
+        assert (git_repo / "legacy.yaml").read_text() == "actions:\n  - action: light.turn_on\n"
+        assert linted == ["clean.yaml", "legacy.yaml", "legacy.yaml"]
+        assert "fixed 1 file(s)" in capsys.readouterr().out
+
+    def test_dry_run_prints_diff_and_writes_nothing(self, git_repo, capsys):
+        assert lint.main(["--fix", "--dry-run", "--no-cache"]) == 1
+        out = capsys.readouterr().out
+        assert "--- a/legacy.yaml\n+++ b/legacy.yaml\n" in out
+        assert "-  - service: light.turn_on\n+  - action: light.turn_on\n" in out
+        assert "would fix 1 file(s)" in out
+        assert (git_repo / "legacy.yaml").read_text() == LEGACY
+
+
+def test_jobs_match_serial_run(tmp_path, monkeypatch):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for i in range(6):
+        (docs / f"d{i}.md").write_text(
+            f"```yaml\nactions:\n  - service: light.turn_on\n```\n```yaml\n{{{{ x{i} }}}}\n```\n"
+        )
+    targets = [f"docs/d{i}.md" for i in range(6)]
+    monkeypatch.setattr(lint, "REPO_ROOT", tmp_path)
+    serial = list(lint.lint_all(targets, jobs=1))
+    parallel = list(lint.lint_all(targets, jobs=3))
+    assert parallel == serial
+    assert all(len(f) == 2 for f in serial)
+
+
+class TestGoldenCorpus:
+    """The scanner must reproduce the findings recorded from the previous
+    line-by-line implementation, line for line."""
+
+    CORPUS = Path(__file__).resolve().parent / "fixtures" / "lint_ha_syntax"
+
+    def test_findings_match_golden(self):
+        text = (self.CORPUS / "corpus.txt").read_text(encoding="utf-8")
+        result = []
+        for start, block, info in lint.iter_yaml_fences(text):
+            if info in ("yaml", "yml"):
+                result += lint.lint_yaml_lines(block, "corpus.txt", offset=start)
+        golden = (self.CORPUS / "corpus.golden.txt").read_text(encoding="utf-8").splitlines()
+        assert result == golden
+
+    def test_every_rule_is_covered(self):
+        golden = (self.CORPUS / "corpus.golden.txt").read_text(encoding="utf-8")
+        for rules in lint.LEGACY_RULES.values():
+            for rule in rules:
+                assert rule.message.split("{")[0] in golden
+
+
+LEGACY = "actions:\n  - service: light.turn_on\n"
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """A throwaway checkout with one clean and one legacy automation."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "clean.yaml").write_text("actions:\n  - action: light.turn_on\n")
+    (repo / "legacy.yaml").write_text(LEGACY)
+    git(repo, "init", "-q")
+    git(repo, "add", ".")
+    git(repo, "commit", "-qm", "init")
+    monkeypatch.setattr(lint, "REPO_ROOT", repo)
+    return repo
+
+
+class TestIncrementalRuns:
+    def test_blob_sha_matches_git(self, git_repo):
+        sha = subprocess.run(["git", "hash-object", "legacy.yaml"], cwd=git_repo,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        assert lint.blob_sha(LEGACY.encode()) == sha
+        assert lint.tracked_blobs()["legacy.yaml"] == sha
+
+    def test_unstaged_edit_gets_working_tree_sha(self, git_repo):
+        (git_repo / "clean.yaml").write_text(LEGACY)
+        assert lint.tracked_blobs()["clean.yaml"] == lint.blob_sha(LEGACY.encode())
+
+    def test_second_run_replays_cached_findings(self, git_repo, tmp_path, capsys, monkeypatch):
+        cache = ["--cache-dir", str(tmp_path / "cache")]
+        assert lint.main(cache) == 1
+        first = capsys.readouterr().out
+        monkeypatch.setattr(lint, "lint_file", lambda *_a: pytest.fail("re-linted"))
+        assert lint.main(cache) == 1
+        second = capsys.readouterr().out
+        assert first.splitlines()[:-1] == second.splitlines()[:-1]
+        assert "(2 cached)" in second
+
+    def test_only_changed_blob_is_relinted(self, git_repo, tmp_path, capsys, monkeypatch):
+        cache = ["--cache-dir", str(tmp_path / "cache")]
+        lint.main(cache)
+        (git_repo / "clean.yaml").write_text(LEGACY)
+        linted = []
+        real = lint.lint_file
+        monkeypatch.setattr(lint, "lint_file", lambda p, rel: linted.append(rel) or real(p, rel))
+        lint.main(cache)
+        assert linted == ["clean.yaml"]
+        assert "clean.yaml:2" in capsys.readouterr().out
+
+    def test_changed_since_limits_targets(self, git_repo, capsys):
+        (git_repo / "new.md").write_text("```yaml\n{{ broken\n```\n")
+        git(git_repo, "add", "new.md")
+        assert lint.main(["--changed-since", "HEAD", "--no-cache"]) == 1
+        out = capsys.readouterr().out
+        assert "new.md:2: yaml fence does not parse" in out
+        assert "legacy.yaml" not in out
+        assert "in 1 file(s)" in out
+
 
 def test_repo_is_clean(capsys):
     """The whole repo must stay free of legacy HA syntax and broken fences."""
-    exit_code = lint.main([])
+    exit_code = lint.main(["--no-cache"])
     output = capsys.readouterr().out
     assert exit_code == 0, f"lint_ha_syntax found regressions:\n{output}"
@@ -0,0 +1,619 @@
+"""Tests for scripts/validate_esphome.py.
+
+Covers the multi-file runner: parallel (--jobs) results must match the
+serial run and come back in input order, and the content-hash result
+cache must replay unchanged files and invalidate on any dependency change.
+The single-pass config walker must collect pins, intervals, secrets and
+component keys in one traversal, and pin rules must come from the board
+profiles in aurora/references/boards/ for every board we ship. Watch
+mode must revalidate only changed files and the files that include them.
+The persistent esphome worker is exercised against a stub esphome package
+put on PYTHONPATH, so the real (heavy) esphome is not needed. Findings
+carry rule ids and source line/column, and stream out as JSONL or SARIF.
+!include targets and packages are resolved through a shared fragment
+cache, and findings inside them point back at the fragment.
+Fixture configs are written to tmp_path so the test is hermetic.
+"""
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import validate_esphome as ve  # noqa: E402
+
+GOOD = (
+    "esphome:\n"
+    "  name: good\n"
+    "esp32:\n"
+    "  board: esp32dev\n"
+    "wifi:\n"
+    "  ssid: !secret wifi_ssid\n"
+    "  password: !secret wifi_password\n"
+    "api:\n"
+    "  encryption:\n"
+    "    key: !secret api_key\n"
+    "ota:\n"
+    "  - platform: esphome\n"
+)
+
+BAD = (
+    "esphome:\n"
+    "  name: bad\n"
+    "esp32:\n"
+    "  board: esp32dev\n"
+    "switch:\n"
+    "  - platform: gpio\n"
+    "    pin: GPIO6\n"
+)
+
+
+def write(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def board_config(section: str, body: str, pins: str) -> str:
+    return f"esphome:\n  name: b\n{section}:\n{body}{pins}"
+
+
+def summary(result):
+    return (result.file_path, result.errors, result.warnings, result.info)
+
+
+class TestParallelRunner:
+    def test_serial_results_follow_input_order(self, tmp_path):
+        files = [write(tmp_path, f"d{i}.yaml", GOOD if i % 2 else BAD) for i in range(4)]
+        results = list(ve.iter_results(files))
+        assert [r.file_path for r in results] == [str(f) for f in files]
+        assert [r.is_valid() for r in results] == [False, True, False, True]
+
+    def test_parallel_matches_serial(self, tmp_path):
+        files = [write(tmp_path, f"d{i}.yaml", GOOD if i % 3 else BAD) for i in range(6)]
+        serial = [summary(r) for r in ve.iter_results(files, jobs=1)]
+        parallel = [summary(r) for r in ve.iter_results(files, jobs=3)]
+        assert parallel == serial
+
+    def test_flash_pin_is_an_error(self, tmp_path):
+        result = ve.validate_file(write(tmp_path, "bad.yaml", BAD))
+        assert any("GPIO6" in e for e in result.errors)
+
+
+class TestResultCache:
+    def test_unchanged_file_is_replayed(self, tmp_path, monkeypatch):
+        cfg = write(tmp_path, "bad.yaml", BAD)
+        cache = ve.ResultCache(tmp_path / "cache")
+        first = list(ve.iter_results([cfg], cache=cache))
+
+        def boom(*_args, **_kwargs):
+            raise AssertionError("cached file was revalidated")
+
+        monkeypatch.setattr(ve, "validate_file", boom)
+        second = list(ve.iter_results([cfg], cache=cache))
+        assert [summary(r) for r in second] == [summary(r) for r in first]
+        assert cache.hits == 1
+
+    def test_content_change_invalidates(self, tmp_path):
+        cfg = write(tmp_path, "dev.yaml", BAD)
+        cache = ve.ResultCache(tmp_path / "cache")
+        key = cache.key(cfg, full=False)
+        cfg.write_text(GOOD, encoding="utf-8")
+        assert cache.key(cfg, full=False) != key
+
+    def test_include_change_invalidates(self, tmp_path):
+        write(tmp_path, "common.yaml", "logger:\n")
+        cfg = write(tmp_path, "dev.yaml", GOOD + "logger: !include common.yaml\n")
+        cache = ve.ResultCache(tmp_path / "cache")
+        list(ve.iter_results([cfg], cache=cache))
+        write(tmp_path, "common.yaml", "logger:\n  level: DEBUG\n")
+        list(ve.iter_results([cfg], cache=cache))
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_invalidated_by_what_the_loader_resolved(self, tmp_path):
+        # A quoted path with a space, reached only through packages: and a
+        # nested include - the files the loader follows, not a text scan.
+        (tmp_path / "common").mkdir()
+        write(tmp_path, "common/switch pins.yaml", "- platform: gpio\n  pin: GPIO4\n")
+        write(tmp_path, "common/base.yaml", 'switch: !include "switch pins.yaml"\n')
+        cfg = write(tmp_path, "dev.yaml", GOOD + "packages:\n  base: !include common/base.yaml\n")
+        cache = ve.ResultCache(tmp_path / "cache")
+        first = list(ve.iter_results([cfg], cache=cache))
+        assert first[0].is_valid()
+        list(ve.iter_results([cfg], cache=cache))
+        assert cache.hits == 1
+        write(tmp_path, "common/switch pins.yaml", "- platform: gpio\n  pin: GPIO6\n")
+        again = list(ve.iter_results([cfg], cache=cache))
+        assert cache.hits == 1
+        assert any("GPIO6" in e for e in again[0].errors)
+
+    def test_full_mode_has_its_own_key(self, tmp_path):
+        cfg = write(tmp_path, "dev.yaml", GOOD)
+        cache = ve.ResultCache(tmp_path / "cache")
+        assert cache.key(cfg, full=True) != cache.key(cfg, full=False)
+
+    def test_missing_cli_is_not_cached(self, tmp_path, monkeypatch):
+        cfg = write(tmp_path, "dev.yaml", GOOD)
+        monkeypatch.setattr(
+            ve, "run_esphome_validate", lambda *_a: (False, ve.ESPHOME_CLI_MISSING)
+        )
+        cache = ve.ResultCache(tmp_path / "cache")
+        list(ve.iter_results([cfg], full=True, cache=cache))
+        list(ve.iter_results([cfg], full=True, cache=cache))
+        assert cache.hits == 0
+
+
+class TestLoader:
+    def test_tags_do_not_leak_into_global_safeloader(self, tmp_path):
+        ve.load_yaml_file(write(tmp_path, "dev.yaml", GOOD))
+        with pytest.raises(ve.yaml.YAMLError):
+            ve.yaml.safe_load("ssid: !secret wifi_ssid\n")
+
+    def test_esphome_tags_are_stringified(self, tmp_path):
+        cfg, _raw, _marks = ve.load_yaml_file(write(tmp_path, "dev.yaml", (
+            "wifi:\n  ssid: !secret wifi_ssid\n"
+            "logger: !include common.yaml\n"
+            "x:\n  lambda: !lambda return 1;\n"
+        )))
+        assert cfg["wifi"]["ssid"] == "!secret wifi_ssid"
+        assert cfg["logger"] == "!include common.yaml"
+        assert cfg["x"]["lambda"] == "!lambda ..."
+
+    def test_marks_locate_logical_paths(self, tmp_path):
+        _cfg, _raw, marks = ve.load_yaml_file(write(tmp_path, "dev.yaml", (
+            "esphome:\n"
+            "  name: dev\n"
+            "sensor:\n"
+            "  - platform: adc\n"
+            "    pin: GPIO4\n"
+            "  - platform: adc\n"
+            "    pin:\n"
+            "      number: GPIO5\n"
+        )))
+        assert marks.locate(".esphome.name") == (2, 3)
+        assert marks.locate(".sensor[1]") == (6, 5)
+        assert marks.locate(".sensor[1].pin.number") == (8, 7)
+        # a missing key resolves to its deepest existing ancestor
+        assert marks.locate(".esphome.board") == (1, 1)
+        assert marks.locate(".wifi") == (None, None)
+
+    def test_marks_follow_merge_keys(self, tmp_path):
+        _cfg, _raw, marks = ve.load_yaml_file(write(tmp_path, "dev.yaml", (
+            "base: &base\n"
+            "  pin: GPIO4\n"
+            "sensor:\n"
+            "  - <<: *base\n"
+            "    name: s\n"
+            "    pin: GPIO5\n"
+        )))
+        assert marks.locate(".sensor[0].name") == (5, 5)
+        assert marks.locate(".sensor[0].pin") == (6, 5)  # the overriding key
+
+    def test_findings_carry_line_and_column(self, tmp_path):
+        result = ve.validate_config(write(tmp_path, "bad.yaml", BAD))
+        pin = next(f for f in result.findings if f.rule == "invalid-pin")
+        assert (pin.line, pin.column) == (7, 5)
+
+    def test_uses_libyaml_when_available(self):
+        expected = getattr(ve.yaml, "CSafeLoader", ve.yaml.SafeLoader)
+        assert issubclass(ve.ESPHomeLoader, expected)
+
+
+class TestConfigWalker:
+    def test_collects_everything_in_one_pass(self):
+        facts = ve.walk_config(ve.yaml.load(
+            "esphome:\n  name: x\n"
+            "wifi:\n  ssid: !secret wifi_ssid\n"
+            "sensor:\n"
+            "  - platform: dht\n    pin: GPIO4\n    update_interval: 50ms\n"
+            "light:\n"
+            "  - platform: neopixelbus\n    pin: 5\n"
+            "    effects:\n      - addressable_rainbow:\n          update_interval: 16ms\n",
+            Loader=ve.ESPHomeLoader,
+        ))
+        assert facts.components == ["esphome", "wifi", "sensor", "light"]
+        assert facts.pins == [(4, ".sensor[0].pin"), (5, ".light[0].pin")]
+        assert facts.update_intervals == [("50ms", ".sensor[0].update_interval")]
+        assert facts.secrets == {"wifi_ssid": ".wifi.ssid"}
+
+    def test_pin_schema_counted_once(self, tmp_path):
+        cfg = write(tmp_path, "dev.yaml", GOOD + (
+            "binary_sensor:\n"
+            "  - platform: gpio\n"
+            "    pin:\n      number: GPIO4\n      inverted: true\n"
+        ))
+        assert ve.extract_gpio_pins(ve.load_yaml_file(cfg)[0]) == [(4, ".binary_sensor[0].pin")]
+        assert not any("multiple times" in e for e in ve.validate_config(cfg).errors)
+
+    def test_number_in_pin_lists(self):
+        config = {"camera": {"data_pins": [{"number": "GPIO4"}, {"number": 5}]}}
+        assert ve.extract_gpio_pins(config) == [
+            (4, ".camera.data_pins[0].number"),
+            (5, ".camera.data_pins[1].number"),
+        ]
+
+    def test_path_is_only_built_when_a_rule_fires(self, monkeypatch):
+        calls = []
+        original = ve.WalkCursor.path
+        monkeypatch.setattr(ve.WalkCursor, "path", lambda self: calls.append(1) or original(self))
+        ve.walk_config({"sensor": [{"platform": "x", "name": "y", "filters": [{"a": 1}]}]})
+        assert calls == []
+
+    def test_custom_rule_registration(self):
+        walker = ve.ConfigWalker()
+        seen = []
+
+        @walker.rule("platform")
+        def _platform(facts, value, cursor):
+            seen.append((value, cursor.path()))
+
+        walker.walk({"sensor": [{"platform": "dht"}], "switch": [{"platform": "gpio"}]})
+        assert seen == [("dht", ".sensor[0].platform"), ("gpio", ".switch[0].platform")]
+
+
+FLEET_BASE = (
+    "wifi:\n"
+    "  ssid: !secret wifi_ssid\n"
+    "  password: !secret wifi_password\n"
+    "api:\n"
+    "  encryption:\n"
+    "    key: !secret api_key\n"
+    "ota:\n"
+    "  - platform: esphome\n"
+    "sensor:\n"
+    "  - platform: adc\n"
+    "    id: vbat\n"
+    "    pin: GPIO6\n"
+)
+
+
+def fleet_device(name: str, extra: str = "") -> str:
+    return (
+        f"esphome:\n  name: {name}\n"
+        "esp32:\n  board: esp32dev\n"
+        "packages:\n  base: !include ../common/base.yaml\n"
+        + extra
+    )
+
+
+@pytest.fixture
+def fragments(monkeypatch):
+    cache = ve.FragmentCache()
+    monkeypatch.setattr(ve, "_fragment_cache", cache)
+    return cache
+
+
+class TestIncludes:
+    def make_fleet(self, tmp_path, count=3, extra=""):
+        (tmp_path / "common").mkdir()
+        (tmp_path / "devices").mkdir()
+        write(tmp_path / "common", "base.yaml", FLEET_BASE)
+        return [write(tmp_path / "devices", f"d{i}.yaml", fleet_device(f"d{i}", extra))
+                for i in range(count)]
+
+    def test_package_findings_are_attributed_to_every_consumer(self, tmp_path, fragments):
+        for result in ve.iter_results(self.make_fleet(tmp_path)):
+            (pin,) = [f for f in result.findings if f.rule == "invalid-pin"]
+            assert Path(pin.source).resolve() == (tmp_path / "common" / "base.yaml").resolve()
+            assert (pin.line, pin.column) == (12, 5)
+            assert not any(f.rule == "no-wifi" for f in result.findings)
+
+    def test_shared_fragment_is_parsed_once(self, tmp_path, fragments):
+        list(ve.iter_results(self.make_fleet(tmp_path, count=5)))
+        assert fragments.parses == 1
+
+    def test_fragment_is_reparsed_after_edit(self, tmp_path, fragments):
+        devices = self.make_fleet(tmp_path, count=2)
+        ve.validate_config(devices[0])
+        write(tmp_path / "common", "base.yaml", FLEET_BASE.replace("GPIO6", "GPIO32"))
+        result = ve.validate_config(devices[1])
+        assert fragments.parses == 2
+        assert result.is_valid()
+
+    def test_local_keys_override_and_ids_merge(self, tmp_path, fragments):
+        extra = "sensor:\n  - platform: adc\n    id: vbat\n    update_interval: 10ms\n"
+        (device,) = self.make_fleet(tmp_path, count=1, extra=extra)
+        resolution = ve.Resolution(
+            ve.Fragment(device.resolve(), *ve.load_yaml_file(device)[::2]), str(device)
+        )
+        (sensor,) = resolution.config["sensor"]
+        assert sensor["pin"] == "GPIO6" and sensor["update_interval"] == "10ms"
+        assert "packages" not in resolution.config
+        assert resolution.locate(".sensor[0].update_interval") == (None, 10, 5)
+        # the cached fragment itself is never modified
+        base = fragments.get((tmp_path / "common" / "base.yaml").resolve())
+        assert "update_interval" not in base.content["sensor"][0]
+
+    def test_include_cycle_is_reported(self, tmp_path, fragments):
+        write(tmp_path, "a.yaml", "logger: !include b.yaml\n")
+        write(tmp_path, "b.yaml", "x: !include a.yaml\n")
+        result = ve.validate_config(write(tmp_path, "dev.yaml", GOOD + "logger: !include a.yaml\n"))
+        (cycle,) = [f for f in result.findings if f.rule == "include-cycle"]
+        assert cycle.message.count("a.yaml") == 2  # a -> b -> a
+        assert cycle.source.endswith("b.yaml") and cycle.line == 1
+
+    def test_missing_include_and_remote_package(self, tmp_path, fragments):
+        result = ve.validate_config(write(tmp_path, "dev.yaml", GOOD + (
+            "packages:\n  remote: github://me/repo/base.yaml@main\n"
+            "switch: !include nope.yaml\n"
+        )))
+        rules = {f.rule: f for f in result.findings}
+        assert rules["missing-include"].line == 15
+        assert rules["remote-package"].severity == "info"
+        assert str((tmp_path / "nope.yaml").resolve()) in result.includes
+
+    def test_parse_error_in_fragment_points_at_fragment(self, tmp_path, fragments):
+        write(tmp_path, "broken.yaml", "a: [1\n")
+        result = ve.validate_config(write(tmp_path, "dev.yaml", GOOD + "logger: !include broken.yaml\n"))
+        (error,) = [f for f in result.findings if f.rule == "yaml-syntax"]
+        assert error.source.endswith("broken.yaml") and error.line is not None
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ve.load_board_index()
+
+
+class TestBoardIndex:
+    def test_every_board_profile_is_indexed(self, index, all_board_profiles):
+        for _path, profile in all_board_profiles:
+            pins = index.by_board[profile["board_id"]]
+            for pin in profile["gpio"]["strapping_pins"]:
+                assert ve.has(pins.strapping, pin)
+            for pin in profile["gpio"].get("reserved_for_flash", []):
+                assert ve.has(pins.flash, pin)
+
+    def test_esphome_board_name_prefers_dev_board(self, index):
+        assert index.by_board["esp32dev"].board_id == "esp32-devkit-v1"
+        assert index.by_board["esp32-c3-devkitm-1"].board_id == "esp32-c3-mini"
+
+    def test_explicit_variant_uses_generic_profile(self, index):
+        pins = index.resolve("esp32", {"board": "custom", "variant": "esp32c6"})
+        assert pins.variant == "ESP32C6" and pins.strict
+
+    def test_board_name_hint_is_not_strict(self, index):
+        pins = index.resolve("esp32", {"board": "atoms3"})
+        assert pins.variant == "ESP32S3" and not pins.strict
+
+    def test_unknown_esp32_board_defaults_to_classic(self, index):
+        assert index.resolve("esp32", {"board": "esp32cam"}).variant == "ESP32"
+
+    def test_has_rejects_negative_pins(self):
+        assert not ve.has(-1, -1)
+        assert ve.has(ve._mask([0, 5]), 5)
+
+
+class TestBoardPinRules:
+    def check(self, tmp_path, text):
+        return ve.validate_config(write(tmp_path, "dev.yaml", text))
+
+    def test_c6_gpio9_is_strapping_not_flash(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp32", "  board: esp32-c6-devkitc-1\n",
+            "binary_sensor:\n  - platform: gpio\n    pin: GPIO9\n",
+        ))
+        assert result.is_valid()
+        assert any("GPIO9 is a strapping pin" in w for w in result.warnings)
+
+    def test_c3_flash_pin_is_an_error(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp32", "  board: esp32-c3-devkitm-1\n",
+            "switch:\n  - platform: gpio\n    pin: GPIO12\n",
+        ))
+        assert any("GPIO12 is invalid/reserved" in e for e in result.errors)
+
+    def test_usb_pin_warns(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp32", "  board: esp32-s3-devkitc-1\n",
+            "switch:\n  - platform: gpio\n    pin: GPIO19\n",
+        ))
+        assert any("USB" in w for w in result.warnings)
+
+    def test_input_only_output_on_classic_esp32(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp32", "  board: esp32dev\n",
+            "switch:\n  - platform: gpio\n    pin: GPIO34\n",
+        ))
+        assert any("input-only" in e for e in result.errors)
+
+    def test_esp8266_strapping_note(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp8266", "  board: d1_mini\n",
+            "switch:\n  - platform: gpio\n    pin: GPIO15\n",
+        ))
+        assert any("must be LOW at boot" in w for w in result.warnings)
+
+    def test_undocumented_pin_on_product_warns(self, tmp_path):
+        result = self.check(tmp_path, board_config(
+            "esp32", "  board: m5stack-atom\n",
+            "switch:\n  - platform: gpio\n    pin: GPIO4\n",
+        ))
+        assert result.is_valid()
+        assert any("not a documented GPIO" in w for w in result.warnings)
+
+
+class TestWatchSession:
+    def make(self, tmp_path):
+        write(tmp_path, "common.yaml", "logger:\n")
+        a = write(tmp_path, "a.yaml", GOOD + "logger: !include common.yaml\n")
+        b = write(tmp_path, "b.yaml", GOOD)
+        session = ve.WatchSession([a, b], dirs=(tmp_path,))
+        session.validate_all()
+        return session, a, b
+
+    def test_only_changed_file_is_revalidated(self, tmp_path):
+        session, _a, b = self.make(tmp_path)
+        b.write_text(BAD, encoding="utf-8")
+        results = session.update([b])
+        assert [r.file_path for r in results] == [str(b)]
+        assert not session.results[b.resolve()].is_valid()
+
+    def test_includers_are_revalidated(self, tmp_path):
+        session, a, _b = self.make(tmp_path)
+        session.dirs = set()  # explicit files only, so common.yaml is not a target itself
+        results = session.update([tmp_path / "common.yaml"])
+        assert [r.file_path for r in results] == [str(a)]
+
+    def test_edited_fragment_changes_includer_result(self, tmp_path):
+        session, a, _b = self.make(tmp_path)
+        session.dirs = set()
+        write(tmp_path, "common.yaml", "switch:\n  - platform: gpio\n    pin: GPIO6\n")
+        (result,) = session.update([tmp_path / "common.yaml"])
+        assert result.file_path == str(a) and not result.is_valid()
+
+    def test_new_file_in_watched_dir_is_picked_up(self, tmp_path):
+        session, _a, _b = self.make(tmp_path)
+        c = write(tmp_path, "c.yaml", BAD)
+        assert [r.file_path for r in session.update([c])] == [str(c.resolve())]
+        assert c.resolve() in session.results
+
+    def test_deleted_file_is_dropped(self, tmp_path):
+        session, _a, b = self.make(tmp_path)
+        b.unlink()
+        assert session.update([b]) == []
+        assert b.resolve() not in session.results
+
+    def test_polling_watcher_reports_changes(self, tmp_path):
+        cfg = write(tmp_path, "a.yaml", GOOD)
+        watcher = ve.PollingWatcher([tmp_path], interval=0)
+        cfg.write_text(BAD + "# longer\n", encoding="utf-8")
+        assert watcher.wait() == [cfg]
+        assert watcher.wait() == []
+
+
+FAKE_ESPHOME = {
+    "__init__.py": "",
+    "core.py": (
+        "class _Core:\n"
+        "    resets = 0\n"
+        "    def reset(self):\n"
+        "        self.resets += 1\n"
+        "CORE = _Core()\n"
+    ),
+    "__main__.py": (
+        "import os, sys, time\n"
+        "CALLS = []\n"
+        "def run_esphome(argv):\n"
+        "    path = argv[2]\n"
+        "    CALLS.append(path)\n"
+        "    if 'slow' in path:\n"
+        "        time.sleep(30)\n"
+        "    if 'crash' in path:\n"
+        "        os._exit(3)\n"
+        "    print(f'pid={os.getpid()} calls={len(CALLS)}')\n"
+        "    os.write(1, b'stray fd-1 output\\n')\n"
+        "    return 1 if 'bad' in path else 0\n"
+    ),
+}
+
+
+@pytest.fixture
+def fake_esphome(tmp_path, monkeypatch):
+    pkg = tmp_path / "site" / "esphome"
+    pkg.mkdir(parents=True)
+    for name, source in FAKE_ESPHOME.items():
+        (pkg / name).write_text(source, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(pkg.parent))
+    monkeypatch.setattr(ve, "_esphome_worker", None)
+    monkeypatch.setattr(ve, "_esphome_worker_error", None)
+    yield pkg
+    if ve._esphome_worker is not None:
+        ve._esphome_worker.close()
+
+
+class TestEsphomeWorker:
+    def test_one_process_serves_many_files(self, tmp_path, fake_esphome):
+        worker = ve.EsphomeWorker()
+        try:
+            ok1, out1 = worker.validate(write(tmp_path, "a.yaml", GOOD))
+            ok2, out2 = worker.validate(write(tmp_path, "bad.yaml", GOOD))
+        finally:
+            worker.close()
+        assert ok1 and not ok2
+        pid = out1.split()[0]
+        assert out2.split()[:2] == [pid, "calls=2"]
+
+    def test_timeout_applies_per_file_and_worker_restarts(self, tmp_path, fake_esphome):
+        worker = ve.get_esphome_worker()
+        assert worker.validate(write(tmp_path, "slow.yaml", GOOD), timeout=0.5) == (
+            False, ve.ESPHOME_CLI_TIMEOUT,
+        )
+        assert not worker.alive()
+        ok, _out = ve.run_esphome_validate(write(tmp_path, "a.yaml", GOOD), persistent=True)
+        assert ok and ve.get_esphome_worker() is not worker
+
+    def test_crash_is_not_reported_as_timeout(self, tmp_path, fake_esphome):
+        worker = ve.get_esphome_worker()
+        assert worker.validate(write(tmp_path, "crash.yaml", GOOD)) == (
+            False, ve.ESPHOME_WORKER_EXITED,
+        )
+        assert not worker.alive()
+        result = ve.validate_file(write(tmp_path, "crash.yaml", GOOD), full=True, persistent=True)
+        assert not result.cacheable
+        assert any(ve.ESPHOME_WORKER_EXITED in e for e in result.errors)
+
+    def test_failed_import_falls_back_to_cli(self, tmp_path, fake_esphome, monkeypatch):
+        (fake_esphome / "__init__.py").write_text("raise ImportError('nope')\n", encoding="utf-8")
+        assert ve.get_esphome_worker() is None
+        monkeypatch.setenv("PATH", str(tmp_path))  # no esphome CLI either
+        ok, output = ve.run_esphome_validate(write(tmp_path, "a.yaml", GOOD), persistent=True)
+        assert (ok, output) == (False, ve.ESPHOME_CLI_MISSING)
+
+    def test_validate_file_uses_worker(self, tmp_path, fake_esphome):
+        result = ve.validate_file(write(tmp_path, "bad.yaml", GOOD), full=True, persistent=True)
+        assert any("ESPHome validation failed" in e and "calls=1" in e for e in result.errors)
+
+
+class TestMachineReadableOutput:
+    def test_every_finding_has_a_known_rule(self, tmp_path):
+        result = ve.validate_config(write(tmp_path, "bad.yaml", BAD))
+        assert result.findings
+        assert all(f.rule in ve.RULES for f in result.findings)
+        assert len(result.findings) == len(result.errors) + len(result.warnings) + len(result.info)
+
+    def test_jsonl_one_record_per_finding(self, tmp_path):
+        result = ve.validate_config(write(tmp_path, "bad.yaml", BAD))
+        out = io.StringIO()
+        ve.JsonlReporter(out).report(result)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert len(records) == len(result.findings)
+        pin = next(r for r in records if r["rule"] == "invalid-pin")
+        assert pin["file"] == result.file_path
+        assert pin["severity"] == "error" and pin["path"] == ".switch[0].pin"
+
+    def test_sarif_document_is_valid_json(self, tmp_path):
+        out = io.StringIO()
+        reporter = ve.SarifReporter(out)
+        reporter.start()
+        for name, text in (("a.yaml", BAD), ("b.yaml", GOOD), ("c.yaml", BAD)):
+            reporter.report(ve.validate_config(write(tmp_path, name, text)))
+        reporter.finish()
+        doc = json.loads(out.getvalue())
+        run = doc["runs"][0]
+        assert doc["version"] == "2.1.0"
+        assert {r["id"] for r in run["tool"]["driver"]["rules"]} == set(ve.RULES)
+        assert {r["level"] for r in run["results"]} <= {"error", "warning", "note"}
+        assert sum(r["ruleId"] == "invalid-pin" for r in run["results"]) == 2
+
+    def test_sarif_with_no_findings(self):
+        out = io.StringIO()
+        reporter = ve.SarifReporter(out)
+        reporter.start()
+        reporter.finish()
+        assert json.loads(out.getvalue())["runs"][0]["results"] == []
+
+    def test_yaml_syntax_error_has_line_and_column(self, tmp_path):
+        result = ve.validate_config(write(tmp_path, "broken.yaml", "esphome:\n  name: [x\n"))
+        finding = result.findings[0]
+        assert finding.rule == "yaml-syntax" and finding.line is not None
+
+    def test_findings_survive_the_cache(self, tmp_path):
+        cfg = write(tmp_path, "bad.yaml", BAD)
+        cache = ve.ResultCache(tmp_path / "cache")
+        first = list(ve.iter_results([cfg], cache=cache))[0]
+        second = list(ve.iter_results([cfg], cache=cache))[0]
+        assert [f.to_dict() for f in second.findings] == [f.to_dict() for f in first.findings]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+YAML Loader Benchmark
+=====================
+Measures parse throughput of validate_esphome.py's ESPHomeLoader against
+the pure-Python SafeLoader the validator used before, over the repo's
+ESPHome YAMLs (examples/ and esphome/).
+
+Usage:
+    python scripts/bench_yaml_loader.py              # repo YAMLs, 5 rounds
+    python scripts/bench_yaml_loader.py --rounds 20 path/to/configs/
+
+Generated by aurora@aurora-smart-home (esphome skill)
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import validate_esphome  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ROOTS = [REPO_ROOT / "examples", REPO_ROOT / "esphome"]
+
+
+class PurePythonLoader(yaml.SafeLoader):
+    """The validator's previous setup: pure-Python SafeLoader plus the tags."""
+
+
+PurePythonLoader.add_constructor("!secret", lambda l, n: f"!secret {n.value}")
+PurePythonLoader.add_constructor("!include", lambda l, n: f"!include {n.value}")
+PurePythonLoader.add_constructor("!lambda", lambda l, n: "!lambda ...")
+
+
+def collect(roots):
+    texts = []
+    for root in roots:
+        paths = [root] if root.is_file() else sorted(root.rglob("*.yaml"))
+        for path in paths:
+            text = path.read_text(encoding="utf-8")
+            try:
+                yaml.load(text, Loader=PurePythonLoader)
+            except yaml.YAMLError:
+                continue  # HA-side files with tags the validator never sees
+            texts.append(text)
+    return texts
+
+
+def bench(loader, texts, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for text in texts:
+            yaml.load(text, Loader=loader)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ESPHome YAML parsing")
+    parser.add_argument("paths", nargs="*", type=Path, help="Files or directories to parse")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is reported)")
+    args = parser.parse_args()
+
+    texts = collect(args.paths or DEFAULT_ROOTS)
+    if not texts:
+        print("No parseable YAML files found")
+        sys.exit(1)
+    size_mb = sum(len(t.encode("utf-8")) for t in texts) / 1e6
+
+    print(f"{len(texts)} file(s), {size_mb:.2f} MB, best of {args.rounds} round(s)")
+    baseline = None
+    for name, loader in (
+        ("SafeLoader (pure Python)", PurePythonLoader),
+        (f"ESPHomeLoader ({validate_esphome.ESPHomeLoader.__base__.__name__})",
+         validate_esphome.ESPHomeLoader),
+    ):
+        elapsed = bench(loader, texts, args.rounds)
+        baseline = baseline or elapsed
+        print(
+            f"  {name:<36} {elapsed * 1000:8.1f} ms  "
+            f"{size_mb / elapsed:6.2f} MB/s  {baseline / elapsed:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
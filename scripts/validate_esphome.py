@@ -2,22 +2,44 @@
 """
 ESPHome Configuration Validator
 ===============================
-Validates ESPHome YAML configurations for common errors.
+Validates ESPHome YAML configurations for common errors. GPIO rules come
+from the board profiles in aurora/references/boards/ (override the location
+with the AURORA_BOARDS_DIR environment variable).
 
 Usage:
     python validate_esphome.py config.yaml
     python validate_esphome.py --full config.yaml    # Use esphome CLI
     python validate_esphome.py --dir ./configs/      # Validate directory
+    python validate_esphome.py --jobs 8 --full --dir ./configs/  # Parallel
+    python validate_esphome.py --no-cache config.yaml  # Ignore result cache
+    python validate_esphome.py --watch --dir ./configs/  # Revalidate on save
+    python validate_esphome.py --full --esphome-worker --dir ./configs/  # Import esphome once
+    python validate_esphome.py --format jsonl --dir ./configs/  # Machine-readable
 
 Generated by aurora@aurora-smart-home (esphome skill)
 https://github.com/tonylofgren/aurora-smart-home
 """
 
 import argparse
+import array
+import atexit
+import bisect
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import queue
 import re
+import select
+import struct
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
     import yaml
@@ -26,37 +48,89 @@ except ImportError:
     sys.exit(1)
 
 
-# ESP32 strapping pins - should be used with caution
-STRAPPING_PINS_ESP32 = {
-    0: "Boot mode (pull-up for normal boot)",
-    2: "Boot mode (must be LOW or floating)",
-    5: "SDIO timing",
-    12: "MTDI - Boot voltage (pull-down for 3.3V flash)",
-    15: "MTDO - Silence boot messages",
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Machine-readable board profiles (aurora/references/boards/**/*.json). Pin
+# rules for every board come from here; see load_board_index().
+BOARDS_DIR = Path(os.environ.get("AURORA_BOARDS_DIR", REPO_ROOT / "aurora" / "references" / "boards"))
+
+# Human-readable strapping-pin consequences, keyed by profile variant. The
+# profiles say *which* pins strap; these only enrich the warning text.
+STRAPPING_NOTES = {
+    "ESP32": {
+        0: "Boot mode (pull-up for normal boot)",
+        2: "Boot mode (must be LOW or floating)",
+        5: "SDIO timing",
+        12: "MTDI - Boot voltage (pull-down for 3.3V flash)",
+        15: "MTDO - Silence boot messages",
+    },
+    "ESP8266": {
+        0: "Boot mode (pull-up for normal boot)",
+        2: "Boot mode (must be HIGH at boot)",
+        15: "Boot mode (must be LOW at boot)",
+    },
 }
-
-STRAPPING_PINS_ESP8266 = {
-    0: "Boot mode (pull-up for normal boot)",
-    2: "Boot mode (must be HIGH at boot)",
-    15: "Boot mode (must be LOW at boot)",
+STRAPPING_NOTES["ESP8285"] = STRAPPING_NOTES["ESP8266"]
+
+# Platform sections that select a board, and the variant assumed when the
+# board is not one we have a profile for (ESPHome's own default).
+PLATFORM_DEFAULT_VARIANT = {"esp32": "ESP32", "esp8266": "ESP8266", "rp2040": None}
+
+
+# Rule ids attached to every finding (used by --format jsonl/sarif).
+RULES = {
+    "yaml-syntax": "The file does not parse as YAML",
+    "missing-include": "An !include target that does not exist",
+    "include-cycle": "Files that !include each other in a loop",
+    "remote-package": "A remote package that was not fetched",
+    "missing-esphome": "The config has no esphome: section",
+    "missing-name": "The esphome: section has no device name",
+    "unknown-chip": "No esp32/esp8266/rp2040 platform section",
+    "no-board-profile": "The board has no profile in aurora/references/boards",
+    "no-wifi": "No wifi: section",
+    "no-wifi-ssid": "wifi: has neither ssid nor networks",
+    "hardcoded-wifi-ssid": "WiFi SSID is not a !secret",
+    "hardcoded-wifi-password": "WiFi password is not a !secret",
+    "no-api": "No api: section",
+    "insecure-api": "api: has neither encryption nor password",
+    "no-ota": "No ota: section",
+    "duplicate-pin": "A GPIO is used by more than one component",
+    "invalid-pin": "A GPIO that does not exist or is reserved for flash",
+    "undocumented-pin": "A GPIO the board profile does not list",
+    "strapping-pin": "A strapping GPIO that affects boot",
+    "usb-pin": "A GPIO wired to the USB data lines",
+    "input-only-pin": "An input-only GPIO used as an output",
+    "fast-update-interval": "A sensor update interval below 100 ms",
+    "no-attribution": "No attribution header",
+    "esphome-config": "esphome config rejected the file",
 }
 
-# Pins that don't exist or are input-only
-INVALID_PINS_ESP32 = {
-    6, 7, 8, 9, 10, 11,  # Connected to flash
-    20, 24, 28, 29, 30, 31,  # Don't exist on most boards
-}
 
-INPUT_ONLY_ESP32 = {34, 35, 36, 39}  # No internal pull-up/down
+class Finding:
+    """One structured finding: rule id, severity, message and location."""
 
-# Common board configurations
-BOARDS = {
-    "esp32dev": {"chip": "esp32", "flash": "4MB"},
-    "esp32-s3-devkitc-1": {"chip": "esp32s3", "flash": "8MB"},
-    "esp32-c3-devkitm-1": {"chip": "esp32c3", "flash": "4MB"},
-    "d1_mini": {"chip": "esp8266", "flash": "4MB"},
-    "nodemcuv2": {"chip": "esp8266", "flash": "4MB"},
-}
+    __slots__ = ("severity", "rule", "message", "path", "line", "column", "source")
+
+    def __init__(
+        self,
+        severity: str,
+        rule: str,
+        message: str,
+        path: Optional[str] = None,
+        line: Optional[int] = None,
+        column: Optional[int] = None,
+        source: Optional[str] = None,
+    ):
+        self.severity = severity
+        self.rule = rule
+        self.message = message
+        self.path = path  # logical location, e.g. ".sensor[2].pin"
+        self.line = line  # 1-based
+        self.column = column  # 1-based
+        self.source = source  # included file that line/column refer to, if not this one
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class ValidationResult:
@@ -67,19 +141,44 @@ class ValidationResult:
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        self.findings: List[Finding] = []
+        self.includes: List[str] = []  # every file pulled in via !include or packages:
+        self.cacheable = True
 
-    def add_error(self, msg: str):
+    def add_error(self, msg: str, rule: str = "esphome-config", path: Optional[str] = None,
+                  line: Optional[int] = None, column: Optional[int] = None,
+                  source: Optional[str] = None):
         self.errors.append(f"❌ ERROR: {msg}")
+        self.findings.append(Finding("error", rule, msg, path, line, column, source))
 
-    def add_warning(self, msg: str):
+    def add_warning(self, msg: str, rule: str = "esphome-config", path: Optional[str] = None,
+                    line: Optional[int] = None, column: Optional[int] = None,
+                    source: Optional[str] = None):
         self.warnings.append(f"⚠️  WARNING: {msg}")
+        self.findings.append(Finding("warning", rule, msg, path, line, column, source))
 
-    def add_info(self, msg: str):
+    def add_info(self, msg: str, rule: str = "esphome-config", path: Optional[str] = None,
+                 line: Optional[int] = None, column: Optional[int] = None,
+                 source: Optional[str] = None):
         self.info.append(f"ℹ️  INFO: {msg}")
+        self.findings.append(Finding("info", rule, msg, path, line, column, source))
 
     def is_valid(self) -> bool:
         return len(self.errors) == 0
 
+    def to_dict(self) -> dict:
+        return {"findings": [f.to_dict() for f in self.findings], "includes": self.includes}
+
+    @classmethod
+    def from_dict(cls, file_path: str, data: dict) -> "ValidationResult":
+        result = cls(file_path)
+        add = {"error": result.add_error, "warning": result.add_warning, "info": result.add_info}
+        for finding in data["findings"]:
+            finding = dict(finding)
+            add[finding.pop("severity")](finding.pop("message"), **finding)
+        result.includes = list(data.get("includes", []))
+        return result
+
     def print_results(self):
         print(f"\n{'=' * 60}")
         print(f"Validation: {self.file_path}")
@@ -98,53 +197,771 @@ class ValidationResult:
             print(f"\n❌ FAILED with {len(self.errors)} errors, {len(self.warnings)} warnings")
 
 
-def load_yaml_file(file_path: Path) -> Tuple[dict, str]:
-    """Load YAML file and return content and raw text."""
+# libyaml's C parser is several times faster than the pure-Python one; fall
+# back transparently when PyYAML was built without it.
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ESPHomeLoader(_BaseLoader):
+    """Safe loader that understands ESPHome's !secret, !include and !lambda tags.
+
+    The tag constructors are registered once here, on a private subclass,
+    instead of on the global SafeLoader for every file that gets loaded.
+    """
+
+
+class IncludeRef(str):
+    """An unresolved !include: still the "!include <file>" string the checks
+    see, plus the target file and the 1-based position of the tag."""
+
+    target: str
+    line: int
+    column: int
+
+
+def _construct_include(loader, node) -> IncludeRef:
+    if isinstance(node, yaml.MappingNode):  # !include {file: ..., vars: {...}}
+        target = str(loader.construct_mapping(node, deep=True).get("file", ""))
+    else:
+        target = str(loader.construct_scalar(node))
+    ref = IncludeRef(f"!include {target}")
+    ref.target = target
+    ref.line, ref.column = node.start_mark.line + 1, node.start_mark.column + 1
+    return ref
+
+
+ESPHomeLoader.add_constructor("!secret", lambda l, n: f"!secret {n.value}")
+ESPHomeLoader.add_constructor("!include", _construct_include)
+ESPHomeLoader.add_constructor("!lambda", lambda l, n: "!lambda ...")
+
+
+# Logical config paths as built by WalkCursor.path(): ".sensor[3].pin".
+PATH_SEGMENT_RE = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_COLUMN_BITS = 20
+
+
+class MarkTable:
+    """Source positions for one loaded document, kept beside it.
+
+    The loaded config stays plain dicts and lists. Positions live in one
+    flat array of packed (line << 20 | column) integers: each container
+    owns a run of slots, one per child in iteration order. A second pair
+    of arrays maps id(container) to the start of its run and is sorted
+    once, on the first lookup. That is 8 bytes per node plus 12 per
+    container, with no per-value wrapper objects.
+    """
+
+    def __init__(self):
+        self.root = None  # keeps the containers, and so their ids, alive
+        self.packed = array.array("Q")
+        self._ids = array.array("Q")
+        self._starts = array.array("L")
+        self._sorted = True
+
+    @staticmethod
+    def pack(mark) -> int:
+        return (mark.line + 1) << _COLUMN_BITS | min(mark.column + 1, (1 << _COLUMN_BITS) - 1)
+
+    def record(self, container, children) -> None:
+        self._ids.append(id(container))
+        self._starts.append(len(self.packed))
+        self.packed.extend(children)
+        self._sorted = False
+
+    def offset(self, container) -> Optional[int]:
+        """Start of container's run in packed, or None if it is not ours."""
+        if not self._sorted:
+            order = sorted(range(len(self._ids)), key=self._ids.__getitem__)
+            self._ids = array.array("Q", (self._ids[i] for i in order))
+            self._starts = array.array("L", (self._starts[i] for i in order))
+            self._sorted = True
+        key = id(container)
+        i = bisect.bisect_left(self._ids, key)
+        if i < len(self._ids) and self._ids[i] == key:
+            return self._starts[i]
+        return None
+
+    def position(self, container, slot: int) -> Optional[int]:
+        start = self.offset(container)
+        return None if start is None else self.packed[start + slot]
+
+    def locate(self, path: str) -> Tuple[Optional[int], Optional[int]]:
+        """1-based (line, column) of a logical path, or (None, None).
+
+        Paths that run past the loaded data (a missing key) resolve to the
+        deepest node that does exist, below the document root.
+        """
+        found = walk_path(self.root, path, self.position)
+        return unpack_mark(found) if found else (None, None)
+
+
+def unpack_mark(packed: int) -> Tuple[int, int]:
+    return packed >> _COLUMN_BITS, packed & ((1 << _COLUMN_BITS) - 1)
+
+
+def walk_path(root, path: str, position: Callable[[object, int], object]):
+    """Follow a logical path from root, returning the last position found.
+
+    position(container, slot) gives the position of a container's slot-th
+    child, or None when the container is unknown.
+    """
+    node, found = root, None
+    for key, index in PATH_SEGMENT_RE.findall(path):
+        if index:
+            slot = int(index)
+            if not isinstance(node, list) or slot >= len(node):
+                break
+            child = node[slot]
+        else:
+            if not isinstance(node, dict):
+                break
+            slot = next((i for i, k in enumerate(node) if k == key or str(k) == key), None)
+            if slot is None:
+                break
+            child = node[list(node)[slot]]
+        here = position(node, slot)
+        if here is None:
+            break
+        found, node = here, child
+    return found
+
+
+class MarkedLoader(ESPHomeLoader):
+    """ESPHomeLoader that records node positions into a MarkTable.
+
+    Mapping children are positioned at their key, sequence items at the
+    item itself.
+    """
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.marks = MarkTable()
+
+    def construct_yaml_map(self, node):
+        data = {}
+        yield data
+        data.update(self.construct_mapping(node))
+        # construct_mapping has flattened any << merges into node.value.
+        pack = MarkTable.pack
+        if len(data) == len(node.value):
+            children = [pack(k.start_mark) for k, _ in node.value]
+        else:  # duplicate or merged keys: align with the dict's key order
+            # The last occurrence of a key is the one whose value won.
+            winner = {str(k.value): pack(k.start_mark) for k, _ in node.value}
+            own = pack(node.start_mark)
+            children = [winner.get(str(k), own) for k in data]
+        self.marks.record(data, children)
+
+    def construct_yaml_seq(self, node):
+        data = []
+        yield data
+        data.extend(self.construct_sequence(node))
+        pack = MarkTable.pack
+        self.marks.record(data, [pack(n.start_mark) for n in node.value])
+
+
+MarkedLoader.add_constructor("tag:yaml.org,2002:map", MarkedLoader.construct_yaml_map)
+MarkedLoader.add_constructor("tag:yaml.org,2002:seq", MarkedLoader.construct_yaml_seq)
+
+
+def load_yaml_file(file_path: Path) -> Tuple[dict, str, Optional[MarkTable]]:
+    """Load YAML file and return content, raw text and node positions.
+
+    On a parse error content and marks are None and raw text is the error.
+    """
     try:
         raw_text = file_path.read_text(encoding="utf-8")
-        # Handle !secret and other ESPHome tags
-        yaml.add_constructor("!secret", lambda l, n: f"!secret {n.value}", Loader=yaml.SafeLoader)
-        yaml.add_constructor("!include", lambda l, n: f"!include {n.value}", Loader=yaml.SafeLoader)
-        yaml.add_constructor("!lambda", lambda l, n: f"!lambda ...", Loader=yaml.SafeLoader)
-        content = yaml.safe_load(raw_text)
-        return content, raw_text
+        loader = MarkedLoader(raw_text)
+        try:
+            content = loader.get_single_data()
+        finally:
+            loader.dispose()
+        loader.marks.root = content
+        return content, raw_text, loader.marks
     except yaml.YAMLError as e:
-        return None, str(e)
+        return None, str(e), None
+
+
+# ---------------------------------------------------------------------------
+# Includes and packages
+# ---------------------------------------------------------------------------
+
+class Fragment:
+    """One parsed YAML file and the !include tags in it."""
+
+    __slots__ = ("path", "content", "marks", "error", "stamp", "refs", "has_packages")
+
+    def __init__(self, path: Path, content, marks: Optional[MarkTable],
+                 error: Optional[str] = None, stamp: Optional[Tuple[int, int]] = None):
+        self.path = path  # resolved
+        self.content = content
+        self.marks = marks
+        self.error = error  # YAML parse error text
+        self.stamp = stamp  # (mtime_ns, size) when cached
+        self.refs: List[IncludeRef] = []
+        pending = [content]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, IncludeRef):
+                self.refs.append(node)
+            elif isinstance(node, dict):
+                pending.extend(node.values())
+            elif isinstance(node, list):
+                pending.extend(node)
+        self.has_packages = isinstance(content, dict) and "packages" in content
+
+    @property
+    def targets(self) -> List[Path]:
+        """Resolved paths this file includes directly."""
+        return [(self.path.parent / ref.target).resolve() for ref in self.refs]
+
+
+class FragmentCache:
+    """Process-wide cache of parsed include targets, keyed by path and mtime.
+
+    A fleet where 500 devices include common/base.yaml parses it once per
+    process; a fragment is re-parsed only when its mtime or size changes.
+    The cached content is never modified: resolution copies the containers
+    it has to change.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, Fragment] = {}
+        self.parses = 0
+
+    def get(self, path: Path) -> Fragment:
+        """The parsed fragment at path (resolved). Raises OSError if unreadable."""
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is None or entry.stamp != stamp:
+            content, text, marks = load_yaml_file(path)
+            entry = Fragment(path, content, marks, None if marks else text, stamp)
+            self._entries[path] = entry
+            self.parses += 1
+        return entry
+
+    def graph(self) -> Dict[Path, List[Path]]:
+        """Direct include edges between every fragment parsed so far."""
+        return {path: entry.targets for path, entry in self._entries.items()}
+
+
+_fragment_cache: Optional[FragmentCache] = None
+
+
+def get_fragment_cache() -> FragmentCache:
+    global _fragment_cache
+    if _fragment_cache is None:
+        _fragment_cache = FragmentCache()
+    return _fragment_cache
+
+
+Origin = Tuple[object, int]  # (container, slot) a rebuilt container's child came from
+
+
+class Resolution:
+    """One config with its !include tags and packages: resolved.
+
+    Included fragments come from the FragmentCache and are spliced in as
+    they are; only containers on the way to an !include, and those merged
+    from packages, are rebuilt. Each rebuilt container remembers where its
+    children came from, so locate() maps a logical path in the resolved
+    config back to the file, line and column it was written at. Problems
+    (missing files, parse errors in fragments, include cycles) are
+    collected in issues; edges is the include graph reachable from root.
+    """
+
+    def __init__(self, root: Fragment, display: str, cache: Optional[FragmentCache] = None):
+        self.cache = cache or get_fragment_cache()
+        self.root = root
+        self.fragments: Dict[Path, Fragment] = {root.path: root}
+        self.display: Dict[Path, str] = {root.path: display}
+        self.edges: Dict[Path, List[Path]] = {}
+        self.issues: List[Finding] = []
+        self._origins: Dict[int, List[Origin]] = {}
+        self.config = self._document(root, (root.path,))
+
+    # -- resolution --------------------------------------------------------
+
+    def _document(self, fragment: Fragment, stack: Tuple[Path, ...]):
+        content = fragment.content
+        if fragment.refs:
+            content = self._expand(content, fragment, stack)
+        if fragment.has_packages:
+            content = self._apply_packages(content, fragment)
+        return content
+
+    def _expand(self, node, fragment: Fragment, stack: Tuple[Path, ...]):
+        if isinstance(node, IncludeRef):
+            return self._include(node, fragment, stack)
+        if isinstance(node, dict):
+            values = [self._expand(v, fragment, stack) for v in node.values()]
+            if all(new is old for new, old in zip(values, node.values())):
+                return node
+            return self._build_dict(
+                (k, v, (node, i)) for i, (k, v) in enumerate(zip(node, values))
+            )
+        if isinstance(node, list):
+            values = [self._expand(v, fragment, stack) for v in node]
+            if all(new is old for new, old in zip(values, node)):
+                return node
+            return self._build_list((v, (node, i)) for i, v in enumerate(values))
+        return node
+
+    def _include(self, ref: IncludeRef, includer: Fragment, stack: Tuple[Path, ...]):
+        target = (includer.path.parent / ref.target).resolve()
+        self.edges.setdefault(includer.path, []).append(target)
+        here = self.display[includer.path]
+        shown = self.display.setdefault(
+            target, os.path.normpath(os.path.join(os.path.dirname(here), ref.target))
+        )
+        if target in stack:
+            chain = " -> ".join(self.display[p] for p in stack[stack.index(target):])
+            self._issue("error", f"Include cycle: {chain} -> {shown}", "include-cycle",
+                        here, ref.line, ref.column)
+            return ref
+        try:
+            fragment = self.cache.get(target)
+        except OSError:
+            self._issue("error", f"Included file not found: {shown}", "missing-include",
+                        here, ref.line, ref.column)
+            return ref
+        self.fragments[target] = fragment
+        if fragment.error is not None:
+            marks = YAML_MARK_RE.findall(fragment.error)
+            line, column = (int(marks[-1][0]), int(marks[-1][1])) if marks else (None, None)
+            self._issue("error", f"YAML parse error in {shown}: {fragment.error}", "yaml-syntax",
+                        shown, line, column)
+            return ref
+        return self._document(fragment, stack + (target,))
+
+    def _apply_packages(self, config: dict, fragment: Fragment):
+        """Merge packages: into config the way ESPHome does; local keys win."""
+        packages = config["packages"]
+        if isinstance(packages, dict):
+            entries = list(packages.items())
+        elif isinstance(packages, list):
+            entries = [(f"[{i}]", p) for i, p in enumerate(packages)]
+        else:
+            entries = []
+
+        merged: object = {}
+        for slot, (name, package) in enumerate(entries):
+            if isinstance(package, IncludeRef):
+                continue  # unresolved; the include already reported why
+            if not isinstance(package, dict) or "url" in package:
+                where = self.position(packages, slot)
+                source, line, column = self.display[fragment.path], None, None
+                if where is not None:
+                    source = self.display[where[0]]
+                    line, column = unpack_mark(where[1])
+                self._issue("info", f"Remote package '{name}' not fetched - its contents "
+                            "are not validated", "remote-package", source, line, column)
+                continue
+            if "packages" in package:
+                package = self._apply_packages(package, fragment)
+            merged = self._merge(merged, package)
+
+        local = self._build_dict(
+            (k, v, (config, i)) for i, (k, v) in enumerate(config.items()) if k != "packages"
+        )
+        return self._merge(merged, local)
+
+    def _merge(self, old, new):
+        """ESPHome's merge_config: dicts merge per key, lists concatenate with
+        items sharing an id merged, and anything else is replaced by new."""
+        if isinstance(old, dict) and isinstance(new, dict):
+            items = {k: (v, (old, i)) for i, (k, v) in enumerate(old.items())}
+            for i, (k, v) in enumerate(new.items()):
+                items[k] = (self._merge(old[k], v) if k in old else v, (new, i))
+            return self._build_dict((k, v, origin) for k, (v, origin) in items.items())
+        if isinstance(old, list) and isinstance(new, list):
+            items = [(v, (old, i)) for i, v in enumerate(old)]
+            ids = {
+                v["id"]: i for i, v in enumerate(old)
+                if isinstance(v, dict) and isinstance(v.get("id"), str)
+            }
+            for i, v in enumerate(new):
+                key = v.get("id") if isinstance(v, dict) else None
+                j = ids.get(key) if isinstance(key, str) else None
+                if j is None:
+                    items.append((v, (new, i)))
+                else:
+                    items[j] = (self._merge(items[j][0], v), (new, i))
+            return self._build_list(items)
+        return new
+
+    def _build_dict(self, items) -> dict:
+        data, origins = {}, []
+        for key, value, origin in items:
+            data[key] = value
+            origins.append(origin)
+        self._origins[id(data)] = origins
+        return data
+
+    def _build_list(self, items) -> list:
+        data, origins = [], []
+        for value, origin in items:
+            data.append(value)
+            origins.append(origin)
+        self._origins[id(data)] = origins
+        return data
+
+    def _issue(self, severity: str, message: str, rule: str, source: Optional[str] = None,
+               line: Optional[int] = None, column: Optional[int] = None):
+        if source == self.display[self.root.path]:
+            source = None
+        self.issues.append(Finding(severity, rule, message, None, line, column, source))
+
+    # -- locations ---------------------------------------------------------
+
+    def position(self, container, slot: int) -> Optional[Tuple[Path, int]]:
+        origins = self._origins.get(id(container))
+        if origins is not None:
+            return self.position(*origins[slot])
+        for fragment in self.fragments.values():
+            if fragment.marks is not None:
+                packed = fragment.marks.position(container, slot)
+                if packed is not None:
+                    return fragment.path, packed
+        return None
+
+    def locate(self, path: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+        """(source, line, column) of a logical path in the resolved config.
+
+        source is None for the root file, else the fragment's path as it
+        would be written relative to the working directory.
+        """
+        found = walk_path(self.config, path, self.position)
+        if not found:
+            return None, None, None
+        source, packed = found
+        line, column = unpack_mark(packed)
+        return (None if source == self.root.path else self.display[source]), line, column
+
+    @property
+    def dependencies(self) -> List[Path]:
+        """Every file the config includes, transitively, found or not."""
+        found = {target for targets in self.edges.values() for target in targets}
+        found.discard(self.root.path)
+        return sorted(found)
+
+
+# ---------------------------------------------------------------------------
+# Board index
+# ---------------------------------------------------------------------------
+
+def _mask(pins) -> int:
+    mask = 0
+    for pin in pins or ():
+        if isinstance(pin, int) and not isinstance(pin, bool) and pin >= 0:
+            mask |= 1 << pin
+    return mask
+
+
+class BoardPins:
+    """Pin rules for one board, compiled to integer bitmasks.
+
+    Every check is a single shift-and-mask: has(board.strapping, pin).
+    strict is True for dev boards, whose valid_pins list every GPIO the chip
+    exposes; commercial and specialty profiles only list the broken-out
+    header pins, so an unlisted pin there is a warning, not an error.
+    """
+
+    __slots__ = (
+        "board_id", "label", "variant", "strict",
+        "known", "strapping", "flash", "usb", "input_only",
+    )
+
+    def __init__(self, profile: dict, label: Optional[str] = None, strict: Optional[bool] = None):
+        gpio = profile.get("gpio", {})
+        self.board_id: str = profile["board_id"]
+        self.label: str = label or profile.get("display_name", self.board_id)
+        self.variant: Optional[str] = profile.get("esphome", {}).get("variant")
+        self.strict: bool = profile.get("board_type") == "dev_board" if strict is None else strict
+
+        onboard = [
+            v for k, v in (profile.get("onboard_components") or {}).items()
+            if k.endswith("_gpio")
+        ]
+        buses = [
+            v for bus in ("i2c_default", "spi_default")
+            for v in (gpio.get(bus) or {}).values()
+        ]
+        self.strapping = _mask(gpio.get("strapping_pins"))
+        self.flash = _mask(gpio.get("reserved_for_flash"))
+        self.usb = _mask(gpio.get("reserved_for_usb"))
+        self.input_only = _mask(gpio.get("input_only"))
+        self.known = (
+            _mask(gpio.get("valid_pins")) | self.strapping | self.input_only
+            | _mask(onboard) | _mask(buses)
+        )
+
+
+def has(mask: int, pin: int) -> bool:
+    return pin >= 0 and (mask >> pin) & 1 == 1
+
+
+# Chip family hinted at by a PlatformIO board name ("atoms3", "lolin_c3_mini").
+BOARD_VARIANT_RE = re.compile(r"(?:esp32|[^a-z0-9]|^|atom)[-_]?(s2|s3|c2|c3|c5|c6|h2|p4)(?![0-9])", re.I)
+
+
+class BoardIndex:
+    """Board profiles indexed by board_id, ESPHome board name and variant.
+
+    Boards without a profile fall back to a generic dev board of the same
+    variant: the explicit esp32 variant: key if present, else the variant
+    hinted at by the board name, else the platform default. A guessed
+    variant is never strict, so it only ever produces warnings for pins
+    the generic profile does not know.
+    """
+
+    def __init__(self, profiles: List[dict]):
+        self.by_board: Dict[str, BoardPins] = {}
+        self.by_variant: Dict[str, dict] = {}
+        self._fallbacks: Dict[Tuple[str, str, bool], BoardPins] = {}
+
+        # Dev boards first, so they win shared ESPHome board names and
+        # become the per-variant fallback over modules and products.
+        profiles = sorted(profiles, key=lambda p: (p.get("board_type") != "dev_board", p["board_id"]))
+        for profile in profiles:
+            pins = BoardPins(profile)
+            self.by_board.setdefault(pins.board_id, pins)
+            esphome_board = profile.get("esphome", {}).get("board")
+            if esphome_board:
+                self.by_board.setdefault(esphome_board, pins)
+            if pins.variant and pins.strict:
+                self.by_variant.setdefault(pins.variant.upper(), profile)
+
+    def __len__(self) -> int:
+        return len({id(b) for b in self.by_board.values()})
+
+    def _fallback(self, variant: str, strict: bool) -> Optional[BoardPins]:
+        variant = variant.upper().replace("-", "")
+        key = (variant, "generic", strict)
+        if key not in self._fallbacks:
+            profile = self.by_variant.get(variant)
+            if profile is None:
+                return None
+            self._fallbacks[key] = BoardPins(
+                profile, label=f"{profile['esphome']['variant']} (generic)", strict=strict
+            )
+        return self._fallbacks[key]
+
+    def resolve(self, platform: str, section) -> Optional[BoardPins]:
+        """Board rules for a platform section such as config["esp32"]."""
+        section = section if isinstance(section, dict) else {}
+        board = section.get("board")
+        if isinstance(board, str) and board in self.by_board:
+            return self.by_board[board]
+
+        variant = section.get("variant")
+        if isinstance(variant, str):
+            return self._fallback(variant, strict=True)
+        hint = BOARD_VARIANT_RE.search(board) if isinstance(board, str) else None
+        if hint and platform == "esp32":
+            return self._fallback(f"ESP32{hint.group(1)}", strict=False)
+        default = PLATFORM_DEFAULT_VARIANT.get(platform)
+        if default:
+            return self._fallback(default, strict=False)
+        return None
+
+
+_board_index: Optional[BoardIndex] = None
+
+
+def load_board_index(boards_dir: Path = BOARDS_DIR) -> BoardIndex:
+    profiles = []
+    for path in sorted(Path(boards_dir).rglob("*.json")):
+        if path.name.endswith(".schema.json"):
+            continue
+        try:
+            profile = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(profile, dict) and "board_id" in profile:
+            profiles.append(profile)
+    return BoardIndex(profiles)
+
+
+def get_board_index() -> BoardIndex:
+    """Process-wide board index, built on first use."""
+    global _board_index
+    if _board_index is None:
+        _board_index = load_board_index()
+    return _board_index
+
+
+# ---------------------------------------------------------------------------
+# Config walker
+# ---------------------------------------------------------------------------
+
+# Keys whose value is a GPIO reference: "GPIO5", 5, or {number: GPIO5, ...}.
+PIN_KEYS = frozenset({
+    "pin", "clk_pin", "mosi_pin", "miso_pin", "cs_pin", "sda", "scl", "tx_pin",
+    "rx_pin", "data_pin", "clock_pin", "trigger_pin", "echo_pin", "dout_pin",
+})
+
+INTERVAL_RE = re.compile(r"(\d+)(ms|s|min|h)?")
+YAML_MARK_RE = re.compile(r"line (\d+), column (\d+)")
+
+RuleFn = Callable[["ConfigFacts", object, "WalkCursor"], None]
+
+
+class ConfigFacts:
+    """Everything the walker rules collected from one config."""
+
+    def __init__(self):
+        self.components: List[str] = []
+        self.pins: List[Tuple[int, str]] = []
+        self.update_intervals: List[Tuple[str, str]] = []
+        self.secrets: Dict[str, str] = {}  # secret name -> first use
+
+
+class WalkCursor:
+    """Position of the walker in the config tree.
+
+    Holds the raw key/index segments from the root to the current node.
+    The dotted path string (".sensor[3].pin") is only built when a rule
+    asks for it via path(), so nodes no rule cares about cost nothing.
+    """
+
+    __slots__ = ("segments", "parent_key")
+
+    def __init__(self):
+        self.segments: List[object] = []
+        self.parent_key: Optional[str] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self.segments)
+
+    @property
+    def section(self) -> Optional[str]:
+        return self.segments[0] if self.segments else None
+
+    def path(self) -> str:
+        return "".join(
+            f"[{seg}]" if isinstance(seg, int) else f".{seg}" for seg in self.segments
+        )
+
+
+class ConfigWalker:
+    """Single-pass visitor over a loaded config.
+
+    Rules are registered per mapping key with @walker.rule("key", ...) and
+    called as fn(facts, value, cursor) for every occurrence of that key, at
+    any depth. Scalar rules registered with @walker.scalar_rule see every
+    string value. One walk() feeds all rules.
+    """
+
+    def __init__(self):
+        self._key_rules: Dict[str, List[RuleFn]] = {}
+        self._scalar_rules: List[RuleFn] = []
+
+    def rule(self, *keys: str) -> Callable[[RuleFn], RuleFn]:
+        def register(fn: RuleFn) -> RuleFn:
+            for key in keys:
+                self._key_rules.setdefault(key, []).append(fn)
+            return fn
+        return register
+
+    def scalar_rule(self, fn: RuleFn) -> RuleFn:
+        self._scalar_rules.append(fn)
+        return fn
+
+    def walk(self, config) -> ConfigFacts:
+        facts = ConfigFacts()
+        if isinstance(config, dict):
+            facts.components = [str(k) for k in config]
+        cursor = WalkCursor()
+        segments = cursor.segments
+        key_rules = self._key_rules
+        scalar_rules = self._scalar_rules
+
+        def visit(obj, parent_key):
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    segments.append(key if isinstance(key, str) else str(key))
+                    rules = key_rules.get(key)
+                    if rules:
+                        cursor.parent_key = parent_key
+                        for fn in rules:
+                            fn(facts, value, cursor)
+                    visit(value, key)
+                    segments.pop()
+            elif isinstance(obj, list):
+                for i, item in enumerate(obj):
+                    segments.append(i)
+                    visit(item, parent_key)
+                    segments.pop()
+            elif isinstance(obj, str) and scalar_rules:
+                cursor.parent_key = parent_key
+                for fn in scalar_rules:
+                    fn(facts, obj, cursor)
+
+        visit(config, None)
+        return facts
+
+
+def parse_gpio(value) -> Optional[int]:
+    """Return the GPIO number of "GPIO5" or 5, None for anything else."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.startswith("GPIO"):
+        try:
+            return int(value[4:])
+        except ValueError:
+            return None
+    return None
+
+
+walker = ConfigWalker()
+
+
+@walker.rule(*PIN_KEYS)
+def _collect_pin(facts: ConfigFacts, value, cursor: WalkCursor):
+    if isinstance(value, dict):
+        value = value.get("number")
+    pin = parse_gpio(value)
+    if pin is not None:
+        facts.pins.append((pin, cursor.path()))
+
+
+@walker.rule("number")
+def _collect_pin_number(facts: ConfigFacts, value, cursor: WalkCursor):
+    # {number: ...} under a pin key was already counted by _collect_pin;
+    # this catches pin schemas in lists, e.g. data_pins: [{number: GPIO4}].
+    if cursor.parent_key in PIN_KEYS:
+        return
+    pin = parse_gpio(value)
+    if pin is not None:
+        facts.pins.append((pin, cursor.path()))
+
+
+@walker.rule("update_interval")
+def _collect_update_interval(facts: ConfigFacts, value, cursor: WalkCursor):
+    # Only sensor entities: light effects legitimately run at 16-50 ms.
+    if cursor.section == "sensor" and cursor.depth == 3 and isinstance(value, str):
+        facts.update_intervals.append((value, cursor.path()))
+
+
+@walker.scalar_rule
+def _collect_secret(facts: ConfigFacts, value: str, cursor: WalkCursor):
+    if value.startswith("!secret "):
+        facts.secrets.setdefault(value[8:], cursor.path())
+
+
+def walk_config(config) -> ConfigFacts:
+    """Collect pins, update intervals, secrets and components in one pass."""
+    return walker.walk(config)
 
 
 def extract_gpio_pins(config: dict) -> List[Tuple[int, str]]:
     """Extract all GPIO pin references from config."""
-    pins = []
-
-    def find_pins(obj, path=""):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key in ("pin", "number", "clk_pin", "mosi_pin", "miso_pin", "cs_pin",
-                          "sda", "scl", "tx_pin", "rx_pin", "data_pin", "clock_pin",
-                          "trigger_pin", "echo_pin", "dout_pin"):
-                    if isinstance(value, str) and value.startswith("GPIO"):
-                        try:
-                            pin_num = int(value.replace("GPIO", ""))
-                            pins.append((pin_num, f"{path}.{key}"))
-                        except ValueError:
-                            pass
-                    elif isinstance(value, int):
-                        pins.append((value, f"{path}.{key}"))
-                    elif isinstance(value, dict) and "number" in value:
-                        num = value["number"]
-                        if isinstance(num, str) and num.startswith("GPIO"):
-                            try:
-                                pin_num = int(num.replace("GPIO", ""))
-                                pins.append((pin_num, f"{path}.{key}"))
-                            except ValueError:
-                                pass
-                find_pins(value, f"{path}.{key}")
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                find_pins(item, f"{path}[{i}]")
-
-    find_pins(config)
-    return pins
+    return walk_config(config).pins
 
 
 def validate_config(file_path: Path) -> ValidationResult:
@@ -152,117 +969,172 @@ def validate_config(file_path: Path) -> ValidationResult:
     result = ValidationResult(str(file_path))
 
     # Load YAML
-    config, raw_text = load_yaml_file(file_path)
+    config, raw_text, marks = load_yaml_file(file_path)
     if config is None:
-        result.add_error(f"YAML parse error: {raw_text}")
+        marks = YAML_MARK_RE.findall(raw_text)
+        line, column = (int(marks[-1][0]), int(marks[-1][1])) if marks else (None, None)
+        result.add_error(f"YAML parse error: {raw_text}", "yaml-syntax", line=line, column=column)
         return result
 
+    # Resolve !include and packages: so shared fragments are checked too
+    resolution = Resolution(Fragment(file_path.resolve(), config, marks), str(file_path))
+    config = resolution.config
+    result.includes = [str(p) for p in resolution.dependencies]
+    for issue in resolution.issues:
+        getattr(result, f"add_{issue.severity}")(
+            issue.message, issue.rule, line=issue.line, column=issue.column, source=issue.source
+        )
+
     # Check for esphome section
     if "esphome" not in config:
-        result.add_error("Missing 'esphome' section")
+        result.add_error("Missing 'esphome' section", "missing-esphome")
         return result
 
     # Check for device name
     esphome = config.get("esphome", {})
     if "name" not in esphome:
-        result.add_error("Missing device name in 'esphome' section")
-
-    # Determine chip type
-    chip = None
-    if "esp32" in config:
-        chip = "esp32"
-        board = config["esp32"].get("board", "unknown")
-        if board in BOARDS:
-            chip = BOARDS[board]["chip"]
-    elif "esp8266" in config:
-        chip = "esp8266"
-
-    if chip is None:
-        result.add_warning("Could not determine chip type (esp32/esp8266 section missing)")
+        result.add_error("Missing device name in 'esphome' section", "missing-name", ".esphome")
+
+    # Determine board
+    platform = next((p for p in PLATFORM_DEFAULT_VARIANT if p in config), None)
+    board = None
+    if platform is None:
+        result.add_warning(
+            "Could not determine chip type (esp32/esp8266/rp2040 section missing)", "unknown-chip"
+        )
+    else:
+        board = get_board_index().resolve(platform, config[platform])
+        if board is None:
+            result.add_info(
+                f"No board profile for this {platform} board - pin checks limited",
+                "no-board-profile", f".{platform}",
+            )
 
     # Check WiFi
     if "wifi" not in config:
-        result.add_warning("No 'wifi' section - device won't connect to network")
+        result.add_warning("No 'wifi' section - device won't connect to network", "no-wifi")
     else:
         wifi = config["wifi"]
         if "ssid" not in wifi and "networks" not in wifi:
-            result.add_warning("No WiFi SSID configured")
+            result.add_warning("No WiFi SSID configured", "no-wifi-ssid", ".wifi")
         # Check for !secret usage
         if "ssid" in wifi and not str(wifi["ssid"]).startswith("!secret"):
-            result.add_warning("WiFi SSID is hardcoded - consider using !secret")
+            result.add_warning(
+                "WiFi SSID is hardcoded - consider using !secret", "hardcoded-wifi-ssid", ".wifi.ssid"
+            )
         if "password" in wifi and not str(wifi["password"]).startswith("!secret"):
-            result.add_warning("WiFi password is hardcoded - consider using !secret")
+            result.add_warning(
+                "WiFi password is hardcoded - consider using !secret",
+                "hardcoded-wifi-password", ".wifi.password",
+            )
 
     # Check API
     if "api" not in config:
-        result.add_info("No 'api' section - won't integrate with Home Assistant")
+        result.add_info("No 'api' section - won't integrate with Home Assistant", "no-api")
     else:
         api = config["api"]
         if "encryption" not in api and "password" not in api:
-            result.add_warning("API has no encryption or password - insecure!")
+            result.add_warning("API has no encryption or password - insecure!", "insecure-api", ".api")
 
     # Check OTA
     if "ota" not in config:
-        result.add_info("No 'ota' section - can't update over-the-air")
+        result.add_info("No 'ota' section - can't update over-the-air", "no-ota")
+
+    facts = walk_config(config)
 
     # Check GPIO pins
-    pins = extract_gpio_pins(config)
     used_pins = set()
 
-    for pin_num, location in pins:
+    for pin_num, location in facts.pins:
         # Check for duplicate pins
         if pin_num in used_pins:
-            result.add_error(f"GPIO{pin_num} used multiple times (at {location})")
+            result.add_error(
+                f"GPIO{pin_num} used multiple times (at {location})", "duplicate-pin", location
+            )
         used_pins.add(pin_num)
 
-        # Check strapping pins
-        if chip == "esp32" and pin_num in STRAPPING_PINS_ESP32:
+        if board is None:
+            continue
+
+        # Check invalid pins
+        if has(board.flash, pin_num) or (board.strict and not has(board.known, pin_num)):
+            result.add_error(
+                f"GPIO{pin_num} is invalid/reserved on {board.label} (at {location})",
+                "invalid-pin", location,
+            )
+            continue
+        if not has(board.known, pin_num):
             result.add_warning(
-                f"GPIO{pin_num} is a strapping pin: {STRAPPING_PINS_ESP32[pin_num]} (at {location})"
+                f"GPIO{pin_num} is not a documented GPIO on {board.label} (at {location})",
+                "undocumented-pin", location,
             )
-        elif chip == "esp8266" and pin_num in STRAPPING_PINS_ESP8266:
+
+        # Check strapping pins
+        if has(board.strapping, pin_num):
+            note = STRAPPING_NOTES.get(board.variant, {}).get(pin_num)
+            detail = f": {note}" if note else f" on {board.label}"
             result.add_warning(
-                f"GPIO{pin_num} is a strapping pin: {STRAPPING_PINS_ESP8266[pin_num]} (at {location})"
+                f"GPIO{pin_num} is a strapping pin{detail} (at {location})", "strapping-pin", location
             )
 
-        # Check invalid pins
-        if chip == "esp32" and pin_num in INVALID_PINS_ESP32:
-            result.add_error(f"GPIO{pin_num} is invalid/reserved on ESP32 (at {location})")
+        # Check USB pins
+        if has(board.usb, pin_num):
+            result.add_warning(
+                f"GPIO{pin_num} is the USB data line on {board.label}; using it disables "
+                f"USB flashing and logging (at {location})",
+                "usb-pin", location,
+            )
 
         # Check input-only pins used as output
-        if chip == "esp32" and pin_num in INPUT_ONLY_ESP32:
-            # Check if used as output
+        if has(board.input_only, pin_num):
             if any(x in location.lower() for x in ["output", "switch", "relay", "led"]):
                 result.add_error(
-                    f"GPIO{pin_num} is input-only on ESP32, cannot be used as output (at {location})"
+                    f"GPIO{pin_num} is input-only on {board.label}, cannot be used as output "
+                    f"(at {location})",
+                    "input-only-pin", location,
                 )
 
     # Check update intervals
-    sensors = config.get("sensor", [])
-    if isinstance(sensors, list):
-        for sensor in sensors:
-            if isinstance(sensor, dict):
-                interval = sensor.get("update_interval", "60s")
-                if isinstance(interval, str):
-                    # Parse interval
-                    match = re.match(r"(\d+)(ms|s|min|h)?", interval)
-                    if match:
-                        value, unit = match.groups()
-                        value = int(value)
-                        if unit == "ms" and value < 100:
-                            result.add_warning(
-                                f"Very fast update interval ({interval}) may cause instability"
-                            )
+    for interval, location in facts.update_intervals:
+        match = INTERVAL_RE.match(interval)
+        if match:
+            value, unit = match.groups()
+            if unit == "ms" and int(value) < 100:
+                result.add_warning(
+                    f"Very fast update interval ({interval}) may cause instability",
+                    "fast-update-interval", location,
+                )
 
     # Check for attribution header
     if "aurora-smart-home" not in raw_text and "Generated by" not in raw_text:
-        result.add_info("No attribution header found")
+        result.add_info("No attribution header found", "no-attribution")
+
+    for finding in result.findings:
+        if finding.path and finding.line is None:
+            finding.source, finding.line, finding.column = resolution.locate(finding.path)
 
     return result
 
 
-def run_esphome_validate(file_path: Path) -> Tuple[bool, str]:
-    """Run esphome config validation."""
+ESPHOME_CLI_MISSING = "esphome CLI not found. Install with: pip install esphome"
+ESPHOME_CLI_TIMEOUT = "Validation timed out"
+ESPHOME_WORKER_EXITED = "esphome worker exited unexpectedly"
+ESPHOME_TIMEOUT = 60  # seconds per file
+ESPHOME_WORKER_STARTUP_TIMEOUT = 120  # importing esphome is slow on cold caches
+
+
+def run_esphome_validate(file_path: Path, persistent: bool = False) -> Tuple[bool, str]:
+    """Run esphome config validation.
+
+    With persistent=True the file is sent to this process's long-lived
+    EsphomeWorker instead of a fresh `esphome config` subprocess, falling
+    back to the CLI if the worker cannot import esphome.
+    """
+    if persistent:
+        worker = get_esphome_worker()
+        if worker is not None:
+            return worker.validate(file_path, ESPHOME_TIMEOUT)
+
     import subprocess
 
     try:
@@ -270,13 +1142,631 @@ def run_esphome_validate(file_path: Path) -> Tuple[bool, str]:
             ["esphome", "config", str(file_path)],
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=ESPHOME_TIMEOUT,
         )
         return result.returncode == 0, result.stderr or result.stdout
     except FileNotFoundError:
-        return False, "esphome CLI not found. Install with: pip install esphome"
+        return False, ESPHOME_CLI_MISSING
     except subprocess.TimeoutExpired:
-        return False, "Validation timed out"
+        return False, ESPHOME_CLI_TIMEOUT
+
+
+# ---------------------------------------------------------------------------
+# Persistent esphome worker
+# ---------------------------------------------------------------------------
+
+class EsphomeWorker:
+    """A long-lived Python process that imports esphome once.
+
+    Requests and replies are JSON lines over the worker's stdin/stdout. A
+    reader thread feeds replies into a queue so every file gets its own
+    timeout on every platform; a file that times out kills the worker and
+    the next file transparently gets a fresh one.
+    """
+
+    def __init__(self, startup_timeout: float = ESPHOME_WORKER_STARTUP_TIMEOUT):
+        import subprocess
+
+        self.proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--esphome-worker-serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._replies: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True).start()
+
+        ready = self._receive(startup_timeout)
+        if not ready or not ready.get("ready"):
+            self.close()
+            raise RuntimeError(ready.get("error") if ready else "esphome worker did not start")
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            self._replies.put(line)
+        self._replies.put(None)
+
+    def _receive(self, timeout: float) -> Optional[dict]:
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return json.loads(line) if line else None
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def validate(self, file_path: Path, timeout: float = ESPHOME_TIMEOUT) -> Tuple[bool, str]:
+        try:
+            self.proc.stdin.write(json.dumps({"path": str(Path(file_path).resolve())}) + "\n")
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            return False, ESPHOME_WORKER_EXITED
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            # Hung mid-file: don't wait for it, start over next time.
+            self.proc.kill()
+            self.proc.wait()
+            return False, ESPHOME_CLI_TIMEOUT
+        if line is None:  # stdout closed: it crashed mid-file
+            self.proc.wait()
+            return False, ESPHOME_WORKER_EXITED
+        reply = json.loads(line)
+        return bool(reply["ok"]), reply["output"]
+
+    def close(self):
+        import subprocess
+
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+
+
+_esphome_worker: Optional[EsphomeWorker] = None
+_esphome_worker_error: Optional[str] = None
+
+
+def get_esphome_worker() -> Optional[EsphomeWorker]:
+    """This process's worker, (re)started on demand; None if esphome won't import."""
+    global _esphome_worker, _esphome_worker_error
+    if _esphome_worker_error is not None:
+        return None
+    if _esphome_worker is None or not _esphome_worker.alive():
+        try:
+            _esphome_worker = EsphomeWorker()
+        except (OSError, RuntimeError) as exc:
+            _esphome_worker_error = str(exc)
+            print(f"esphome worker unavailable ({exc}); using the esphome CLI", file=sys.stderr)
+            return None
+        atexit.register(_esphome_worker.close)
+    return _esphome_worker
+
+
+def serve_esphome_worker():
+    """Worker side of EsphomeWorker: validate one config per stdin line."""
+    # Keep the protocol on a private copy of stdout; anything esphome or its
+    # dependencies print straight to fd 1 ends up on stderr instead.
+    proto = os.fdopen(os.dup(1), "w", buffering=1, encoding="utf-8")
+    os.dup2(2, 1)
+
+    def reply(**message):
+        proto.write(json.dumps(message) + "\n")
+
+    try:
+        from esphome.__main__ import run_esphome
+        from esphome.core import CORE
+    except Exception as exc:  # any import failure means "no worker"
+        reply(ready=False, error=f"cannot import esphome: {exc}")
+        return
+    reply(ready=True)
+
+    for line in sys.stdin:
+        path = json.loads(line)["path"]
+        buf = io.StringIO()
+        # esphome installs its log handler per run; drop the previous run's
+        # so the new one binds to this run's captured stderr.
+        logging.getLogger().handlers.clear()
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            try:
+                code = run_esphome(["esphome", "config", path])
+            except SystemExit as exc:
+                code = exc.code
+            except Exception as exc:
+                buf.write(f"{type(exc).__name__}: {exc}\n")
+                code = 1
+            finally:
+                CORE.reset()
+        reply(ok=code in (0, None), output=buf.getvalue())
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+_validator_version: Optional[str] = None
+
+
+def validator_version() -> str:
+    """Hash of this script and the board profiles it reads.
+
+    Any change to the validator or to a board's pin data invalidates the cache.
+    """
+    global _validator_version
+    if _validator_version is None:
+        h = hashlib.sha256(Path(__file__).read_bytes())
+        for path in sorted(BOARDS_DIR.rglob("*.json")):
+            h.update(path.read_bytes())
+        _validator_version = h.hexdigest()[:16]
+    return _validator_version
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aurora-validate-esphome"
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+class ResultCache:
+    """On-disk ValidationResult cache keyed by content hash.
+
+    The key covers the file's bytes, the validator version, the --full flag
+    and, in full mode, the sibling secrets.yaml the esphome CLI resolves.
+    Each entry also records a hash of every file the loader pulled in
+    (ValidationResult.includes: !include targets, packages, nested
+    includes), and is replayed only while all of them are unchanged, so
+    nothing that could change the result can go stale. Each entry is one
+    small JSON file written atomically, which keeps parallel workers safe.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file_path: Path, full: bool) -> str:
+        h = hashlib.sha256()
+        h.update(f"{validator_version()}\0{int(full)}\0".encode())
+        h.update(file_path.read_bytes())
+        if full:
+            secrets = (file_path.parent / "secrets.yaml").resolve()
+            h.update(f"\0{secrets}\0{_file_digest(secrets)}".encode())
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, file_path: Path) -> Optional[ValidationResult]:
+        try:
+            data = json.loads(self._entry(key).read_text(encoding="utf-8"))
+            result = ValidationResult.from_dict(str(file_path), data)
+            fresh = all(_file_digest(Path(dep)) == digest
+                        for dep, digest in data["digests"].items())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            fresh = False
+        if not fresh:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: ValidationResult):
+        if not result.cacheable:
+            return
+        entry = self._entry(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+            digests = {dep: _file_digest(Path(dep)) for dep in result.includes}
+            tmp.write_text(json.dumps({**result.to_dict(), "digests": digests}), encoding="utf-8")
+            os.replace(tmp, entry)
+        except OSError:
+            pass  # a read-only or full cache dir must never fail validation
+
+
+def validate_file(file_path: Path, full: bool = False, persistent: bool = False) -> ValidationResult:
+    """Run the static checks and, with full=True, the esphome CLI on one file."""
+    result = validate_config(file_path)
+
+    if full:
+        ok, output = run_esphome_validate(file_path, persistent)
+        if not ok:
+            result.add_error(f"ESPHome validation failed:\n{output}", "esphome-config")
+            # A missing CLI, a timeout or a crashed worker says nothing
+            # about the file itself.
+            if output in (ESPHOME_CLI_MISSING, ESPHOME_CLI_TIMEOUT, ESPHOME_WORKER_EXITED):
+                result.cacheable = False
+
+    return result
+
+
+def _validate_file_job(job: Tuple[Path, bool, bool]) -> ValidationResult:
+    """Process-pool entry point (must be a top-level function to pickle)."""
+    return validate_file(*job)
+
+
+def _run_jobs(
+    files: List[Path], full: bool, jobs: int, persistent: bool = False
+) -> Iterator[ValidationResult]:
+    if jobs <= 1 or len(files) <= 1:
+        for file_path in files:
+            yield validate_file(file_path, full, persistent)
+        return
+
+    # Each pool process lazily starts its own esphome worker, so --jobs N
+    # with --esphome-worker gives a pool of N long-lived workers.
+    workers = min(jobs, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_validate_file_job, [(f, full, persistent) for f in files])
+
+
+def iter_results(
+    files: List[Path],
+    full: bool = False,
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    persistent: bool = False,
+) -> Iterator[ValidationResult]:
+    """Yield one ValidationResult per file, in input order.
+
+    With jobs > 1 the files are fanned out over a process pool. Results are
+    still yielded in the order the files were given, each as soon as it and
+    every file before it has finished, so output is stable between runs.
+    With a cache, unchanged files are replayed and never reach the pool.
+    """
+    if cache is None:
+        yield from _run_jobs(files, full, jobs, persistent)
+        return
+
+    keys = [cache.key(f, full) for f in files]
+    cached = [cache.get(k, f) for k, f in zip(keys, files)]
+    misses = [f for f, hit in zip(files, cached) if hit is None]
+    fresh = _run_jobs(misses, full, jobs, persistent)
+
+    for key, hit in zip(keys, cached):
+        if hit is None:
+            hit = next(fresh)
+            cache.put(key, hit)
+        yield hit
+
+
+# ---------------------------------------------------------------------------
+# Reporters
+# ---------------------------------------------------------------------------
+
+class TextReporter:
+    """The classic human-readable output."""
+
+    machine_readable = False
+
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
+
+    def start(self):
+        pass
+
+    def report(self, result: ValidationResult, force: bool = False):
+        if force or not self.quiet or not result.is_valid():
+            result.print_results()
+
+    def finish(self):
+        pass
+
+
+class JsonlReporter:
+    """One JSON object per finding, written as soon as its file is done."""
+
+    machine_readable = True
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def start(self):
+        pass
+
+    def report(self, result: ValidationResult, force: bool = False):
+        for finding in result.findings:
+            record = {"file": result.file_path, **finding.to_dict()}
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def finish(self):
+        pass
+
+
+class SarifReporter:
+    """SARIF 2.1.0 for code-scanning pipelines, streamed result by result.
+
+    The document is written incrementally: the tool and rule metadata go
+    out in start(), each finding as its file completes, and the closing
+    brackets in finish(), so nothing is buffered beyond one file.
+    """
+
+    machine_readable = True
+    LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._first = True
+
+    def start(self):
+        driver = {
+            "name": "validate_esphome",
+            "informationUri": "https://github.com/tonylofgren/aurora-smart-home",
+            "rules": [
+                {"id": rule, "shortDescription": {"text": text}} for rule, text in RULES.items()
+            ],
+        }
+        header = json.dumps({
+            "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+            "version": "2.1.0",
+            "runs": [{"tool": {"driver": driver}, "results": []}],
+        })
+        # Everything up to (not including) the closing "]}]}" of results.
+        self.stream.write(header[: -len("]}]}")])
+        self.stream.flush()
+
+    def _result(self, file_path: str, finding: Finding) -> dict:
+        physical = {"artifactLocation": {"uri": Path(finding.source or file_path).as_posix()}}
+        if finding.line is not None:
+            physical["region"] = {"startLine": finding.line}
+            if finding.column is not None:
+                physical["region"]["startColumn"] = finding.column
+        location = {"physicalLocation": physical}
+        if finding.path:
+            location["logicalLocations"] = [{"fullyQualifiedName": finding.path}]
+        return {
+            "ruleId": finding.rule,
+            "level": self.LEVELS[finding.severity],
+            "message": {"text": finding.message},
+            "locations": [location],
+        }
+
+    def report(self, result: ValidationResult, force: bool = False):
+        for finding in result.findings:
+            self.stream.write(("" if self._first else ",") + "\n")
+            self.stream.write(json.dumps(self._result(result.file_path, finding), ensure_ascii=False))
+            self._first = False
+        self.stream.flush()
+
+    def finish(self):
+        self.stream.write("\n]}]}\n")
+        self.stream.flush()
+
+
+REPORTERS = {"text": TextReporter, "jsonl": JsonlReporter, "sarif": SarifReporter}
+
+
+def make_reporter(fmt: str, quiet: bool = False):
+    return TextReporter(quiet) if fmt == "text" else REPORTERS[fmt]()
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+def is_config_file(path: Path) -> bool:
+    return path.suffix in (".yaml", ".yml") and "secret" not in path.name.lower()
+
+
+class WatchSession:
+    """Keeps every watched file's result and !include edges in memory.
+
+    update() takes the paths a watcher reported and revalidates only those
+    files plus every file that (transitively) includes one of them; all
+    other results are kept as they are.
+    """
+
+    def __init__(
+        self,
+        files: List[Path],
+        full: bool = False,
+        dirs: Tuple[Path, ...] = (),
+        persistent: bool = False,
+    ):
+        self.full = full
+        self.persistent = persistent
+        self.dirs = {d.resolve() for d in dirs}
+        self.paths: Dict[Path, Path] = {}  # resolved -> path as given, for display
+        self.results: Dict[Path, ValidationResult] = {}
+        self.includes: Dict[Path, List[Path]] = {}
+        for file_path in files:
+            self.paths[file_path.resolve()] = file_path
+
+    def _validate(self, key: Path) -> ValidationResult:
+        result = validate_file(self.paths[key], self.full, self.persistent)
+        self.results[key] = result
+        self.includes[key] = [Path(p) for p in result.includes]
+        return result
+
+    def validate_all(self) -> List[ValidationResult]:
+        return [self._validate(key) for key in self.paths]
+
+    def dependents(self, changed: Path) -> List[Path]:
+        """Watched files that include changed, directly or through other files."""
+        found: List[Path] = []
+        pending = [changed]
+        while pending:
+            target = pending.pop()
+            for key, deps in self.includes.items():
+                if target in deps and key not in found and key != changed:
+                    found.append(key)
+                    pending.append(key)
+        return found
+
+    def watch_dirs(self) -> List[Path]:
+        dirs = set(self.dirs)
+        for key, deps in self.includes.items():
+            dirs.add(key.parent)
+            dirs.update(dep.parent for dep in deps)
+        return sorted(d for d in dirs if d.is_dir())
+
+    def update(self, changed) -> List[ValidationResult]:
+        targets: List[Path] = []
+        for path in changed:
+            key = Path(path).resolve()
+            if key in self.paths and not key.exists():
+                del self.paths[key]
+                self.results.pop(key, None)
+                self.includes.pop(key, None)
+            elif key not in self.paths and key.parent in self.dirs and is_config_file(key):
+                if key.is_file():
+                    self.paths[key] = key
+            if key in self.paths and key not in targets:
+                targets.append(key)
+            targets.extend(k for k in self.dependents(key) if k not in targets)
+        return [self._validate(key) for key in sorted(targets)]
+
+
+class PollingWatcher:
+    """Portable watcher: stats every YAML file in the watched dirs."""
+
+    def __init__(self, dirs: List[Path], interval: float = 0.1):
+        self.dirs = dirs
+        self.interval = interval
+        self._state = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        state = {}
+        for directory in self.dirs:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.endswith((".yaml", ".yml")):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    state[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self) -> List[Path]:
+        time.sleep(self.interval)
+        state = self._snapshot()
+        changed = [p for p in state.keys() | self._state.keys()
+                   if state.get(p) != self._state.get(p)]
+        self._state = state
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher via ctypes (no third-party dependency)."""
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, dirs: List[Path], settle: float = 0.03):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = (self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO
+                | self.IN_CREATE | self.IN_DELETE | self.IN_MODIFY)
+        self.watches: Dict[int, Path] = {}
+        for directory in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), mask)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self.watches[wd] = directory
+        self.settle = settle
+
+    def _read(self, changed: List[Path]):
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if wd in self.watches and name.endswith((".yaml", ".yml")):
+                path = self.watches[wd] / name
+                if path not in changed:
+                    changed.append(path)
+
+    def wait(self) -> List[Path]:
+        changed: List[Path] = []
+        select.select([self.fd], [], [])
+        self._read(changed)
+        # Editors save in several steps (write temp, rename); coalesce them.
+        while select.select([self.fd], [], [], self.settle)[0]:
+            self._read(changed)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(dirs: List[Path], poll_interval: float = 0.1):
+    """inotify on Linux, polling everywhere else or if inotify is unavailable."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(dirs, poll_interval)
+
+
+def watch(session: WatchSession, reporter=None):
+    """Revalidate changed files until interrupted."""
+    reporter = reporter or TextReporter()
+    # Status lines go to stderr when stdout carries machine-readable records.
+    status = sys.stderr if reporter.machine_readable else sys.stdout
+    reporter.start()
+    for result in session.validate_all():
+        reporter.report(result)
+    failing = sum(not r.is_valid() for r in session.results.values())
+    print(f"\nWatching {len(session.paths)} file(s), {failing} failing. Ctrl-C to stop.",
+          file=status)
+
+    watcher = make_watcher(session.watch_dirs())
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            started = time.perf_counter()
+            results = session.update(changed)
+            if not results:
+                continue
+            for result in results:
+                reporter.report(result, force=True)
+            elapsed = (time.perf_counter() - started) * 1000
+            failing = sum(not r.is_valid() for r in session.results.values())
+            print(f"\nRevalidated {len(results)} file(s) in {elapsed:.0f} ms, "
+                  f"{failing} of {len(session.paths)} failing", file=status)
+    except KeyboardInterrupt:
+        print(file=status)
+    finally:
+        watcher.close()
+        reporter.finish()
 
 
 def main():
@@ -288,6 +1778,10 @@ Examples:
     python validate_esphome.py config.yaml
     python validate_esphome.py --full config.yaml
     python validate_esphome.py --dir ./esphome/
+    python validate_esphome.py --jobs 0 --full --dir ./esphome/
+    python validate_esphome.py --watch --dir ./esphome/
+    python validate_esphome.py --full --esphome-worker --jobs 4 --dir ./esphome/
+    python validate_esphome.py --format sarif --dir ./esphome/ > results.sarif
         """,
     )
 
@@ -297,9 +1791,38 @@ Examples:
         "--full", "-f", action="store_true", help="Run full validation with esphome CLI"
     )
     parser.add_argument("--quiet", "-q", action="store_true", help="Only show errors")
+    parser.add_argument(
+        "--format", choices=sorted(REPORTERS), default="text",
+        help="Output format: text (default), jsonl (one finding per line) or sarif",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Validate files in N worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help=f"Result cache location (default: {default_cache_dir()})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Revalidate every file, ignoring the cache"
+    )
+    parser.add_argument(
+        "--esphome-worker", action="store_true",
+        help="With --full, validate through long-lived esphome workers (one per job) "
+             "instead of one esphome CLI process per file",
+    )
+    parser.add_argument("--esphome-worker-serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--watch", "-w", action="store_true",
+        help="Keep running and revalidate files (and their includers) as they change",
+    )
 
     args = parser.parse_args()
 
+    if args.esphome_worker_serve:
+        serve_esphome_worker()
+        return
+
     files_to_validate = []
 
     if args.dir:
@@ -324,28 +1847,41 @@ Examples:
     # Filter out secrets.yaml
     files_to_validate = [f for f in files_to_validate if "secret" not in f.name.lower()]
 
-    all_valid = True
+    reporter = make_reporter(args.format, args.quiet)
 
-    for file_path in files_to_validate:
-        result = validate_config(file_path)
+    if args.watch:
+        if args.format == "sarif":
+            parser.error("--watch cannot be combined with --format sarif (use jsonl)")
+        dirs = (Path(args.dir),) if args.dir else ()
+        session = WatchSession(files_to_validate, args.full, dirs, args.esphome_worker)
+        watch(session, reporter)
+        return
 
-        if args.full:
-            ok, output = run_esphome_validate(file_path)
-            if not ok:
-                result.add_error(f"ESPHome validation failed:\n{output}")
+    # Summary lines go to stderr when stdout carries machine-readable records.
+    status = sys.stderr if reporter.machine_readable else sys.stdout
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    all_valid = True
+    cache = None if args.no_cache else ResultCache(args.cache_dir or default_cache_dir())
+    started = time.perf_counter()
 
-        if not args.quiet or not result.is_valid():
-            result.print_results()
+    reporter.start()
+    for result in iter_results(files_to_validate, args.full, jobs, cache, args.esphome_worker):
+        reporter.report(result)
 
         if not result.is_valid():
             all_valid = False
-
-    print(f"\n{'=' * 60}")
-    print(f"Validated {len(files_to_validate)} file(s)")
+    reporter.finish()
+
+    print(f"\n{'=' * 60}", file=status)
+    elapsed = time.perf_counter() - started
+    print(f"Validated {len(files_to_validate)} file(s) in {elapsed:.2f}s ({jobs} job(s))",
+          file=status)
+    if cache is not None and cache.hits:
+        print(f"Reused {cache.hits} cached result(s) from {cache.cache_dir}", file=status)
     if all_valid:
-        print("✅ All files passed validation")
+        print("✅ All files passed validation", file=status)
     else:
-        print("❌ Some files have errors")
+        print("❌ Some files have errors", file=status)
         sys.exit(1)
 
 